@@ -0,0 +1,25 @@
+import numpy as np
+
+from prettierplot.batch import render_many
+
+
+class RenderManySuite:
+    params = [1, 2, 4]
+    param_names = ["n_jobs"]
+    timeout = 300
+
+    def setup(self, n_jobs):
+        counts = np.random.RandomState(0).randint(1, 100, size=12)
+        labels = np.array(["category_{}".format(i) for i in range(12)])
+        self.specs = [
+            {
+                "method": "bar_v",
+                "kwargs": {"x": labels, "counts": counts},
+                "chart_scale": 10,
+                "canvas": {"title": "chart {}".format(i)},
+            }
+            for i in range(32)
+        ]
+
+    def time_render_many_png(self, n_jobs):
+        render_many(self.specs, n_jobs=n_jobs, chunksize=4)
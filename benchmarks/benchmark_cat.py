@@ -0,0 +1,131 @@
+import numpy as np
+import pandas as pd
+
+import prettierplot.layout as layout
+import prettierplot.style as style
+
+from prettierplot.stats import DataStats
+
+from .synthetic import category_counts, frame, render, rows_params
+
+
+class BarSuite:
+    params = [10, 100, 1000]
+    param_names = ["n_categories"]
+    number = 1
+    timeout = 300
+
+    def setup(self, n_categories):
+        self.labels, self.counts = category_counts(n_categories)
+        self.colors = style.color_gen("viridis", num=n_categories)
+
+    def time_bar_v(self, n_categories):
+        render("bar_v", x=self.labels, counts=self.counts)
+
+    def peakmem_bar_v(self, n_categories):
+        render("bar_v", x=self.labels, counts=self.counts)
+
+    def time_bar_h(self, n_categories):
+        render("bar_h", y=self.labels, counts=self.counts)
+
+    def peakmem_bar_h(self, n_categories):
+        render("bar_h", y=self.labels, counts=self.counts)
+
+    def time_tree_map(self, n_categories):
+        render("tree_map", counts=self.counts, labels=self.labels, colors=self.colors)
+
+    def peakmem_tree_map(self, n_categories):
+        render("tree_map", counts=self.counts, labels=self.labels, colors=self.colors)
+
+
+class TreeMapSuite:
+    params = [[1000, 10000, 50000], [0.001, 0.0]]
+    param_names = ["n_categories", "min_share"]
+    number = 1
+    timeout = 300
+
+    def setup(self, n_categories, min_share):
+        self.labels, self.counts = category_counts(n_categories, rows=10 ** 7)
+        self.colors = style.color_gen("viridis", num=n_categories)
+
+    def time_tree_map(self, n_categories, min_share):
+        render("tree_map", counts=self.counts, labels=self.labels, colors=self.colors, min_share=min_share)
+
+    def time_layout_treemap(self, n_categories, min_share):
+        # uncached layout of every category
+        layout.layout_squarify(self.counts * 10000 / self.counts.sum())
+
+
+class RawBarSuite:
+    params = rows_params
+    param_names = ["rows"]
+    number = 1
+    timeout = 600
+
+    def setup(self, rows):
+        # a long-tailed raw column with up to 1e5 distinct values, as object and categorical
+        codes = np.random.RandomState(0).zipf(1.3, rows) % min(rows // 10, 100000)
+        self.values = pd.Series(codes).astype(str)
+        self.categorical = self.values.astype("category")
+
+    def time_bar_v_raw_top_k(self, rows):
+        render("bar_v", x=self.values, top_k=20)
+
+    def peakmem_bar_v_raw_top_k(self, rows):
+        render("bar_v", x=self.values, top_k=20)
+
+    def time_bar_h_raw_top_k_categorical(self, rows):
+        render("bar_h", y=self.categorical, top_k=20)
+
+
+class StackedBarSuite:
+    params = [[2, 10, 100, 300], [10, 100, 1000]]
+    param_names = ["n_classes", "n_categories"]
+    number = 1
+    timeout = 600
+
+    def setup(self, n_classes, n_categories):
+        # share of each class within every category
+        share = np.random.RandomState(0).dirichlet(np.ones(n_classes), size=n_categories).T
+        self.df = pd.DataFrame(share, columns=["category_{}".format(i) for i in range(n_categories)])
+
+    def time_stacked_bar_h(self, n_classes, n_categories):
+        render("stacked_bar_h", df=self.df)
+
+    def peakmem_stacked_bar_h(self, n_classes, n_categories):
+        render("stacked_bar_h", df=self.df)
+
+
+class BoxPlotSuite:
+    params = rows_params
+    param_names = ["rows"]
+    number = 1
+    timeout = 600
+
+    def setup(self, rows):
+        self.df = frame("attrition", rows, ("Department", "Age"))
+        # five-number summaries as a warehouse query would return them
+        self.summary = DataStats(self.df).box_summary("Age", by="Department").reset_index()
+
+    def time_box_plot_v(self, rows):
+        render("box_plot_v", x="Department", y="Age", data=self.df, color=None)
+
+    def peakmem_box_plot_v(self, rows):
+        render("box_plot_v", x="Department", y="Age", data=self.df, color=None)
+
+    def time_box_plot_h(self, rows):
+        render("box_plot_h", x="Age", y="Department", data=self.df)
+
+    def peakmem_box_plot_h(self, rows):
+        render("box_plot_h", x="Age", y="Department", data=self.df)
+
+    def time_box_plot_v_raw(self, rows):
+        # seaborn draws every row, so 1e7 rows are skipped
+        if rows <= 1000000:
+            render("box_plot_v", x="Department", y="Age", data=self.df, color=None, mode="raw")
+
+    def time_box_plot_v_summary(self, rows):
+        render("box_plot_v", x="Department", y="Age", data=self.df, color=None, mode="summary")
+
+    def time_box_plot_v_precomputed(self, rows):
+        render("box_plot_v", x="Department", y="Age", data=None, color=None, summary=self.summary)
@@ -0,0 +1,52 @@
+import numpy as np
+import pandas as pd
+
+from prettierplot import util
+
+
+def legacy_number_coerce(df, columns=None):
+    # previous implementation - pd.to_numeric once per element, mutating df in place
+    if columns is None:
+        columns = df.columns
+
+    for col in columns:
+        if not df[col].isnull().all():
+            try:
+                df[col] = df[col].apply(pd.to_numeric)
+            except ValueError:
+                pass
+    return df
+
+
+class NumberCoerceSuite:
+    params = [[10000, 100000, 1000000], [100]]
+    param_names = ["rows", "cols"]
+    number = 1
+    timeout = 1800
+
+    def setup(self, rows, cols):
+        # numeric strings, as read from csv with dtype=str. every column is a different ordering of
+        # the same string objects, which keeps a 1e6 x 100 frame at roughly 1GB. one column in ten
+        # holds words and should be skipped after its sample fails to parse
+        rs = np.random.RandomState(0)
+        numbers = rs.normal(50, 20, rows).round(3).astype(str).astype(object)
+        words = np.array(["category_{}".format(i) for i in range(100)], dtype=object)[rs.randint(0, 100, rows)]
+
+        data = {}
+        for i in range(cols):
+            data["column_{}".format(i)] = words[rs.permutation(rows)] if i % 10 == 9 else numbers[rs.permutation(rows)]
+        self.df = pd.DataFrame(data)
+
+    def time_legacy_number_coerce(self, rows, cols):
+        # per-element parsing takes several minutes at 1e6 rows
+        if rows <= 100000:
+            legacy_number_coerce(self.df.copy(deep=False))
+
+    def time_number_coerce(self, rows, cols):
+        util.number_coerce(self.df)
+
+    def peakmem_number_coerce(self, rows, cols):
+        util.number_coerce(self.df)
+
+    def time_number_coerce_threads(self, rows, cols):
+        util.number_coerce(self.df, n_jobs=-1)
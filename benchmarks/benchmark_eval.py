@@ -0,0 +1,73 @@
+from sklearn.linear_model import LogisticRegression
+
+from .synthetic import cols_params, frame, max_cells, render, rows_params, skip_if, wide
+
+
+class CorrHeatmapSuite:
+    params = [rows_params, cols_params]
+    param_names = ["rows", "cols"]
+    number = 1
+    timeout = 1800
+
+    def setup(self, rows, cols):
+        skip_if(rows * cols > max_cells)
+        self.df = wide(rows, cols)
+
+    def time_corr_heatmap(self, rows, cols):
+        render("corr_heatmap", df=self.df, mask=True)
+
+    def peakmem_corr_heatmap(self, rows, cols):
+        render("corr_heatmap", df=self.df, mask=True)
+
+    def time_corr_heatmap_fit_labels(self, rows, cols):
+        # measured labels, thinned once they no longer fit at a legible size
+        render("corr_heatmap", df=self.df, mask=True, fit_labels=True)
+
+    def time_corr_heatmap_target(self, rows, cols):
+        render("corr_heatmap_target", df=self.df.iloc[:, 1:], target=self.df.iloc[:, 0], thresh=0.0)
+
+    def peakmem_corr_heatmap_target(self, rows, cols):
+        render("corr_heatmap_target", df=self.df.iloc[:, 1:], target=self.df.iloc[:, 0], thresh=0.0)
+
+
+class ProbPlotSuite:
+    params = rows_params
+    param_names = ["rows"]
+    number = 1
+    timeout = 600
+
+    def setup(self, rows):
+        self.x = frame("attrition", rows, ("Age",))["Age"].values
+
+    def time_prob_plot(self, rows):
+        render("prob_plot", ax_name="plot", x=self.x)
+
+    def peakmem_prob_plot(self, rows):
+        render("prob_plot", ax_name="plot", x=self.x)
+
+
+class ModelSuite:
+    params = rows_params
+    param_names = ["rows"]
+    number = 1
+    timeout = 900
+
+    def setup(self, rows):
+        # both charts refit or re-predict with the estimator, which dominates beyond 1e5 rows
+        skip_if(rows > 100000)
+        df = frame("attrition", rows, ("Age", "HourlyRate", "MonthlyIncome", "JobLevel"))
+        self.x = df[["Age", "HourlyRate"]].values
+        self.y = (df["JobLevel"] > 2).astype(int).values
+        self.estimator = LogisticRegression().fit(self.x, self.y)
+
+    def time_roc_curve_plot(self, rows):
+        render("roc_curve_plot", model=LogisticRegression(), X_train=self.x, y_train=self.y)
+
+    def peakmem_roc_curve_plot(self, rows):
+        render("roc_curve_plot", model=LogisticRegression(), X_train=self.x, y_train=self.y)
+
+    def time_decision_region(self, rows):
+        render("decision_region", x=self.x, y=self.y, estimator=self.estimator, resolution=1)
+
+    def peakmem_decision_region(self, rows):
+        render("decision_region", x=self.x, y=self.y, estimator=self.estimator, resolution=1)
@@ -0,0 +1,176 @@
+import numpy as np
+import pandas as pd
+
+from .synthetic import frame, render, rows_params, skip_if
+
+
+class FacetCatSuite:
+    params = [10, 100, 1000]
+    param_names = ["n_categories"]
+    number = 1
+    timeout = 300
+
+    def setup(self, n_categories):
+        # per-category counts for the attrition dataset's two classes
+        counts = np.random.RandomState(0).randint(1, 1000, size=(n_categories, 2))
+        self.df = pd.DataFrame(counts, columns=["No", "Yes"])
+        self.df.insert(0, "category", ["category_{}".format(i) for i in range(n_categories)])
+
+        # the same categories split twelve ways
+        wide = np.random.RandomState(0).randint(1, 1000, size=(n_categories, 12))
+        self.wide = pd.DataFrame(wide, columns=["split_{}".format(i) for i in range(12)])
+        self.wide.insert(0, "category", self.df["category"])
+
+    def time_facet_cat(self, n_categories):
+        render("facet_cat", df=self.df, feature="category", legend_labels=["No", "Yes"])
+
+    def peakmem_facet_cat(self, n_categories):
+        render("facet_cat", df=self.df, feature="category", legend_labels=["No", "Yes"])
+
+    def time_facet_cat_wide(self, n_categories):
+        render("facet_cat", df=self.wide, feature="category")
+
+
+class FacetTwoCatSuite:
+    params = rows_params
+    param_names = ["rows"]
+    number = 1
+    timeout = 900
+
+    def setup(self, rows):
+        self.df = frame("attrition", rows, ("EducationField", "Attrition", "Gender", "Age"))
+        # means as a warehouse query would return them
+        self.means = self.df.groupby(["EducationField", "Attrition", "Gender"])["Age"].mean().reset_index()
+
+    def time_facet_two_cat_bar(self, rows):
+        render("facet_two_cat_bar", df=self.df, x="EducationField", y="Age", split="Attrition")
+
+    def peakmem_facet_two_cat_bar(self, rows):
+        render("facet_two_cat_bar", df=self.df, x="EducationField", y="Age", split="Attrition")
+
+    def time_facet_two_cat_point(self, rows):
+        render(
+            "facet_two_cat_point",
+            canvas=False,
+            df=self.df,
+            x="EducationField",
+            y="Age",
+            split="Attrition",
+            cat_col="Gender",
+        )
+
+    def peakmem_facet_two_cat_point(self, rows):
+        render(
+            "facet_two_cat_point",
+            canvas=False,
+            df=self.df,
+            x="EducationField",
+            y="Age",
+            split="Attrition",
+            cat_col="Gender",
+        )
+
+    def time_facet_two_cat_bar_raw(self, rows):
+        # seaborn groups every row again, so 1e7 rows are skipped
+        if rows <= 1000000:
+            render("facet_two_cat_bar", df=self.df, x="EducationField", y="Age", split="Attrition", mode="raw")
+
+    def time_facet_two_cat_bar_summary(self, rows):
+        render("facet_two_cat_bar", df=self.df, x="EducationField", y="Age", split="Attrition", mode="summary")
+
+    def time_facet_two_cat_point_raw(self, rows):
+        if rows <= 1000000:
+            render(
+                "facet_two_cat_point",
+                canvas=False,
+                df=self.df,
+                x="EducationField",
+                y="Age",
+                split="Attrition",
+                cat_col="Gender",
+                mode="raw",
+            )
+
+    def time_facet_two_cat_point_summary(self, rows):
+        render(
+            "facet_two_cat_point",
+            canvas=False,
+            df=self.df,
+            x="EducationField",
+            y="Age",
+            split="Attrition",
+            cat_col="Gender",
+            mode="summary",
+        )
+
+    def time_facet_two_cat_point_precomputed(self, rows):
+        render(
+            "facet_two_cat_point",
+            canvas=False,
+            df=None,
+            x="EducationField",
+            y="Age",
+            split="Attrition",
+            cat_col="Gender",
+            summary=self.means,
+        )
+
+
+class FacetGridSuite:
+    params = rows_params
+    param_names = ["rows"]
+    number = 1
+    timeout = 900
+
+    def setup(self, rows):
+        # every facet redraws its subset point by point, so 1e7 rows are skipped
+        skip_if(rows > 100000)
+        self.df = frame(
+            "attrition", rows, ("Gender", "Department", "Attrition", "Age", "MonthlyIncome")
+        )
+
+    def time_facet_cat_num_scatter(self, rows):
+        render(
+            "facet_cat_num_scatter",
+            canvas=False,
+            df=self.df,
+            x="Age",
+            y="MonthlyIncome",
+            cat_row="Gender",
+            cat_col="Department",
+            split="Attrition",
+        )
+
+    def peakmem_facet_cat_num_scatter(self, rows):
+        render(
+            "facet_cat_num_scatter",
+            canvas=False,
+            df=self.df,
+            x="Age",
+            y="MonthlyIncome",
+            cat_row="Gender",
+            cat_col="Department",
+            split="Attrition",
+        )
+
+    def time_facet_cat_num_hist(self, rows):
+        render(
+            "facet_cat_num_hist",
+            canvas=False,
+            df=self.df,
+            cat_row="Gender",
+            cat_col="Department",
+            num_col="Age",
+            split="Attrition",
+        )
+
+    def peakmem_facet_cat_num_hist(self, rows):
+        render(
+            "facet_cat_num_hist",
+            canvas=False,
+            df=self.df,
+            cat_row="Gender",
+            cat_col="Department",
+            num_col="Age",
+            split="Attrition",
+        )
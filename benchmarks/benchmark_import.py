@@ -0,0 +1,39 @@
+"""
+Cold-start import benchmarks. Each timeraw_ benchmark runs in a fresh interpreter, so the
+numbers reflect what a short-lived worker pays before it draws anything.
+"""
+
+
+class ImportSuite:
+    def timeraw_import_prettierplot(self):
+        return """
+        import prettierplot
+        """
+
+    def timeraw_import_plotter(self):
+        return """
+        from prettierplot.plotter import PrettierPlot
+        """
+
+    def timeraw_import_all_modules(self):
+        # reference point: the cost every import paid before methods were bound lazily
+        return """
+        import prettierplot.cat
+        import prettierplot.data
+        import prettierplot.eval
+        import prettierplot.facet
+        import prettierplot.line
+        import prettierplot.num
+        """
+
+    def timeraw_first_bar_v(self):
+        return """
+        import matplotlib
+        matplotlib.use("Agg")
+        import numpy as np
+        from prettierplot.plotter import PrettierPlot
+
+        p = PrettierPlot(chart_scale=10)
+        ax = p.make_canvas()
+        p.bar_v(x=np.array(["a", "b", "c"]), counts=np.array([3, 2, 1]))
+        """
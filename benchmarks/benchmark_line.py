@@ -0,0 +1,40 @@
+import numpy as np
+
+from .synthetic import cols_params, render, rows_params, skip_if, wide
+
+
+class LineSuite:
+    params = rows_params
+    param_names = ["rows"]
+    number = 1
+    timeout = 600
+
+    def setup(self, rows):
+        self.x = np.arange(rows)
+        self.y = wide(rows, 1)["feature_0"].values
+
+    def time_line(self, rows):
+        render("line", x=self.x, y=self.y, label="feature_0")
+
+    def peakmem_line(self, rows):
+        render("line", x=self.x, y=self.y, label="feature_0")
+
+
+class MultiLineSuite:
+    params = [rows_params, cols_params]
+    param_names = ["rows", "cols"]
+    number = 1
+    timeout = 900
+
+    def setup(self, rows, cols):
+        # one line and one legend entry per column
+        skip_if(cols > 100 or rows * cols > 10 ** 7)
+        self.x = np.arange(rows)
+        self.y = wide(rows, cols).values
+        self.labels = ["feature_{}".format(i) for i in range(cols)]
+
+    def time_multi_line(self, rows, cols):
+        render("multi_line", x=self.x, y=self.y, label=self.labels)
+
+    def peakmem_multi_line(self, rows, cols):
+        render("multi_line", x=self.x, y=self.y, label=self.labels)
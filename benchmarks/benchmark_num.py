@@ -0,0 +1,153 @@
+import numpy as np
+from scipy import stats
+
+from .synthetic import cols_params, frame, render, rows_params, skip_if, wide
+
+
+class ScatterSuite:
+    params = rows_params
+    param_names = ["rows"]
+    number = 1
+    timeout = 900
+
+    def setup(self, rows):
+        df = frame("attrition", rows, ("Age", "MonthlyIncome", "JobLevel"))
+        self.x = df["Age"].values
+        self.y = df["MonthlyIncome"].values
+        self.target = df["JobLevel"].round().clip(1, 5).values
+
+    def time_scatter_2d(self, rows):
+        render("scatter_2d", x=self.x, y=self.y)
+
+    def peakmem_scatter_2d(self, rows):
+        render("scatter_2d", x=self.x, y=self.y)
+
+    def time_scatter_2d_points(self, rows):
+        render("scatter_2d", x=self.x, y=self.y, mode="points")
+
+    def time_scatter_2d_density(self, rows):
+        render("scatter_2d", x=self.x, y=self.y, mode="density")
+
+    def peakmem_scatter_2d_density(self, rows):
+        render("scatter_2d", x=self.x, y=self.y, mode="density")
+
+    def time_scatter_2d_hue(self, rows):
+        render("scatter_2d_hue", x=self.x, y=self.y, target=self.target, label=list("abcde"))
+
+    def peakmem_scatter_2d_hue(self, rows):
+        render("scatter_2d_hue", x=self.x, y=self.y, target=self.target, label=list("abcde"))
+
+    def time_scatter_2d_hue_single_artist(self, rows):
+        render(
+            "scatter_2d_hue",
+            x=self.x,
+            y=self.y,
+            target=self.target,
+            label=list("abcde"),
+            single_artist=True,
+        )
+
+
+class RegPlotSuite:
+    params = rows_params
+    param_names = ["rows"]
+    number = 1
+    timeout = 900
+
+    def setup(self, rows):
+        self.df = frame("attrition", rows, ("Age", "MonthlyIncome"))
+
+    def time_reg_plot(self, rows):
+        render("reg_plot", x="Age", y="MonthlyIncome", data=self.df)
+
+    def peakmem_reg_plot(self, rows):
+        render("reg_plot", x="Age", y="MonthlyIncome", data=self.df)
+
+    def time_reg_plot_bootstrap(self, rows):
+        # each resample touches every row, so the bootstrap band is only timed up to 1e5 rows
+        if rows <= 100000:
+            render("reg_plot", x="Age", y="MonthlyIncome", data=self.df, method="bootstrap", n_jobs=-1)
+
+
+class HistSuite:
+    params = rows_params
+    param_names = ["rows"]
+    number = 1
+    timeout = 600
+
+    def setup(self, rows):
+        self.x = frame("attrition", rows, ("Age",))["Age"].values
+
+    def time_hist(self, rows):
+        render("hist", x=self.x, color="blue", label="Age")
+
+    def peakmem_hist(self, rows):
+        render("hist", x=self.x, color="blue", label="Age")
+
+    def time_hist_stream(self, rows):
+        # chunks of 1e5 rows, with bin edges agreed from a first pass
+        chunks = lambda: iter(np.array_split(self.x, max(rows // 100000, 1)))
+        render("hist", x=chunks, color="blue", label="Age")
+
+    def peakmem_hist_stream_generated(self, rows):
+        # chunks are generated on demand, so peak memory is bounded by the chunk size
+        chunks = (np.random.RandomState(i).normal(40, 10, 100000) for i in range(max(rows // 100000, 1)))
+        render("hist", x=chunks, color="blue", label="Age", range=(0, 80))
+
+
+class DensitySuite:
+    params = rows_params
+    param_names = ["rows"]
+    number = 1
+    timeout = 900
+
+    def setup(self, rows):
+        self.x = frame("attrition", rows, ("Age",))["Age"].values
+
+    def time_kde_plot(self, rows):
+        render("kde_plot", x=self.x, color="blue", shade=True)
+
+    def peakmem_kde_plot(self, rows):
+        render("kde_plot", x=self.x, color="blue", shade=True)
+
+    def time_dist_plot(self, rows):
+        render("dist_plot", x=self.x, color="blue", kde=True, fit=stats.norm)
+
+    def peakmem_dist_plot(self, rows):
+        render("dist_plot", x=self.x, color="blue", kde=True, fit=stats.norm)
+
+
+class PairPlotSuite:
+    params = [rows_params, cols_params]
+    param_names = ["rows", "cols"]
+    number = 1
+    timeout = 1800
+
+    def setup(self, rows, cols):
+        # a pair plot draws cols ** 2 panels, so only the narrowest frames are rendered
+        skip_if(cols > 10)
+        self.df = wide(rows, cols)
+        self.target = (self.df.iloc[:, 0] > self.df.iloc[:, 0].median()).astype(int).rename("target")
+
+    def time_pair_plot(self, rows, cols):
+        # the point-by-point scatter plots are only timed up to 1e5 rows
+        if rows <= 100000:
+            render("pair_plot", canvas=False, df=self.df, large_data=False)
+
+    def peakmem_pair_plot(self, rows, cols):
+        if rows <= 100000:
+            render("pair_plot", canvas=False, df=self.df, large_data=False)
+
+    def time_pair_plot_large_data(self, rows, cols):
+        render("pair_plot", canvas=False, df=self.df, target=self.target, large_data=True)
+
+    def peakmem_pair_plot_large_data(self, rows, cols):
+        render("pair_plot", canvas=False, df=self.df, target=self.target, large_data=True)
+
+    def time_pair_plot_custom(self, rows, cols):
+        if rows <= 100000:
+            render("pair_plot_custom", canvas=False, df=self.df)
+
+    def peakmem_pair_plot_custom(self, rows, cols):
+        if rows <= 100000:
+            render("pair_plot_custom", canvas=False, df=self.df)
@@ -0,0 +1,60 @@
+import io
+
+import numpy as np
+import seaborn as sns
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.colors import LinearSegmentedColormap
+from matplotlib.figure import Figure
+
+import prettierplot.style as style
+
+from .synthetic import render, skip_if, wide
+
+
+def legacy_pair_plot_custom(df, chart_scale=10, color=style.style_blue):
+    # the previous implementation - a seaborn call in every cell, re-indexing the frame and
+    # rebuilding the colormap for each off-diagonal panel in both triangles
+    with style.rc_scope(style.rc_compile("pair_plot_custom", chart_scale)):
+        fig = Figure(constrained_layout=True, figsize=(1.2 * chart_scale, 0.9 * chart_scale))
+        FigureCanvasAgg(fig)
+        axes = fig.subplots(ncols=len(df.columns), nrows=len(df.columns), squeeze=False)
+
+        for (i, j), ax in np.ndenumerate(axes):
+            if i == j:
+                sns.kdeplot(df.iloc[:, i], ax=ax, legend=False, fill=True, color=color)
+            else:
+                sns.scatterplot(
+                    x=df.iloc[:, j],
+                    y=df.iloc[:, i],
+                    data=df,
+                    palette=LinearSegmentedColormap.from_list(name="", colors=["white", color]),
+                    legend=False,
+                    ax=ax,
+                )
+
+        fig.savefig(io.BytesIO(), format="png")
+        fig.clear()
+
+
+class PairPlotCustomSuite:
+    params = [[1000, 10000, 100000], [4, 10, 30]]
+    param_names = ["rows", "cols"]
+    number = 1
+    timeout = 1800
+
+    def setup(self, rows, cols):
+        # 30 columns at 1e5 rows takes several minutes with the previous implementation
+        skip_if(rows * cols > 10 ** 6)
+        self.df = wide(rows, cols)
+
+    def time_legacy(self, rows, cols):
+        legacy_pair_plot_custom(self.df)
+
+    def time_engine(self, rows, cols):
+        render("pair_plot_custom", canvas=False, df=self.df)
+
+    def time_engine_threads(self, rows, cols):
+        render("pair_plot_custom", canvas=False, df=self.df, n_jobs=-1)
+
+    def time_engine_blank_upper(self, rows, cols):
+        render("pair_plot_custom", canvas=False, df=self.df, upper="blank")
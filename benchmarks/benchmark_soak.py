@@ -0,0 +1,69 @@
+"""
+Soak benchmark tracking resident memory across many renders in one process. Run directly
+(python benchmarks/benchmark_soak.py) to print the RSS curve, or through asv to track the
+growth figure.
+"""
+import io
+import os
+import resource
+
+import numpy as np
+
+from prettierplot.plotter import PrettierPlot
+from prettierplot.pool import FigurePool
+
+
+def current_rss_mb():
+    # /proc reports current RSS. fall back to peak RSS where /proc is unavailable
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 1024 ** 2
+    except (OSError, ValueError):
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def render(counts, labels, pool=None, release=True):
+    p = PrettierPlot(chart_scale=8, interactive=pool is None, figure_pool=pool)
+    ax = p.make_canvas(title="soak")
+    p.bar_v(x=labels, counts=counts)
+    p.savefig(io.BytesIO(), format="png")
+    if release:
+        p.close()
+
+
+def soak(n_renders=10000, mode="pool", every=1000):
+    counts = np.random.RandomState(0).randint(1, 100, size=12)
+    labels = np.array(["category_{}".format(i) for i in range(12)])
+    pool = FigurePool() if mode == "pool" else None
+
+    curve = []
+    for i in range(1, n_renders + 1):
+        render(counts, labels, pool=pool, release=mode != "leak")
+        if i % every == 0:
+            curve.append((i, current_rss_mb()))
+    return curve
+
+
+class SoakSuite:
+    params = ["close", "pool"]
+    param_names = ["mode"]
+    timeout = 3600
+    unit = "MB"
+
+    def track_rss_growth_10k_renders(self, mode):
+        curve = soak(n_renders=10000, mode=mode)
+        # growth after warm-up, so one-off allocations (fonts, caches) are excluded
+        return curve[-1][1] - curve[0][1]
+
+
+if __name__ == "__main__":
+    import sys
+
+    import matplotlib
+
+    matplotlib.use("Agg")
+
+    mode = sys.argv[1] if len(sys.argv) > 1 else "pool"
+    n_renders = int(sys.argv[2]) if len(sys.argv) > 2 else 10000
+    for i, rss in soak(n_renders=n_renders, mode=mode, every=max(n_renders // 10, 1)):
+        print("{:>6} renders  {:8.1f} MB".format(i, rss))
@@ -0,0 +1,59 @@
+import io
+
+from prettierplot.encode import CategoryEncoding
+from prettierplot.plotter import PrettierPlot
+from prettierplot.stats import StatsCache
+
+from .synthetic import frame, rows_params, skip_if
+
+
+class StatsCacheSuite:
+    params = rows_params
+    param_names = ["rows"]
+    number = 1
+    timeout = 1800
+
+    def setup(self, rows):
+        # the seaborn-backed charts in the report redraw every row, so 1e7 rows are skipped
+        skip_if(rows > 1000000)
+        self.df = frame("attrition", rows, ("EducationField", "Attrition", "Age", "MonthlyIncome", "HourlyRate"))
+        self.num = self.df[["Age", "MonthlyIncome", "HourlyRate"]]
+
+    def report(self, stats_cache):
+        # an eda report that passes the same frame through several charts, one object per chart
+        charts = [
+            ("corr_heatmap", {"df": self.num}),
+            ("box_plot_v", {"x": "EducationField", "y": "Age", "data": self.df, "color": "blue"}),
+            ("box_plot_v", {"x": "EducationField", "y": "MonthlyIncome", "data": self.df, "color": "blue"}),
+            ("scatter_2d", {"x": self.num["Age"].values, "y": self.num["MonthlyIncome"].values}),
+            ("scatter_2d", {"x": self.num["Age"].values, "y": self.num["HourlyRate"].values}),
+        ]
+        for method, kwargs in charts:
+            with PrettierPlot(chart_scale=10, interactive=False, stats_cache=stats_cache) as p:
+                p.make_canvas(title=method)
+                getattr(p, method)(**kwargs)
+                p.savefig(io.BytesIO(), format="png")
+
+    def time_report(self, rows):
+        self.report(None)
+
+    def time_report_stats_cache(self, rows):
+        self.report(StatsCache())
+
+
+class CategoryEncodingSuite:
+    params = rows_params
+    param_names = ["rows"]
+    number = 1
+    timeout = 600
+
+    def setup(self, rows):
+        self.labels = frame("attrition", rows, ("EducationField",))["EducationField"]
+        self.categorical = self.labels.astype("category")
+
+    def time_encoding_object(self, rows):
+        CategoryEncoding(self.labels)
+
+    def time_encoding_categorical(self, rows):
+        # categorical columns reuse their codes
+        CategoryEncoding(self.categorical)
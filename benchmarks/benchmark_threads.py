@@ -0,0 +1,34 @@
+import io
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from prettierplot.plotter import PrettierPlot
+
+
+def render_bar_v(seed):
+    counts = np.random.RandomState(seed).randint(1, 100, size=12)
+    labels = np.array(["category_{}".format(i) for i in range(12)])
+
+    p = PrettierPlot(chart_scale=10, interactive=False)
+    ax = p.make_canvas(title="chart {}".format(seed))
+    p.bar_v(x=labels, counts=counts)
+
+    buffer = io.BytesIO()
+    p.savefig(buffer, format="png")
+
+    # every chart must own exactly its own bars, whichever thread drew it
+    if len(ax.patches) != len(counts):
+        raise AssertionError("chart {} picked up foreign artists".format(seed))
+    return buffer.getvalue()
+
+
+# themed renders are serialized across threads, so this measures their overhead. style isolation
+# between threads is checked by tests/test_threads.py
+class ThreadedRenderSuite:
+    params = [1, 4, 8]
+    param_names = ["n_threads"]
+
+    def time_bar_v_thread_pool(self, n_threads):
+        with ThreadPoolExecutor(max_workers=n_threads) as executor:
+            list(executor.map(render_bar_v, range(32)))
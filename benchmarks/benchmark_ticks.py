@@ -0,0 +1,40 @@
+import matplotlib.ticker as tkr
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from prettierplot import util
+
+
+class TickFormattingSuite:
+    params = [1, 16, 64]
+    param_names = ["n_axes"]
+
+    def setup(self, n_axes):
+        self.x = np.linspace(0, 1e6, 200)
+        self.y = np.random.RandomState(0).rand(200)
+        self.fig = Figure(figsize=(12, 12))
+        FigureCanvasAgg(self.fig)
+        side = int(np.ceil(np.sqrt(n_axes)))
+        self.axes = [self.fig.add_subplot(side, side, i + 1) for i in range(n_axes)]
+        for ax in self.axes:
+            ax.plot(self.x, self.y)
+
+    def teardown(self, n_axes):
+        self.fig.clear()
+
+    def time_rewrite_ticklabels(self, n_axes):
+        # previous pattern - rebuild every tick label Text, then install fresh formatters
+        for ax in self.axes:
+            ax.set_yticklabels(ax.get_yticklabels(), rotation=0, fontsize=12, color="grey")
+            ax.set_xticklabels(ax.get_xticklabels(), rotation=0, fontsize=12, color="grey")
+            ax.xaxis.set_major_formatter(tkr.FuncFormatter(lambda x, *args: "{:,.0f}".format(x)))
+            ax.yaxis.set_major_formatter(tkr.FuncFormatter(lambda x, *args: "{:,.1%}".format(x)))
+        self.fig.canvas.draw()
+
+    def time_label_formatter(self, n_axes):
+        for ax in self.axes:
+            util.util_label_formatter(
+                ax=ax, x_units="f", y_units="p", x_size=12, y_size=12, color="grey"
+            )
+        self.fig.canvas.draw()
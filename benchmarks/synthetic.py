@@ -0,0 +1,91 @@
+# synthetic benchmark inputs scaled up from the bundled datasets. rows are bootstrapped from the
+# source dataset and numeric values are jittered by a fraction of each column's standard deviation,
+# so sorting, binning and correlation code sees realistic spreads rather than repeated values. wide
+# frames tile the housing numeric columns with independent noise. frames are cached per process
+# because asv calls setup before every repeat
+import functools
+import io
+
+import numpy as np
+import pandas as pd
+
+from prettierplot import data
+from prettierplot.plotter import PrettierPlot
+
+
+rows_params = [1000, 100000, 10000000]
+cols_params = [10, 100, 1000]
+
+# largest frame (rows * columns) any benchmark is allowed to allocate
+max_cells = 10 ** 8
+
+
+@functools.lru_cache(maxsize=None)
+def source(name):
+    if name == "attrition":
+        return data.attrition()
+    elif name == "housing":
+        return data.housing()[0]
+    return data.titanic()[0]
+
+
+@functools.lru_cache(maxsize=8)
+def frame(name, rows, columns):
+    # bootstrap `rows` rows of `columns` (a tuple of column names) from a bundled dataset
+    df = source(name)[list(columns)]
+    rs = np.random.RandomState(0)
+    df = df.iloc[rs.randint(0, len(df), size=rows)].reset_index(drop=True)
+
+    for column in df.columns:
+        if pd.api.types.is_numeric_dtype(df[column]):
+            values = df[column].values.astype(float)
+            df[column] = values + rs.normal(0, 0.05 * np.nanstd(values) + 1e-9, size=rows)
+    return df
+
+
+@functools.lru_cache(maxsize=4)
+def wide(rows, cols):
+    # numeric frame of `rows` x `cols` built by tiling the housing dataset's numeric columns
+    if rows * cols > max_cells:
+        raise NotImplementedError("frame too large")
+
+    base = source("housing").select_dtypes("number").drop(columns=["Id"]).fillna(0)
+    rs = np.random.RandomState(0)
+    index = rs.randint(0, len(base), size=rows)
+
+    values = np.empty((rows, cols), dtype=np.float64)
+    for i in range(cols):
+        column = base.iloc[:, i % base.shape[1]].values.astype(float)[index]
+        values[:, i] = column + rs.normal(0, 0.1 * column.std() + 1e-9, size=rows)
+
+    return pd.DataFrame(values, columns=["feature_{}".format(i) for i in range(cols)])
+
+
+def category_counts(n_categories, rows=100000):
+    # labels and counts for `n_categories` categories with the long-tailed frequency profile of
+    # the attrition dataset's JobRole column
+    profile = np.sort(source("attrition")["JobRole"].value_counts(normalize=True).values)[::-1]
+    weights = np.interp(
+        np.linspace(0, len(profile) - 1, n_categories), np.arange(len(profile)), profile
+    )
+    counts = np.maximum((weights / weights.sum() * rows).astype(int), 1)
+    labels = np.array(["category_{}".format(i) for i in range(n_categories)])
+    return labels, counts
+
+
+def skip_if(condition):
+    # asv treats NotImplementedError raised in setup as "skip this parameter combination"
+    if condition:
+        raise NotImplementedError()
+
+
+def render(chart, canvas=True, ax_name=None, **kwargs):
+    # build a chart with the PrettierPlot method named `chart`, draw and encode it to png, and release its figures.
+    # ax_name passes the canvas axes to methods that take it under a different name
+    with PrettierPlot(chart_scale=10, interactive=False) as p:
+        if canvas:
+            ax = p.make_canvas(title="benchmark")
+            if ax_name is not None:
+                kwargs[ax_name] = ax
+        getattr(p, chart)(**kwargs)
+        p.savefig(io.BytesIO(), format="png")
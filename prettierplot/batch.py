@@ -0,0 +1,227 @@
+import io
+import os
+import traceback
+from collections import deque, namedtuple
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+
+import matplotlib
+import matplotlib.pyplot as plt
+
+from prettierplot.pool import FigurePool
+
+
+RenderResult = namedtuple("RenderResult", ["index", "path", "data", "error"])
+
+# canvases are reused across the specs rendered by a process
+batch_figure_pool = FigurePool()
+
+
+def batch_init_worker():
+    """
+    Documentation:
+
+        ---
+        Description:
+            Process pool initializer. Forces the non-interactive Agg backend so workers never
+            try to open a display.
+    """
+    matplotlib.use("Agg", force=True)
+    plt.switch_backend("Agg")
+
+
+def render_spec(spec, index=0):
+    """
+    Documentation:
+
+        ---
+        Description:
+            Render a single chart specification, write it to disk or encode it to bytes, and
+            release every figure created along the way. Exceptions raised while rendering are
+            captured and returned rather than raised, so one bad chart cannot take down a batch.
+
+        ---
+        Parameters:
+            spec : dict
+                Chart specification. See render_many for the accepted keys.
+            index : int, default=0
+                Position of the specification in the batch. Carried through to the result.
+
+        ---
+        Returns:
+            result : RenderResult
+                Named tuple of (index, path, data, error). data holds the encoded figure when
+                no path is given. error holds the formatted traceback when rendering failed.
+    """
+    from prettierplot.plotter import PrettierPlot
+
+    path = spec.get("path")
+    try:
+        with PrettierPlot(
+            chart_scale=spec.get("chart_scale", 15),
+            plot_orientation=spec.get("plot_orientation"),
+            interactive=False,
+            figure_pool=batch_figure_pool,
+        ) as p:
+
+            # figure-level methods (FacetGrid, pair plots) build their own figure and need no canvas
+            canvas = spec.get("canvas", {})
+            if canvas is not None:
+                p.make_canvas(**canvas)
+
+            getattr(p, spec["method"])(**spec.get("kwargs", {}))
+
+            savefig_kws = {"bbox_inches": "tight"}
+            savefig_kws.update(spec.get("savefig", {}))
+
+            if path is not None:
+                directory = os.path.dirname(path)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                p.savefig(path, format=spec.get("format"), **savefig_kws)
+                data = None
+            else:
+                buffer = io.BytesIO()
+                p.savefig(buffer, format=spec.get("format", "png"), **savefig_kws)
+                data = buffer.getvalue()
+
+        return RenderResult(index=index, path=path, data=data, error=None)
+
+    except Exception:
+        return RenderResult(index=index, path=path, data=None, error=traceback.format_exc())
+
+
+def render_many(specs, n_jobs=None, chunksize=1):
+    """
+    Documentation:
+
+        ---
+        Description:
+            Render a batch of chart specifications headlessly on the Agg backend, optionally
+            across a pool of worker processes. Each chart is written to disk or returned as
+            encoded bytes, and its figures are closed once it has been saved. Failures are
+            isolated per chart and reported in the returned results.
+
+        ---
+        Parameters:
+            specs : list of dicts
+                Chart specifications. Each dict accepts the following keys:
+                - 'method' : str, required - name of the PrettierPlot method, e.g. 'bar_v'
+                - 'kwargs' : dict - keyword arguments passed to the method
+                - 'chart_scale' : float or int - passed to PrettierPlot, default 15
+                - 'plot_orientation' : str - passed to PrettierPlot, default None
+                - 'canvas' : dict or None - keyword arguments passed to make_canvas. Use None for
+                  methods that build their own figure, such as facet_cat_num_hist or pair_plot
+                - 'path' : str - file to write. If omitted, the encoded figure is returned
+                - 'format' : str - output format such as 'png', 'svg' or 'pdf'. Inferred from
+                  path when omitted, otherwise 'png'
+                - 'savefig' : dict - additional keyword arguments passed to Figure.savefig
+            n_jobs : int, default=None
+                Number of worker processes. None or 1 renders serially in the current process,
+                -1 uses all available cores.
+            chunksize : int, default=1
+                Number of specifications sent to a worker at a time. Larger values reduce
+                inter-process overhead for batches of many small charts.
+
+        ---
+        Returns:
+            results : list of RenderResult
+                One result per specification, in the same order as specs.
+    """
+    specs = list(specs)
+
+    if n_jobs is None or n_jobs == 1 or len(specs) <= 1:
+        return [render_spec(spec, index) for index, spec in enumerate(specs)]
+
+    if n_jobs < 0:
+        n_jobs = max(os.cpu_count() + 1 + n_jobs, 1)
+
+    chunks = deque((start, specs[start:start + chunksize]) for start in range(0, len(specs), chunksize))
+    results = {}
+    while chunks:
+        suspects = batch_run_chunks(chunks, n_jobs, results)
+
+        # a worker that dies outright (e.g. out of memory) breaks the whole pool and every chunk in
+        # flight with it. each of those chunks is retried alone in a fresh single-worker pool, so only
+        # the chunk that kills its worker again is reported as failed
+        for start, chunk, _ in suspects:
+            for _, _, error in batch_run_chunks(deque([(start, chunk)]), 1, results):
+                results[start] = [
+                    RenderResult(index=index, path=spec.get("path"), data=None, error=error)
+                    for index, spec in enumerate(chunk, start)
+                ]
+
+    return [result for start in sorted(results) for result in results[start]]
+
+
+def batch_run_chunks(chunks, n_jobs, results):
+    """
+    Documentation:
+
+        ---
+        Description:
+            Render chunks of specifications in a process pool until every chunk is done or the
+            pool breaks. At most one chunk is in flight per worker, so when a worker dies the
+            chunk that killed it is among the few that had not finished.
+
+        ---
+        Parameters:
+            chunks : deque
+                Pairs of (start, specs) still to render. Chunks are removed as they are submitted.
+            n_jobs : int
+                Number of worker processes.
+            results : dict
+                Results of finished chunks, keyed by start. Updated in place.
+
+        ---
+        Returns:
+            suspects : list
+                Triples of (start, specs, error) for the chunks in flight when the pool broke.
+                Empty when the pool did not break.
+    """
+    with ProcessPoolExecutor(max_workers=n_jobs, initializer=batch_init_worker) as executor:
+        running = {}
+        while chunks or running:
+            while chunks and len(running) < n_jobs:
+                start, chunk = chunks.popleft()
+                running[executor.submit(render_chunk, chunk, start)] = (start, chunk)
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            if any(isinstance(future.exception(), BrokenProcessPool) for future in done):
+                # chunks still in flight fail with the pool, whether or not they caused it
+                done, _ = wait(running)
+
+            suspects = []
+            for future in done:
+                start, chunk = running.pop(future)
+                exception = future.exception()
+                if exception is None:
+                    results[start] = future.result()
+                    continue
+
+                error = "".join(traceback.format_exception(type(exception), exception, exception.__traceback__))
+                if isinstance(exception, BrokenProcessPool):
+                    suspects.append((start, chunk, error))
+
+                # the chunk rendered but its results could not be sent back
+                else:
+                    results[start] = [
+                        RenderResult(index=index, path=spec.get("path"), data=None, error=error)
+                        for index, spec in enumerate(chunk, start)
+                    ]
+
+            if suspects:
+                return suspects
+
+    return []
+
+
+def render_chunk(specs, start):
+    """
+    Documentation:
+
+        ---
+        Description:
+            Render a contiguous chunk of specifications inside a worker process.
+    """
+    return [render_spec(spec, index) for index, spec in enumerate(specs, start)]
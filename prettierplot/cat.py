@@ -1,31 +1,37 @@
 import numpy as np
-import seaborn as sns
-import squarify
-import matplotlib.pyplot as plt
+import pandas as pd
 import matplotlib.cm
+from matplotlib.artist import setp
+from matplotlib.collections import PolyCollection
+from matplotlib.colors import to_rgba_array
 from matplotlib.patches import Patch
 
+import prettierplot.encode as encode
+import prettierplot.layout as layout
+import prettierplot.profiling as profiling
+import prettierplot.stats as stats
 import prettierplot.style as style
 import prettierplot.util as util
 
 
-import textwrap
-
-
-def bar_v(self, x, counts, color=style.style_grey, x_labels=None, x_tick_wrap=False, label_rotate=0,
-                    y_units="f", alpha=0.8, ax=None):
+def bar_v(self, x, counts=None, color=style.style_grey, x_labels=None, x_tick_wrap=False, label_rotate=0,
+                    y_units="f", alpha=0.8, top_k=None, other_label="Other", fit_labels=False, ax=None):
     """
     Documentation:
 
         ---
         Description:
-            Create vertical bar plot.
+            Create vertical bar plot. Pass either distinct categories and their counts, or a raw
+            column with counts=None to have the categories counted.
 
         ---
         Parameters:
             x : array
                 1-dimensional array of values to plot on x-axis representing distinct categories.
-            counts : array or string
+                When counts is None, a raw column of values (array, Series or Categorical) that is
+                counted with a single factorization, or from its codes when categorical. Nulls are
+                not counted.
+            counts : array or string, default=None
                 1-dimensional array of value counts for categories.
             color : str (some sort of color code), default=style.style_grey
                 Bar color.
@@ -41,17 +47,33 @@ def bar_v(self, x, counts, color=style.style_grey, x_labels=None, x_tick_wrap=Fa
                 decimal places.
             alpha : float, default=0.8
                 Controls transparency of bars. Accepts value between 0.0 and 1.0.
+            top_k : int, default=None
+                Plot only the top_k most frequent categories, in descending order, and collapse the
+                rest into a single trailing bar. None plots every category.
+            other_label : str, default="Other"
+                Label of the bar that collects the categories beyond top_k.
+            fit_labels : bool, default=False
+                Size x-tick labels by their measured extent so that each fits under its bar, and
+                show only every n-th label when they cannot fit at a legible size. By default,
+                label size is chosen by the number of bars.
             ax : axes object, default=None
                 Axis on which to place visual.
     """
     if ax is None:
         ax = self.ax
 
+    # count raw values, and optionally collapse the long tail
+    with profiling.phase("prep"):
+        if counts is None:
+            x, counts = self.stats(x).counts()
+            x = x.astype(str)
+        x, counts = util.util_top_k(x, counts, top_k=top_k, other_label=other_label)
+
     # custom labels
     labels = x_labels if x_labels is not None else x
 
     # create vertical bar plot.
-    plt.bar(
+    ax.bar(
         x=x,
         height=counts,
         color=color,
@@ -60,7 +82,7 @@ def bar_v(self, x, counts, color=style.style_grey, x_labels=None, x_tick_wrap=Fa
     )
 
     # rotate x-tick labels
-    plt.xticks(rotation=label_rotate)
+    ax.tick_params(axis="x", labelrotation=label_rotate)
 
     # dynamically resize x_axis labels
     if len(x) > 10 and len(x) <= 20:
@@ -77,37 +99,46 @@ def bar_v(self, x, counts, color=style.style_grey, x_labels=None, x_tick_wrap=Fa
         )
 
     # wrap long x-tick labels
-    if x_tick_wrap and type(labels):
+    if fit_labels:
+        util.util_fit_tick_labels(
+            ax,
+            "x",
+            ax.get_xticks(),
+            labels,
+            1.2 * self.chart_scale,
+            wrap=12 if x_tick_wrap else None,
+            rotation=label_rotate,
+        )
+    elif x_tick_wrap and type(labels):
         try:
-            x = ["\n".join(textwrap.wrap(i.replace("_", " "), 12)) for i in labels]
+            x = [util.util_wrap_label(i, 12) for i in labels]
             ax.set_xticklabels(x)
         except AttributeError:
             pass
 
-    # format y-ticklabels
-    ax.set_yticklabels(
-        ax.get_yticklabels() * 100 if "p" in y_units else ax.get_yticklabels(),
-        rotation=0,
-        fontsize=1.2 * self.chart_scale,
-        color=style.style_grey,
-    )
-
     # use label formatter utility function to customize chart labels
-    util.util_label_formatter(ax=ax, y_units=y_units)
+    util.util_label_formatter(
+        ax=ax, y_units=y_units, y_size=1.2 * self.chart_scale, color=style.style_grey
+    )
 
-def bar_h(self, y, counts, color=style.style_grey, label_rotate=45, x_units="f", alpha=0.8, ax=None):
+def bar_h(self, y, counts=None, color=style.style_grey, label_rotate=45, x_units="f", alpha=0.8, top_k=None,
+                    other_label="Other", ax=None):
     """
     Documentation:
 
         ---
         Description:
-            Create horizontal bar plot.
+            Create horizontal bar plot. Pass either distinct categories and their counts, or a raw
+            column with counts=None to have the categories counted.
 
         ---
         Parameters:
             y : array
                 1-dimensional array of values to plot on y-axis representing distinct categories.
-            counts : array or string
+                When counts is None, a raw column of values (array, Series or Categorical) that is
+                counted with a single factorization, or from its codes when categorical. Nulls are
+                not counted.
+            counts : array or string, default=None
                 1-dimensional array of value counts for categories.
             color : str (some sort of color code), default=style.style_grey
                 Bar color.
@@ -119,32 +150,40 @@ def bar_h(self, y, counts, color=style.style_grey, label_rotate=45, x_units="f",
                 decimal places.
             alpha : float, default=0.8
                 Controls transparency of bars. Accepts value between 0.0 and 1.0.
+            top_k : int, default=None
+                Plot only the top_k most frequent categories, in descending order, and collapse the
+                rest into a single trailing bar. None plots every category.
+            other_label : str, default="Other"
+                Label of the bar that collects the categories beyond top_k.
             ax : axes object, default=None
                 Axis on which to place visual.
     """
     if ax is None:
         ax = self.ax
-    # plot horizontal bar plot
 
-    plt.barh(y=y, width=counts, color=color, tick_label=y, alpha=alpha)
+    # count raw values, and optionally collapse the long tail
+    with profiling.phase("prep"):
+        if counts is None:
+            y, counts = self.stats(y).counts()
+            y = y.astype(str)
+        y, counts = util.util_top_k(y, counts, top_k=top_k, other_label=other_label)
 
-    # rotate x-tick labels
-    plt.xticks(rotation=label_rotate)
+    # plot horizontal bar plot
+
+    ax.barh(y=y, width=counts, color=color, tick_label=y, alpha=alpha)
 
-    # customize x-ticklabels
-    ax.set_xticklabels(
-        ax.get_xticklabels() * 100 if "p" in x_units else ax.get_xticklabels(),
-        rotation=0,
-        fontsize=0.9 * self.chart_scale,
+    # use label formatter utility function to customize and rotate chart labels
+    util.util_label_formatter(
+        ax=ax,
+        x_units=x_units,
+        x_rotate=label_rotate,
+        x_size=0.9 * self.chart_scale,
         color=style.style_grey,
     )
 
-    # use label formatter utility function to customize chart labels
-    util.util_label_formatter(ax=ax, x_units=x_units)
-
 
 def stacked_bar_h(self, df, label_rotate=0, x_units="p", alpha=0.8, color_map="viridis", bbox=(1.2,0.9),
-                    legend_labels=None, ax=None):
+                    legend_labels=None, fit_labels=False, ax=None):
     """
     Documentation:
 
@@ -170,6 +209,10 @@ def stacked_bar_h(self, df, label_rotate=0, x_units="p", alpha=0.8, color_map="v
                 Coordinates for determining legend position.
             legend_labels : list, default=None
                 Custom legend labels.
+            fit_labels : bool, default=False
+                Size y-tick labels by their measured extent so that each fits beside its bar, and
+                show only every n-th label when they cannot fit at a legible size. By default,
+                label size is chosen by the number of bars.
             ax : axes object, default=None
                 Axis object for the visualization.
     """
@@ -183,32 +226,36 @@ def stacked_bar_h(self, df, label_rotate=0, x_units="p", alpha=0.8, color_map="v
     # define category labels
     category_levels = np.arange(len(df.columns))
 
-    # plot stacked bars
-    for class_label, color in zip(np.arange(len(y)), color_list):
-        # first category
-        if class_label == 0:
-            plt.barh(
-                y=category_levels,
-                width=df.loc[class_label],
-                color=color,
-                alpha=alpha,
-            )
-        # stack all additional categories on previous categories
-        else:
-            plt.barh(
-                y=category_levels,
-                width=df.loc[class_label],
-                left=df.drop([x for x in df.index if x >= class_label]).sum(axis=0),
-                color=color,
-                alpha=alpha,
-            )
-
-    # convert x-axis tick labels to percentages
-    ax.set_xticklabels(
-        ax.get_xticklabels() * 100 if "p" in x_units else ax.get_xticklabels(),
-        rotation=0,
-        color=style.style_grey,
+    # left offset of every class in every category, from one cumulative sum over the class rows.
+    # missing values add nothing to the stack
+    with profiling.phase("prep"):
+        widths = df.values.astype(np.float64)
+        filled = np.nan_to_num(widths)
+        lefts = np.cumsum(filled, axis=0) - filled
+
+        # corners of every bar, as drawn by ax.barh with the default height of 0.8. bars with a
+        # missing width are not drawn
+        keep = ~np.isnan(widths)
+        class_ix, category_ix = np.nonzero(keep)
+        x0 = lefts[keep]
+        x1 = x0 + widths[keep]
+        y0 = category_levels[category_ix] - 0.4
+        y1 = y0 + 0.8
+        verts = np.stack(
+            [np.column_stack(corner) for corner in ((x0, y0), (x0, y1), (x1, y1), (x1, y0))], axis=1
+        )
+
+    # plot stacked bars for every class as a single collection rather than one patch per bar
+    bars = PolyCollection(
+        verts,
+        facecolors=to_rgba_array(color_list)[class_ix],
+        edgecolors="none",
+        linewidths=0,
+        alpha=alpha,
     )
+    bars.sticky_edges.x.append(0)
+    ax.add_collection(bars, autolim=True)
+    ax.autoscale_view()
 
     ## create custom legend
     if legend_labels is None:
@@ -225,7 +272,7 @@ def stacked_bar_h(self, df, label_rotate=0, x_units="p", alpha=0.8, color_map="v
     patches = [Patch(color=v, label=k, alpha=alpha) for k, v in label_color.items()]
 
     # draw legend
-    leg = plt.legend(
+    leg = ax.legend(
         handles=patches,
         fontsize=0.95 * self.chart_scale,
         loc="upper right",
@@ -236,10 +283,10 @@ def stacked_bar_h(self, df, label_rotate=0, x_units="p", alpha=0.8, color_map="v
 
     # label font color
     for text in leg.get_texts():
-        plt.setp(text, color="grey")
+        text.set_color("grey")
 
     # use label formatter utility function to customize chart labels
-    util.util_label_formatter(ax=ax, x_units=x_units)
+    util.util_label_formatter(ax=ax, x_units=x_units, x_rotate=label_rotate, color=style.style_grey)
 
     # overwrite y-axis labels with category labels
     try:
@@ -247,27 +294,26 @@ def stacked_bar_h(self, df, label_rotate=0, x_units="p", alpha=0.8, color_map="v
     except ValueError:
         columns = df.columns
 
-    # dynamically size y-labels
-    if 7 < len(category_levels) <= 10:
-        ax.tick_params(axis="y", colors=style.style_grey, labelsize=0.9 * self.chart_scale)
-    elif 10 < len(category_levels) <= 20:
-        ax.tick_params(axis="y", colors=style.style_grey, labelsize=0.75 * self.chart_scale)
-    elif len(category_levels) > 20:
-        ax.tick_params(axis="y", colors=style.style_grey, labelsize=0.6 * self.chart_scale)
-
     ax.tick_params(axis="x", colors=style.style_grey, labelsize=1.2 * self.chart_scale)
 
-    # wrap long y-tick labels
-    plt.yticks(
-        category_levels,
-        [
-            "\n".join(textwrap.wrap(str(i).replace("_", " "), 12))
-            for i in columns
-        ],
-    )
+    if fit_labels:
+        # measured y-label size, wrapping long labels
+        util.util_fit_tick_labels(ax, "y", category_levels, columns, 1.2 * self.chart_scale)
+    else:
+        # dynamically size y-labels
+        if 7 < len(category_levels) <= 10:
+            ax.tick_params(axis="y", colors=style.style_grey, labelsize=0.9 * self.chart_scale)
+        elif 10 < len(category_levels) <= 20:
+            ax.tick_params(axis="y", colors=style.style_grey, labelsize=0.75 * self.chart_scale)
+        elif len(category_levels) > 20:
+            ax.tick_params(axis="y", colors=style.style_grey, labelsize=0.6 * self.chart_scale)
+
+        # wrap long y-tick labels
+        ax.set_yticks(category_levels)
+        ax.set_yticklabels([util.util_wrap_label(str(i)) for i in columns])
 
 def box_plot_v(self, x, y, data, color, label_rotate=0, y_units="f", color_map="viridis", alpha=0.8,
-                        suppress_outliers=False, ax=None):
+                        suppress_outliers=False, mode="auto", summary_threshold=100000, summary=None, ax=None):
     """
     Documentation:
 
@@ -276,6 +322,11 @@ def box_plot_v(self, x, y, data, color, label_rotate=0, y_units="f", color_map="
             Create vertical box plots. Useful for evaluating a numeric variable on the y-axis
             versus several different category segments on the x-axis.
 
+            In summary mode, quartiles and whiskers are computed per category in one pass over
+            the data, or taken from precomputed summaries, and the boxes are drawn with
+            Axes.bxp. This scales to data far larger than seaborn can draw, and to tables whose
+            raw rows never leave the database.
+
         ---
         Parameters:
             x : str
@@ -300,30 +351,78 @@ def box_plot_v(self, x, y, data, color, label_rotate=0, y_units="f", color_map="
                 Controls transparency of objects. Accepts value between 0.0 and 1.0.
             suppress_outliers : boolean, default=False
                 Controls removal of outliers from box/whisker plots.
+            mode : str, default="auto"
+                Drawing engine.
+                - 'raw' - seaborn box plots drawn from every row of data.
+                - 'summary' - boxes drawn from per-category quartiles and whiskers. Categories
+                  are sorted, or in category order for categorical data.
+                - 'auto' - 'summary' when summary is given or data has more than
+                  summary_threshold rows, otherwise 'raw'.
+            summary_threshold : int, default=100000
+                Number of rows above which mode='auto' switches to summary mode.
+            summary : Pandas DataFrame, default=None
+                Precomputed five-number summaries, one row per category, labeled by the index
+                or by a column named x. Requires columns 'whislo', 'q1', 'med', 'q3' and
+                'whishi', or 'min', 'q1', 'median', 'q3' and 'max'. See
+                stats.stats_box_summary. When given, data is not used and may be None.
             ax : axes object, default=None
                 Axis object for the visualization.
     """
     if ax is None:
         ax = self.ax
 
-    # create vertical box plot.
-    g = sns.boxplot(
-        x=x,
-        y=y,
-        data=data,
-        orient="v",
-        palette=sns.color_palette(
-            style.color_gen(color_map, num=len(np.unique(data[x].values)))
-        ),
-        showfliers=suppress_outliers,
-        ax=ax,
-    ).set(xlabel=None, ylabel=None)
+    if summary is not None:
+        mode = "summary"
+    elif mode == "auto":
+        mode = "summary" if len(data) > summary_threshold else "raw"
+    elif mode not in ("raw", "summary"):
+        raise ValueError("mode must be 'raw', 'summary' or 'auto', not '{}'".format(mode))
+
+    if mode == "summary":
+        with profiling.phase("prep"):
+            if summary is not None:
+                summary = stats.stats_box_summary(summary, by=x)
+            else:
+                summary = self.stats(data).box_summary(y, by=x, fliers=suppress_outliers)
+
+        # categories in the order of the summaries
+        encoding = encode.CategoryEncoding(pd.Categorical(summary.index, categories=summary.index))
+        unique = encoding.levels
+
+        # create vertical box plot from the summaries
+        positions = util.util_box_plot(
+            ax,
+            summary,
+            colors=encoding.colors(color_map),
+            vert=True,
+            alpha=alpha,
+            show_fliers=suppress_outliers,
+        )
+        ax.set_xticks(positions)
+        ax.set_xticklabels([str(label) for label in unique])
+    else:
+        import seaborn as sns
+
+        # category encoding, shared with other charts of the same data through the stats cache
+        encoding = self.stats(data).encoding(x)
+        unique = encoding.levels
+
+        # create vertical box plot.
+        g = sns.boxplot(
+            x=x,
+            y=y,
+            data=data,
+            orient="v",
+            order=encoding.order,
+            palette=sns.color_palette(encoding.colors(color_map)),
+            showfliers=suppress_outliers,
+            ax=ax,
+        ).set(xlabel=None, ylabel=None)
 
     # tick label font size
     ax.tick_params(axis="both", colors=style.style_grey, labelsize=1.2 * self.chart_scale)
 
     # resize x-axis labels as needed
-    unique = np.unique(data[x])
     if len(unique) > 10 and len(unique) <= 20:
         ax.tick_params(
             axis="x", colors=style.style_grey, labelsize=1.0 * self.chart_scale
@@ -341,10 +440,10 @@ def box_plot_v(self, x, y, data, color, label_rotate=0, y_units="f", color_map="
     ax.tick_params(axis="y", labelsize=1.2 * self.chart_scale)
 
     # fade box plot figures by reducing alpha.
-    plt.setp(ax.artists, alpha=alpha)
+    setp(ax.artists, alpha=alpha)
 
     # rotate x-tick labels
-    plt.xticks(rotation=label_rotate)
+    ax.tick_params(axis="x", labelrotation=label_rotate)
     ax.yaxis.set_visible(True)
 
     # use label formatter utility function to customize chart labels
@@ -352,7 +451,8 @@ def box_plot_v(self, x, y, data, color, label_rotate=0, y_units="f", color_map="
 
 
 def box_plot_h(self, x, y, data, color=style.style_grey, x_units="f", bbox=(1.05, 1), color_map="viridis",
-                        suppress_outliers=False, alpha=0.8, legend_labels=None, ax=None):
+                        suppress_outliers=False, alpha=0.8, legend_labels=None, mode="auto",
+                        summary_threshold=100000, summary=None, ax=None):
     """
     Documentation:
 
@@ -361,6 +461,10 @@ def box_plot_h(self, x, y, data, color=style.style_grey, x_units="f", bbox=(1.05
             create horizontal box plots. useful for evaluating a object target on the y_axis
             vs. a number independent variable on the x_axis.
 
+            In summary mode, quartiles and whiskers are computed per category in one pass over
+            the data, or taken from precomputed summaries, and the boxes are drawn with
+            Axes.bxp. See box_plot_v.
+
         ---
         Parameters:
             x : str
@@ -387,28 +491,70 @@ def box_plot_h(self, x, y, data, color=style.style_grey, x_units="f", bbox=(1.05
                 Controls transparency of bars. Accepts value between 0.0 and 1.0.
             legend_labels : list, default=None
                 Custom legend labels.
+            mode : str, default="auto"
+                Drawing engine. 'raw' draws seaborn box plots from every row of data, 'summary'
+                draws boxes from per-category quartiles and whiskers, and 'auto' picks 'summary'
+                when summary is given or data has more than summary_threshold rows.
+            summary_threshold : int, default=100000
+                Number of rows above which mode='auto' switches to summary mode.
+            summary : Pandas DataFrame, default=None
+                Precomputed five-number summaries, one row per category, labeled by the index
+                or by a column named y. See box_plot_v. When given, data is not used and may be
+                None.
             ax : axes object, default=None
                 Axis object for the visualization.
     """
     if ax is None:
         ax = self.ax
-    # create horizontal box plot
 
-    g = sns.boxplot(
-        x=x,
-        y=y,
-        hue=y,
-        data=data,
-        orient="h",
-        palette=sns.color_palette(
-            style.color_gen(color_map, num=len(np.unique(data[y].values)))
-        ),
-        showfliers=suppress_outliers,
-        ax=ax,
-    ).set(xlabel=None, ylabel=None)
+    if summary is not None:
+        mode = "summary"
+    elif mode == "auto":
+        mode = "summary" if len(data) > summary_threshold else "raw"
+    elif mode not in ("raw", "summary"):
+        raise ValueError("mode must be 'raw', 'summary' or 'auto', not '{}'".format(mode))
+
+    if mode == "summary":
+        with profiling.phase("prep"):
+            if summary is not None:
+                summary = stats.stats_box_summary(summary, by=y)
+            else:
+                summary = self.stats(data).box_summary(x, by=y, fliers=suppress_outliers)
+
+        # categories in the order of the summaries
+        encoding = encode.CategoryEncoding(pd.Categorical(summary.index, categories=summary.index))
+
+        # create horizontal box plot from the summaries
+        util.util_box_plot(
+            ax,
+            summary,
+            colors=encoding.colors(color_map),
+            vert=False,
+            alpha=alpha,
+            show_fliers=suppress_outliers,
+        )
+    else:
+        import seaborn as sns
+
+        # category encoding, shared with other charts of the same data through the stats cache
+        encoding = self.stats(data).encoding(y)
+
+        # create horizontal box plot
+        g = sns.boxplot(
+            x=x,
+            y=y,
+            hue=y,
+            data=data,
+            orient="h",
+            order=encoding.order,
+            hue_order=encoding.order,
+            palette=sns.color_palette(encoding.colors(color_map)),
+            showfliers=suppress_outliers,
+            ax=ax,
+        ).set(xlabel=None, ylabel=None)
 
     # fade box plot figures by reducing alpha
-    plt.setp(ax.artists, alpha=alpha)
+    setp(ax.artists, alpha=alpha)
     ax.yaxis.set_visible(False)
 
     # tick label font size
@@ -418,24 +564,11 @@ def box_plot_h(self, x, y, data, color=style.style_grey, x_units="f", bbox=(1.05
     util.util_label_formatter(ax=ax, x_units=x_units)
 
     ## custom legend
-    # use legend labels if provided, otherwise use unique values in y column
-    if legend_labels is None:
-        legend_labels = np.unique(data[y].values)
-    else:
-        legend_labels = np.array(legend_labels)
-
-    # generate colors
-    color_list = style.color_gen(color_map, num=len(legend_labels))
-
-    label_color = {}
-    for ix, i in enumerate(legend_labels):
-        label_color[i] = color_list[ix]
-
-    # create legend Patches
-    patches = [Patch(color=v, label=k, alpha=alpha) for k, v in label_color.items()]
+    # one patch per category, labeled by legend labels if provided, otherwise by category
+    patches = encoding.legend_handles(color_map, alpha=alpha, labels=legend_labels)
 
     # draw legend
-    leg = plt.legend(
+    leg = ax.legend(
         handles=patches,
         fontsize=1.0 * self.chart_scale,
         loc="upper right",
@@ -446,43 +579,84 @@ def box_plot_h(self, x, y, data, color=style.style_grey, x_units="f", bbox=(1.05
 
     # label font color
     for text in leg.get_texts():
-        plt.setp(text, color="grey")
+        text.set_color("grey")
 
-def tree_map(self, counts, labels, colors, alpha=0.8, ax=None):
+def tree_map(self, counts, labels, colors, alpha=0.8, min_share=0.001, other_label="Other", ax=None):
     """
     Documentation:
 
         ---
         Description:
             Create treemap to visualize relative number of occurrences of each category in
-            a categorical column.
+            a categorical column. Categories holding less than min_share of the total are
+            collapsed into a single trailing category, the squarified layout is cached by the
+            counts, every rectangle is drawn in a single collection and only labels measured to
+            fit in their rectangle are drawn, so treemaps of tens of thousands of categories stay
+            responsive.
 
         ---
         Parameters:
             counts : list or array
-                List of counts for each category.
+                List of counts for each category. Counts sorted in descending order give the
+                squarest rectangles.
             labels : list or array
                 Labels for each category.
             colors : list or array
-                List of color codes to apply to each category.
+                List of color codes to apply to each category, cycled if shorter than counts.
             alpha : float, default=0.8
                 Controls transparency of bars. Accepts value between 0.0 and 1.0.
+            min_share : float, default=0.001
+                Categories with a smaller share of the total count are collapsed into one grey
+                category labeled other_label. 0 keeps every category with a positive count.
+            other_label : str, default="Other"
+                Label of the category that collects the collapsed counts.
             ax : axes object, default=None
                 Axis object for the visualization.
     """
     if ax is None:
         ax = self.ax
 
-    # draw treemap plot
-    squarify.plot(
-        sizes=counts,
-        label=labels,
-        color=colors,
-        alpha=alpha,
-        text_kwargs={
-            "fontsize" : 1.2 * self.chart_scale,
-            "color" : "black",
-            },
-        ax=ax,
-    )
-    plt.axis('off')
+    with profiling.phase("prep"):
+        counts = np.asarray(counts, dtype=np.float64)
+        labels = np.asarray(labels, dtype=object)
+        # color lists shorter than counts are cycled, and longer ones truncated
+        colors = np.resize(to_rgba_array(colors, alpha=alpha), (len(counts), 4))
+
+        # collapse the long tail into a single category, keeping the others in their given order.
+        # categories without a positive count have no area and are dropped
+        tail = (counts > 0) & (counts < min_share * counts.sum())
+        keep = (counts > 0) & ~tail
+        other = counts[tail].sum()
+
+        labels, colors, counts = labels[keep], colors[keep], counts[keep]
+        if tail.any():
+            labels = np.append(labels, other_label)
+            colors = np.vstack((colors, to_rgba_array(style.style_grey, alpha=alpha)))
+            counts = np.append(counts, other)
+
+        rects = layout.layout_treemap(counts, dx=100, dy=100)
+
+        # corners of each rectangle, counterclockwise from the bottom left
+        x, y, dx, dy = rects.T
+        verts = np.empty((len(rects), 4, 2))
+        verts[:, :, 0] = x[:, None] + dx[:, None] * [0, 1, 1, 0]
+        verts[:, :, 1] = y[:, None] + dy[:, None] * [0, 0, 1, 1]
+
+    # draw every rectangle in a single collection
+    ax.add_collection(PolyCollection(verts, facecolors=colors, edgecolors="none"))
+    ax.set_xlim(0, 100)
+    ax.set_ylim(0, 100)
+
+    # label each rectangle at its center, skipping rectangles too small to hold their measured label.
+    # only rectangles at least one line tall and one font size wide are measured
+    fontsize = 1.2 * self.chart_scale
+    width, height = util.util_axes_extent(ax)
+    candidates = np.flatnonzero((dx * width / 100 >= fontsize) & (dy * height / 100 >= 1.2 * fontsize))
+    fits = [ix for ix in candidates if dx[ix] * width / 100 >= util.util_text_extent(str(labels[ix]), fontsize)[0]]
+
+    for ix in fits:
+        ax.text(
+            x[ix] + dx[ix] / 2, y[ix] + dy[ix] / 2, labels[ix], va="center", ha="center", fontsize=fontsize,
+            color="black",
+        )
+    ax.axis("off")
@@ -0,0 +1,132 @@
+import numpy as np
+import pandas as pd
+from matplotlib.patches import Patch
+
+import prettierplot.style as style
+
+
+class CategoryEncoding:
+    """
+    Documentation:
+
+        ---
+        Description:
+            Integer encoding of a categorical column, computed with a single factorization and
+            shared by every chart that groups, orders or colors by the column. Categorical data
+            reuses its codes. Levels are the sorted unique non-null values, or for categorical
+            data the categories that occur at least once, in category order. The color of each
+            level is derived from the levels, so a level has the same color in every chart that
+            uses the same color map. Returned by PrettierPlot.stats(data).encoding(column).
+
+        ---
+        Parameters:
+            values : array, Pandas Series or Pandas Categorical
+                Category values.
+
+        ---
+        Attributes:
+            codes : array
+                Position of each value's level in levels, or -1 for missing values.
+            levels : array
+                Unique non-null values.
+            counts : array
+                Number of occurrences of each level.
+    """
+
+    def __init__(self, values):
+        if isinstance(values, pd.Series):
+            values = values.values
+
+        if isinstance(values, pd.Categorical):
+            codes = values.codes
+            counts = np.bincount(codes[codes >= 0], minlength=len(values.categories))
+
+            # unused categories are not levels, so the codes of the others are renumbered
+            present = counts > 0
+            levels = np.asarray(values.categories)[present]
+            if not present.all():
+                renumber = np.append(np.cumsum(present) - 1, -1)
+                codes = renumber[codes]
+            counts = counts[present]
+        else:
+            codes, levels = pd.factorize(np.ravel(values), sort=True)
+            levels = np.asarray(levels)
+            counts = np.bincount(codes[codes >= 0], minlength=len(levels))
+
+        self.codes = codes
+        self.levels = levels
+        self.counts = counts
+        self.palettes = {}
+
+    def __len__(self):
+        return len(self.levels)
+
+    @property
+    def order(self):
+        """
+        Documentation:
+
+            ---
+            Description:
+                Levels as a list, as taken by the order and hue_order arguments of seaborn.
+        """
+        return self.levels.tolist()
+
+    @property
+    def nbytes(self):
+        """
+        Documentation:
+
+            ---
+            Description:
+                Approximate memory held by the encoding. Object levels are counted by their
+                pointers only.
+        """
+        return self.codes.nbytes + self.levels.nbytes + self.counts.nbytes
+
+    def colors(self, color_map="viridis"):
+        """
+        Documentation:
+
+            ---
+            Description:
+                One color per level from a color map, generated once per color map.
+
+            ---
+            Parameters:
+                color_map : str specifying built-in matplotlib colormap, default="viridis"
+                    Color map applied to plots.
+
+            ---
+            Returns:
+                color_list : list
+                    List of hex codes, one per level.
+        """
+        if color_map not in self.palettes:
+            self.palettes[color_map] = style.color_gen(color_map, num=len(self.levels))
+        return self.palettes[color_map]
+
+    def legend_handles(self, color_map="viridis", alpha=0.8, labels=None):
+        """
+        Documentation:
+
+            ---
+            Description:
+                Legend Patches, one per level, in the colors returned by colors.
+
+            ---
+            Parameters:
+                color_map : str specifying built-in matplotlib colormap, default="viridis"
+                    Color map applied to plots.
+                alpha : float, default=0.8
+                    Controls transparency of the Patches. Accepts value between 0.0 and 1.0.
+                labels : list, default=None
+                    Custom legend labels, one per level. None uses the levels.
+
+            ---
+            Returns:
+                patches : list
+                    List of matplotlib Patches.
+        """
+        labels = self.levels if labels is None else labels
+        return [Patch(color=color, label=label, alpha=alpha) for label, color in zip(labels, self.colors(color_map))]
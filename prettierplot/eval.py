@@ -6,8 +6,6 @@ import matplotlib.pyplot as plt
 import matplotlib.ticker as tkr
 from matplotlib.colors import ListedColormap, LinearSegmentedColormap
 
-import textwrap
-
 from sklearn.metrics import (
     auc,
     precision_score,
@@ -31,6 +29,7 @@ from sklearn.metrics import (
 
 from scipy import stats
 
+import prettierplot.profiling as profiling
 import prettierplot.style as style
 import prettierplot.util as util
 
@@ -55,8 +54,8 @@ def prob_plot(self, x, plot):
 
     # override title and axis labels.
     plot.set_title("")
-    plt.xlabel("")
-    plt.ylabel("")
+    plot.set_xlabel("")
+    plot.set_ylabel("")
 
     # format scattered dots.
     plot.get_lines()[0].set_markerfacecolor(style.style_white)
@@ -71,7 +70,7 @@ def prob_plot(self, x, plot):
     plot.tick_params(axis="both", colors=style.style_grey, labelsize=1.1 * self.chart_scale)
 
 def corr_heatmap(self, df, annot=False, columns=None, mask=False, color_map="viridis", vmin=-1.0, vmax=1.0,
-                        ax=None):
+                        fit_labels=False, ax=None):
     """
     Documentation:
 
@@ -98,16 +97,24 @@ def corr_heatmap(self, df, annot=False, columns=None, mask=False, color_map="vir
                 Minimum anchor value for color map.
             vmax : float, default=1.0
                 Maximum anchor value for color map.
+            fit_labels : bool, default=False
+                Size tick labels by their measured extent so that they fit their cells, and show
+                only every n-th label when they cannot fit at a legible size. By default, label
+                size is chosen by the number of columns.
             ax : axes object, default=None
                 Axis object for the visualization.
     """
+    if ax is None:
+        ax = self.ax
+
     # create correlation matrix
-    corr_matrix = df[columns].corr() if columns is not None else df.corr()
-    columns = corr_matrix.columns
+    with profiling.phase("prep"):
+        corr_matrix = self.stats(df).corr(columns)
+        columns = corr_matrix.columns
 
-    # generate a mask for the upper triangle
-    mask_grid = np.zeros_like(corr_matrix, dtype=np.bool)
-    mask_grid[np.triu_indices_from(mask_grid)] = True
+        # generate a mask for the upper triangle
+        mask_grid = np.zeros_like(corr_matrix, dtype=np.bool)
+        mask_grid[np.triu_indices_from(mask_grid)] = True
 
     # dynamically adjust font size based on number of columns in dataset
     if len(columns) <= 5:
@@ -133,38 +140,37 @@ def corr_heatmap(self, df, annot=False, columns=None, mask=False, color_map="vir
         annot_kws={"size": font_adjust * self.chart_scale},
         square=False,
         ax=ax,
-        xticklabels=True,
-        yticklabels=True,
+        xticklabels=False,
+        yticklabels=False,
         cmap=color_map,
     )
 
-    # format x_tick and y_tick labels
-    g.set_yticklabels(g.get_yticklabels(), rotation=0, fontsize=font_adjust * self.chart_scale)
-    g.set_xticklabels(g.get_xticklabels(), rotation=90, fontsize=font_adjust * self.chart_scale)
-
-    # wrap lables if necessary
-    x_labels =[item.get_text() for item in ax.get_xticklabels()]
-    y_labels =[item.get_text() for item in ax.get_yticklabels()]
-
-    # wrap long x-tick labels
-    plt.xticks(
-        np.arange(len(x_labels)) + 0.5,
-        [
-            "\n".join(textwrap.wrap(str(i).replace("_", " "), 12))
-            for i in x_labels
-        ],
-        ha="center",
-    )
+    # tick labels are placed here rather than by seaborn, which draws the whole figure to check
+    # whether its own labels overlap. labels come straight from the correlation matrix columns
+    positions = np.arange(len(columns)) + 0.5
+    if fit_labels:
+        util.util_fit_tick_labels(ax, "x", positions, columns, 1.25 * self.chart_scale, rotation=90, ha="center")
+        util.util_fit_tick_labels(
+            ax, "y", positions, columns, 1.25 * self.chart_scale, rotation=0, va="center_baseline"
+        )
+    else:
+        # wrap long x-tick labels
+        ax.set_xticks(positions)
+        ax.set_xticklabels(
+            [util.util_wrap_label(str(i)) for i in columns],
+            rotation=90,
+            ha="center",
+            fontsize=font_adjust * self.chart_scale,
+        )
 
-    # wrap long y-tick labels
-    plt.yticks(
-        np.arange(len(y_labels)) + 0.5,
-        [
-            "\n".join(textwrap.wrap(str(i).replace("_", " "), 12))
-            for i in y_labels
-        ],
-        va="center_baseline",
-    )
+        # wrap long y-tick labels
+        ax.set_yticks(positions)
+        ax.set_yticklabels(
+            [util.util_wrap_label(str(i)) for i in columns],
+            rotation=0,
+            va="center_baseline",
+            fontsize=font_adjust * self.chart_scale,
+        )
 
     # customize color bar formatting and labeling.
     cbar = g.collections[0].colorbar
@@ -207,14 +213,16 @@ def corr_heatmap_target(self, df, target, annot=False, thresh=0.2, color_map="vi
             ax : axes object, default=None
                 Axis object for the visualization.
     """
-    # combine dataset of independent variables with target variable
-    df = df.merge(target, left_index=True, right_index=True)
-
-    # create correlation coefficient matrix, limit to target feature, and
-    # filter by threshold values.
-    corr_matrix = df.corr()
-    corr_top = corr_matrix[target.name]  # [:_1]
-    corr_top = corr_top[abs(corr_top) > thresh].sort_values(ascending=False)
+    if ax is None:
+        ax = self.ax
+
+    # correlate each independent variable with the target variable, and
+    # filter by threshold values. the target leads with a coefficient of 1.0
+    with profiling.phase("prep"):
+        corr_top = pd.concat(
+            [pd.Series([1.0], index=[target.name]), self.stats(df).corrwith(target)]
+        )
+        corr_top = corr_top[abs(corr_top) > thresh].sort_values(ascending=False, kind="stable")
 
     # dynamically adjust font size based on number of columns in dataset
     if len(corr_top) <= 5:
@@ -232,21 +240,25 @@ def corr_heatmap_target(self, df, target, annot=False, thresh=0.2, color_map="vi
 
     # create heatmap using correlation matrix
     g = sns.heatmap(
-        df[corr_top.index].corr().iloc[:, :1],
+        corr_top.to_frame(name=target.name),
         vmin=-1.0,
         vmax=1.0,
         annot=annot,
         annot_kws={"size": font_adjust * self.chart_scale},
         square=False,
         ax=ax,
-        xticklabels=True,
-        yticklabels=True,
+        xticklabels=False,
+        yticklabels=False,
         cmap=color_map,
     )
 
+    # label each row with its feature, without seaborn's full figure draw to check for overlaps
+    ax.set_yticks(np.arange(len(corr_top)) + 0.5)
+    ax.set_yticklabels([str(i) for i in corr_top.index], va="center")
+
     # format y-tick labels and turn off xticks
-    g.set_yticklabels(g.get_yticklabels(), rotation=0, fontsize=font_adjust * self.chart_scale)
-    plt.xticks([])
+    util.util_label_formatter(ax=ax, y_rotate=0, y_size=font_adjust * self.chart_scale)
+    ax.set_xticks([])
 
     # customize color bar formatting and labeling
     cbar = g.collections[0].colorbar
@@ -255,7 +267,8 @@ def corr_heatmap_target(self, df, target, annot=False, thresh=0.2, color_map="vi
     )
     cbar.set_ticks([vmax, 0.0, vmin])
 
-    plt.show()
+    if self.interactive:
+        plt.show()
 
 def roc_curve_plot(self, model, X_train, y_train, X_valid=None, y_valid=None, linecolor=style.style_grey,
                         bbox=(1.0, 0.4), ax=None):
@@ -289,20 +302,21 @@ def roc_curve_plot(self, model, X_train, y_train, X_valid=None, y_valid=None, li
     """
     ## return prediction probabilities
     # if X_valid is None then fit the model using training data and return ROC curve for training data
-    if X_valid is None:
-        probas = model.fit(X_train, y_train).predict_proba(X_train)
-        fpr, tpr, thresholds = roc_curve(
-            y_true=y_train, y_score=probas[:, 1], pos_label=1
-        )
-    # otherwise fit the model using training data and return ROC curve for validation data
-    else:
-        probas = model.fit(X_train, y_train).predict_proba(X_valid)
-        fpr, tpr, thresholds = roc_curve(
-            y_true=y_valid, y_score=probas[:, 1], pos_label=1
-        )
-
-    # calculate area under the curve using fpr and tpr
-    roc_auc = auc(fpr, tpr)
+    with profiling.phase("prep"):
+        if X_valid is None:
+            probas = model.fit(X_train, y_train).predict_proba(X_train)
+            fpr, tpr, thresholds = roc_curve(
+                y_true=y_train, y_score=probas[:, 1], pos_label=1
+            )
+        # otherwise fit the model using training data and return ROC curve for validation data
+        else:
+            probas = model.fit(X_train, y_train).predict_proba(X_valid)
+            fpr, tpr, thresholds = roc_curve(
+                y_true=y_valid, y_score=probas[:, 1], pos_label=1
+            )
+
+        # calculate area under the curve using fpr and tpr
+        roc_auc = auc(fpr, tpr)
 
     # plot ROC curve
     self.line(
@@ -364,33 +378,39 @@ def decision_region(self, x, y, estimator, test_idx=None, resolution=0.1, bbox=(
             ax : axes object, default=None
                 Axis object for the visualization.
     """
+    if ax is None:
+        ax = self.ax
+
     # generate color list
-    color_list = style.color_gen(name=color_map, num=len(np.unique(y)))
+    encoding = self.stats(y).encoding()
+    classes = encoding.levels
+    color_list = encoding.colors(color_map)
 
     # objects for marker generator and color map
     cmap = ListedColormap(color_list)
 
     # plot decision surface
-    x1_min, x1_max = x[:, 0].min() - 1, x[:, 0].max() + 1
-    x2_min, x2_max = x[:, 1].min() - 1, x[:, 1].max() + 1
+    with profiling.phase("prep"):
+        x1_min, x1_max = x[:, 0].min() - 1, x[:, 0].max() + 1
+        x2_min, x2_max = x[:, 1].min() - 1, x[:, 1].max() + 1
 
-    # generate meshgrid indices
-    xx1, xx2 = np.meshgrid(
-        np.arange(x1_min, x1_max, resolution), np.arange(x2_min, x2_max, resolution)
-    )
+        # generate meshgrid indices
+        xx1, xx2 = np.meshgrid(
+            np.arange(x1_min, x1_max, resolution), np.arange(x2_min, x2_max, resolution)
+        )
 
-    # generate predictions using estimator for all points on grid
-    z = estimator.predict(np.array([xx1.ravel(), xx2.ravel()]).T)
+        # generate predictions using estimator for all points on grid
+        z = estimator.predict(np.array([xx1.ravel(), xx2.ravel()]).T)
 
-    # reshape the predictions and apply coloration
-    z = z.reshape(xx1.shape)
-    plt.contourf(xx1, xx2, z, alpha=0.3, cmap=cmap)
-    plt.xlim(xx1.min(), xx1.max())
-    plt.ylim(xx2.min(), xx2.max())
+        # reshape the predictions and apply coloration
+        z = z.reshape(xx1.shape)
+    ax.contourf(xx1, xx2, z, alpha=0.3, cmap=cmap)
+    ax.set_xlim(xx1.min(), xx1.max())
+    ax.set_ylim(xx2.min(), xx2.max())
 
     # plot samples
-    for idx, cl in enumerate(np.unique(y)):
-        plt.scatter(
+    for idx, cl in enumerate(classes):
+        ax.scatter(
             x=x[y == cl, 0],
             y=x[y == cl, 1],
             alpha=1.0,
@@ -403,7 +423,7 @@ def decision_region(self, x, y, estimator, test_idx=None, resolution=0.1, bbox=(
     # highlight test samples
     if test_idx:
         x_test = x[test_idx, :]
-        plt.scatter(
+        ax.scatter(
             x_test[:, 0],
             x_test[:, 1],
             facecolor="none",
@@ -416,7 +436,7 @@ def decision_region(self, x, y, estimator, test_idx=None, resolution=0.1, bbox=(
         )
 
     # add legend to figure
-    plt.legend(
+    ax.legend(
         loc="upper right",
         bbox_to_anchor=bbox,
         ncol=1,
@@ -424,4 +444,5 @@ def decision_region(self, x, y, estimator, test_idx=None, resolution=0.1, bbox=(
         fontsize=1.1 * self.chart_scale,
     )
 
-    plt.tight_layout()
+    with profiling.phase("layout"):
+        ax.figure.tight_layout()
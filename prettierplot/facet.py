@@ -1,16 +1,16 @@
+import matplotlib
 import numpy as np
 import seaborn as sns
-import matplotlib.pyplot as plt
 from matplotlib.patches import Patch
 
+import prettierplot.profiling as profiling
+import prettierplot.stats as stats
 import prettierplot.style as style
 import prettierplot.util as util
 
-import textwrap
-
 
 def facet_cat(self, df, feature, label_rotate=0, x_units="s", y_units="f", bbox=(1.2, 0.9), alpha=0.8,
-                legend_labels=None, color_map="viridis", ax=None):
+                legend_labels=None, color_map="viridis", fit_labels=False, ax=None):
     """
     Documentation:
 
@@ -43,44 +43,34 @@ def facet_cat(self, df, feature, label_rotate=0, x_units="s", y_units="f", bbox=
                 Custom legend labels.
             color_map : str specifying built-in matplotlib colormap, default="viridis"
                 Color map applied to plots.
+            fit_labels : bool, default=False
+                Size x-tick labels by their measured extent so that each fits under its group of
+                bars, and show only every n-th label when they cannot fit at a legible size. By
+                default, label size is chosen by the number of groups.
             ax : axes object, default=None
                 Axis object for the visualization.
     """
     if ax is None:
         ax = self.ax
 
-    ixs = np.arange(df.shape[0])
-    bar_width = 0.35
-
-    feature_dict = {}
-    for feature in df.columns[1:]:
-        feature_dict[feature] = df[feature].values.tolist()
+    # one row per group and one column per feature
+    values = df.iloc[:, 1:].to_numpy(dtype=np.float64)
+    n_groups, n_features = values.shape
+    ixs = np.arange(n_groups)
 
     # generate color list
     if isinstance(color_map, str):
-        color_list = style.color_gen(name=color_map, num=len(feature_dict.keys()))
+        color_list = style.color_gen(name=color_map, num=n_features)
     elif isinstance(color_map, list):
         color_list = color_map
 
-    for feature_ix, (k, v) in enumerate(feature_dict.items()):
-        plt.bar(
-            ixs + (bar_width * feature_ix),
-            feature_dict[k],
-            bar_width,
-            alpha=alpha,
-            color=color_list[feature_ix],
-            label=str(k),
-        )
+    # plot every bar of every feature as a single collection rather than one patch per bar
+    util.util_grouped_bars(ax, values, color_list, alpha=alpha)
 
     # wrap long x-tick labels
-    plt.xticks(
-        ixs[: df.shape[0]] + bar_width / 2,
-        [
-            "\n".join(textwrap.wrap(str(i).replace("_", " "), 12))
-            for i in df.iloc[:, 0].values
-        ],
-    )
-    plt.xticks(rotation=label_rotate)
+    ax.set_xticks(ixs)
+    ax.set_xticklabels([util.util_wrap_label(str(i)) for i in df.iloc[:, 0].values])
+    ax.tick_params(axis="x", labelrotation=label_rotate)
 
     ## create custom legend
     # create labels
@@ -98,7 +88,7 @@ def facet_cat(self, df, feature, label_rotate=0, x_units="s", y_units="f", bbox=
     patches = [Patch(color=v, label=k, alpha=alpha) for k, v in label_color.items()]
 
     # draw legend
-    leg = plt.legend(
+    leg = ax.legend(
         handles=patches,
         fontsize=0.95 * self.chart_scale,
         loc="upper right",
@@ -109,7 +99,7 @@ def facet_cat(self, df, feature, label_rotate=0, x_units="s", y_units="f", bbox=
 
     # label font color
     for text in leg.get_texts():
-        plt.setp(text, color="grey")
+        text.set_color("grey")
 
     ### general formatting
     # if data is float dtype, then format as a number
@@ -126,15 +116,20 @@ def facet_cat(self, df, feature, label_rotate=0, x_units="s", y_units="f", bbox=
     ax.tick_params(axis="both", colors=style.style_grey, labelsize=1.2 * self.chart_scale)
 
     # dynamically set x-axis label size
-    if 7 < len(feature_dict[feature]) <= 10:
+    if fit_labels:
+        util.util_fit_tick_labels(
+            ax, "x", ixs, df.iloc[:, 0].values, 1.2 * self.chart_scale, rotation=label_rotate
+        )
+    elif 7 < n_groups <= 10:
         ax.tick_params(axis="x", colors=style.style_grey, labelsize=0.9 * self.chart_scale)
-    elif 10 < len(feature_dict[feature]) <= 20:
+    elif 10 < n_groups <= 20:
         ax.tick_params(axis="x", colors=style.style_grey, labelsize=0.75 * self.chart_scale)
-    elif len(feature_dict[feature]) > 20:
+    elif n_groups > 20:
         ax.tick_params(axis="x", colors=style.style_grey, labelsize=0.6 * self.chart_scale)
 
 def facet_two_cat_bar(self, df, x, y, split, x_units=None, y_units=None, bbox=None, alpha=0.8,
-                        legend_labels=None, filter_nan=True, color_map="viridis", ax=None):
+                        legend_labels=None, filter_nan=True, color_map="viridis", mode="auto",
+                        summary_threshold=100000, summary=None, ax=None):
     """
     Documentation:
 
@@ -142,6 +137,11 @@ def facet_two_cat_bar(self, df, x, y, split, x_units=None, y_units=None, bbox=No
             Creates a series of bar plots that count a variable along the y_axis and separate the counts
             into bins based on two category variables.
 
+            In summary mode, the mean of y for every combination of x and split is computed in one
+            pass over the data, or taken from precomputed means, and the bars are drawn directly.
+            This scales to data far larger than seaborn can draw, and to tables whose raw rows
+            never leave the database.
+
         ---
         Parameters:
             df : Pandas DataFrame
@@ -171,45 +171,90 @@ def facet_two_cat_bar(self, df, x, y, split, x_units=None, y_units=None, bbox=No
                 Remove records that have a null value in the column specified by the 'x' parameter.
             color_map : str specifying built-in matplotlib colormap, default="viridis"
                 Color map applied to plots.
+            mode : str, default="auto"
+                How the bars are drawn.
+                - 'raw' - seaborn bar plot drawn from every row of df.
+                - 'summary' - bars drawn from the mean of every combination of x and split.
+                  Categories are sorted, or in category order for categorical data.
+                - 'auto' - 'summary' when summary is given or df has more than
+                  summary_threshold rows, otherwise 'raw'.
+            summary_threshold : int, default=100000
+                Number of rows above which mode='auto' switches to summary mode.
+            summary : Pandas DataFrame, default=None
+                Precomputed means, one row per combination of x and split, with columns x, split
+                and y. A pandas groupby result indexed by x and split is also accepted. See
+                stats.stats_group_mean. When given, df is not used and may be None.
             ax : axes object, default=None
                 Axis object for the visualization.
     """
     if ax is None:
         ax = self.ax
 
-    # remove nans from x columns
-    if filter_nan:
-        df = df.dropna(subset=[x])
-
-    # create bar plot
-    g = sns.barplot(
-        x=x,
-        y=y,
-        hue=split,
-        data=df,
-        palette=sns.color_palette(
-            style.color_gen("viridis", num=len(np.unique(df[split].values)))
-        ),
-        order=df[x].sort_values().drop_duplicates().values.tolist(),
-        hue_order=df[split].sort_values().drop_duplicates().values.tolist()
-        if split is not None
-        else None,
-        ax=ax,
-        ci=None,
-    )
+    if summary is not None:
+        mode = "summary"
+    elif mode == "auto":
+        mode = "summary" if len(df) > summary_threshold else "raw"
+    elif mode not in ("raw", "summary"):
+        raise ValueError("mode must be 'raw', 'summary' or 'auto', not '{}'".format(mode))
+
+    if mode == "summary":
+        # one mean per combination of x and split, in rows of x and columns of split
+        by = [x] if split is None else [x, split]
+        with profiling.phase("prep"):
+            if summary is not None:
+                summary = stats.stats_group_mean(summary, by, y)
+            else:
+                summary = self.stats(df).group_mean(y, by)
+
+            levels = self.stats(summary).encoding(x)
+            hue = self.stats(summary).encoding(split) if split is not None else None
+            hue_codes = hue.codes if split is not None else np.zeros(len(summary), dtype=int)
+
+            keep = (levels.codes >= 0) & (hue_codes >= 0)
+            means = np.full((len(levels), len(hue) if split is not None else 1), np.nan)
+            means[levels.codes[keep], hue_codes[keep]] = summary[y].to_numpy(dtype=np.float64)[keep]
+
+        # create bar plot
+        util.util_grouped_bars(
+            ax, means, hue.colors(color_map) if split is not None else style.color_gen(color_map, num=1), alpha=None
+        )
+        ax.set_xticks(np.arange(len(levels)))
+        ax.set_xticklabels([str(level) for level in levels.order])
+        ax.set_xlim(-0.5, len(levels) - 0.5)
+        ax.set_xlabel(x)
+        ax.set_ylabel(y)
+        g = ax
+    else:
+        # category encodings, shared with other charts of the same data through the stats cache
+        order = self.stats(df).encoding(x).order
+        hue = self.stats(df).encoding(split) if split is not None else None
+
+        # remove nans from x columns
+        if filter_nan:
+            df = df.dropna(subset=[x])
+
+        # create bar plot
+        g = sns.barplot(
+            x=x,
+            y=y,
+            hue=split,
+            data=df,
+            palette=sns.color_palette(
+                hue.colors(color_map) if split is not None else style.color_gen(color_map, num=1)
+            ),
+            order=order,
+            hue_order=hue.order if split is not None else None,
+            ax=ax,
+            ci=None,
+        )
 
-    # format x-tick labels
-    g.set_xticklabels(
-        g.get_xticklabels(),
-        rotation=0,
-        fontsize=1.05 * self.chart_scale,
-        color=style.style_grey,
-    )
-    # format y-tick labels
-    g.set_yticklabels(
-        g.get_yticklabels() * 100 if "p" in y_units else g.get_yticklabels(),
-        rotation=0,
-        fontsize=1.05 * self.chart_scale,
+    # use label formatter utility function to customize tick labels
+    util.util_label_formatter(
+        ax=ax,
+        x_units=x_units,
+        y_units=y_units,
+        x_size=1.05 * self.chart_scale,
+        y_size=1.05 * self.chart_scale,
         color=style.style_grey,
     )
     # format x-axis label
@@ -235,30 +280,12 @@ def facet_two_cat_bar(self, df, x, y, split, x_units=None, y_units=None, bbox=No
     )
 
     ## create custom legend
-    # create labels
     if split is not None:
-        if legend_labels is None:
-            legend_labels = (
-                df[df[split].notnull()][split]
-                .sort_values()
-                .drop_duplicates()
-                .values.tolist()
-            )
-        else:
-            legend_labels = np.array(legend_labels)
-
-        # generate colors
-        color_list = style.color_gen(color_map, num=len(legend_labels))
-
-        label_color = {}
-        for ix, i in enumerate(legend_labels):
-            label_color[i] = color_list[ix]
-
-        # create legend Patches
-        patches = [Patch(color=v, label=k, alpha=alpha) for k, v in label_color.items()]
+        # one patch per category, labeled by legend labels if provided, otherwise by category
+        patches = hue.legend_handles(color_map, alpha=alpha, labels=legend_labels)
 
         # draw legend
-        leg = plt.legend(
+        leg = ax.legend(
             handles=patches,
             fontsize=1.25 * self.chart_scale,
             loc="upper right",
@@ -269,10 +296,7 @@ def facet_two_cat_bar(self, df, x, y, split, x_units=None, y_units=None, bbox=No
 
         # label font color
         for text in leg.get_texts():
-            plt.setp(text, color="grey")
-
-        # use label formatter utility function to customize chart labels
-        util.util_label_formatter(ax=ax, x_units=x_units, y_units=y_units)
+            text.set_color("grey")
 
 def facet_cat_num_scatter(self, df, x, y, cat_row=None, cat_col=None, split=None, bbox=None, aspect=1, alpha=0.8,
                                 height=4, legend_labels=None, x_units="f", y_units="f", color_map="viridis"):
@@ -284,6 +308,9 @@ def facet_cat_num_scatter(self, df, x, y, cat_row=None, cat_col=None, split=None
             Creates scatter plots of two numeric variables and allows for faceting by up to two
             categorical variables along the column and/or row axes of the figure.
 
+            Not thread-safe: seaborn's FacetGrid creates the figure through pyplot. See
+            PrettierPlot.detach_figures.
+
         ---
         Parameters:
             df : Pandas DataFrame
@@ -320,40 +347,37 @@ def facet_cat_num_scatter(self, df, x, y, cat_row=None, cat_col=None, split=None
             color_map : str specifying built-in matplotlib colormap, default="viridis"
                 Color map applied to plots.
     """
-    # create FacetGrid object
-    g = sns.FacetGrid(
-        df,
-        col=cat_col,
-        row=cat_row,
-        hue=split,
-        palette=sns.color_palette(
-            style.color_gen(color_map, num=len(np.unique(df[split].values)))
-        ),
-        hue_order=df[split].sort_values().drop_duplicates().values.tolist()
-        if split is not None
-        else None,
-        height=height,
-        aspect=aspect,
-        margin_titles=True,
-    )
+    # category encoding, shared with other charts of the same data through the stats cache
+    hue = self.stats(df).encoding(split) if split is not None else None
+    color_list = hue.colors(color_map) if split is not None else style.color_gen(color_map, num=1)
 
-    # map scatter plot to FacetGrid object
-    g = g.map(plt.scatter, x, y, s=1.2 * self.chart_scale)
+    # create FacetGrid object
+    with profiling.phase("layout"):
+        g = sns.FacetGrid(
+            df,
+            col=cat_col,
+            row=cat_row,
+            hue=split,
+            palette=sns.color_palette(color_list),
+            hue_order=hue.order if split is not None else None,
+            height=height,
+            aspect=aspect,
+            margin_titles=True,
+        )
+    self.figures.append(g.fig)
+
+    # draw scatter plot on each facet axis directly rather than through pyplot's current axes
+    color_list = color_list if split is not None else [None]
+    for (row_ix, col_ix, hue_ix), facet_df in g.facet_data():
+        if facet_df.empty:
+            continue
+        g.facet_axis(row_ix, col_ix).scatter(
+            facet_df[x], facet_df[y], s=1.2 * self.chart_scale, color=color_list[hue_ix]
+        )
+    g.set_axis_labels(x, y)
 
     # format x any y ticklabels, x and y labels, and main title
     for ax in g.axes.flat:
-        _ = ax.set_yticklabels(
-            ax.get_yticklabels() * 100 if "p" in y_units else ax.get_yticklabels(),
-            rotation=0,
-            fontsize=0.8 * self.chart_scale,
-            color=style.style_grey,
-        )
-        _ = ax.set_xticklabels(
-            ax.get_xticklabels(),
-            rotation=0,
-            fontsize=0.8 * self.chart_scale,
-            color=style.style_grey,
-        )
         _ = ax.set_ylabel(
             ax.get_ylabel(),
             rotation=90,
@@ -374,7 +398,14 @@ def facet_cat_num_scatter(self, df, x, y, cat_row=None, cat_col=None, split=None
         )
 
         # custom tick label formatting
-        util.util_label_formatter(ax=ax, x_units=x_units, y_units=y_units)
+        util.util_label_formatter(
+            ax=ax,
+            x_units=x_units,
+            y_units=y_units,
+            x_size=0.8 * self.chart_scale,
+            y_size=0.8 * self.chart_scale,
+            color=style.style_grey,
+        )
 
         if ax.texts:
             # this contains the right ylabel text
@@ -393,30 +424,12 @@ def facet_cat_num_scatter(self, df, x, y, cat_row=None, cat_col=None, split=None
             ax.texts[0].remove()
 
     ## create custom legend
-    # create labels
     if split is not None:
-        if legend_labels is None:
-            legend_labels = (
-                df[df[split].notnull()][split]
-                .sort_values()
-                .drop_duplicates()
-                .values.tolist()
-            )
-        else:
-            legend_labels = np.array(legend_labels)
-
-        # generate colors
-        color_list = style.color_gen(color_map, num=len(legend_labels))
-
-        label_color = {}
-        for ix, i in enumerate(legend_labels):
-            label_color[i] = color_list[ix]
-
-        # create legend Patches
-        patches = [Patch(color=v, label=k, alpha=alpha) for k, v in label_color.items()]
+        # one patch per category, labeled by legend labels if provided, otherwise by category
+        patches = hue.legend_handles(color_map, alpha=alpha, labels=legend_labels)
 
         # draw legend
-        leg = plt.legend(
+        leg = g.axes.flat[-1].legend(
             handles=patches,
             fontsize=1.0 * self.chart_scale,
             loc="upper right",
@@ -427,7 +440,7 @@ def facet_cat_num_scatter(self, df, x, y, cat_row=None, cat_col=None, split=None
 
         # label font color
         for text in leg.get_texts():
-            plt.setp(text, color="grey")
+            text.set_color("grey")
 
 def facet_cat_num_hist(self, df, cat_row, cat_col, num_col, split, bbox=None, aspect=1, height=4, alpha=0.8,
                         legend_labels=None, x_units="f", y_units="f", color_map="viridis"):
@@ -439,6 +452,9 @@ def facet_cat_num_hist(self, df, cat_row, cat_col, num_col, split, bbox=None, as
             Creates histograms of one numeric variable, and each can optionally be split by a category to
             show two or more distributions. Allows for faceting by up to two category variables along the
             column and/or row axes of the figure.
+
+            Not thread-safe: seaborn's FacetGrid creates the figure through pyplot. See
+            PrettierPlot.detach_figures.
         
         ---
         Parameters:
@@ -475,30 +491,35 @@ def facet_cat_num_hist(self, df, cat_row, cat_col, num_col, split, bbox=None, as
                 Color map applied to plots.
 
     """
-    # create FacetGrid object
-    g = sns.FacetGrid(
-        df,
-        row=cat_row,
-        col=cat_col,
-        hue=split,
-        hue_order=df[split].sort_values().drop_duplicates().values.tolist()
-        if split is not None
-        else None,
-        palette=sns.color_palette(
-            style.color_gen(color_map, num=len(np.unique(df[split].values)))
-        ),
-        despine=True,
-        height=height,
-        aspect=aspect,
-        margin_titles=True,
-    )
+    # category encoding, shared with other charts of the same data through the stats cache
+    hue = self.stats(df).encoding(split) if split is not None else None
+    color_list = hue.colors(color_map) if split is not None else style.color_gen(color_map, num=1)
 
-    # map histogram to FacetGrid object
-    g.map(
-        plt.hist,
-        num_col,
-        alpha=alpha,
-    )
+    # create FacetGrid object
+    with profiling.phase("layout"):
+        g = sns.FacetGrid(
+            df,
+            row=cat_row,
+            col=cat_col,
+            hue=split,
+            hue_order=hue.order if split is not None else None,
+            palette=sns.color_palette(color_list),
+            despine=True,
+            height=height,
+            aspect=aspect,
+            margin_titles=True,
+        )
+    self.figures.append(g.fig)
+
+    # draw histogram on each facet axis directly rather than through pyplot's current axes
+    color_list = color_list if split is not None else [None]
+    for (row_ix, col_ix, hue_ix), facet_df in g.facet_data():
+        if facet_df.empty:
+            continue
+        g.facet_axis(row_ix, col_ix).hist(
+            facet_df[num_col], alpha=alpha, color=color_list[hue_ix]
+        )
+    g.set_axis_labels(num_col)
 
     # format x any y ticklabels, x and y labels, and main title
     for i, ax in enumerate(g.axes.flat):
@@ -521,24 +542,15 @@ def facet_cat_num_hist(self, df, cat_row, cat_col, num_col, split, bbox=None, as
             color=style.style_grey,
         )
 
-        # resize y tick labels
-        labels = ax.get_yticklabels()
-        if len(labels) > 0:
-            _ = ax.set_yticklabels(
-                ax.get_yticklabels(),
-                rotation=0,
-                fontsize=0.8 * self.chart_scale,
-                color=style.style_grey,
-            )
-        # resize x tick labels
-        labels = ax.get_xticklabels()
-        if len(labels) > 0:
-            _ = ax.set_xticklabels(
-                ax.get_xticklabels(),
-                rotation=0,
-                fontsize=0.8 * self.chart_scale,
-                color=style.style_grey,
-            )
+        # resize and format tick labels
+        util.util_label_formatter(
+            ax=ax,
+            x_units=x_units,
+            y_units=y_units,
+            x_size=0.8 * self.chart_scale,
+            y_size=0.8 * self.chart_scale,
+            color=style.style_grey,
+        )
 
         if ax.texts:
             # this contains the right ylabel text
@@ -557,30 +569,12 @@ def facet_cat_num_hist(self, df, cat_row, cat_col, num_col, split, bbox=None, as
             ax.texts[0].remove()
 
     ## create custom legend
-    # create labels
     if split is not None:
-        if legend_labels is None:
-            legend_labels = (
-                df[df[split].notnull()][split]
-                .sort_values()
-                .drop_duplicates()
-                .values.tolist()
-            )
-        else:
-            legend_labels = np.array(legend_labels)
-
-        # generate colors
-        color_list = style.color_gen(color_map, num=len(legend_labels))
-
-        label_color = {}
-        for ix, i in enumerate(legend_labels):
-            label_color[i] = color_list[ix]
-
-        # create legend Patches
-        patches = [Patch(color=v, label=k, alpha=alpha) for k, v in label_color.items()]
+        # one patch per category, labeled by legend labels if provided, otherwise by category
+        patches = hue.legend_handles(color_map, alpha=alpha, labels=legend_labels)
 
         # draw legend
-        leg = plt.legend(
+        leg = g.axes.flat[-1].legend(
             handles=patches,
             fontsize=1.0 * self.chart_scale,
             loc="upper right",
@@ -591,10 +585,11 @@ def facet_cat_num_hist(self, df, cat_row, cat_col, num_col, split, bbox=None, as
 
         # label font color
         for text in leg.get_texts():
-            plt.setp(text, color="grey")
+            text.set_color("grey")
 
 def facet_two_cat_point(self, df, x, y, split, cat_col=None, cat_row=None, bbox=None, aspect=1,
-                                alpha=0.8, height=4, legend_labels=None, color_map="viridis"):
+                                alpha=0.8, height=4, legend_labels=None, color_map="viridis", mode="auto",
+                                summary_threshold=100000, summary=None):
     """
     Documentation:
         
@@ -602,6 +597,13 @@ def facet_two_cat_point(self, df, x, y, split, cat_col=None, cat_row=None, bbox=
         Description:
             Creates pointplots of one categorical variable, and each can optionally be split by
             two additional categories along the column and/or row axes of the figure.
+
+            In summary mode, the mean of y for every combination of x, split, cat_col and cat_row
+            is computed in one pass over the data, or taken from precomputed means, and the points
+            are drawn directly on each facet.
+
+            Not thread-safe: seaborn's FacetGrid creates the figure through pyplot. See
+            PrettierPlot.detach_figures.
         
         ---
         Parameters:
@@ -630,26 +632,93 @@ def facet_two_cat_point(self, df, x, y, split, cat_col=None, cat_row=None, bbox=
                 Custom legend labels.
             color_map : str specifying built-in matplotlib colormap, default="viridis"
                 Color map applied to plots.
+            mode : str, default="auto"
+                How the points are drawn.
+                - 'raw' - seaborn point plots drawn from every row of df.
+                - 'summary' - points drawn from the mean of every combination of x, split,
+                  cat_col and cat_row. Categories are sorted, or in category order for
+                  categorical data.
+                - 'auto' - 'summary' when summary is given or df has more than
+                  summary_threshold rows, otherwise 'raw'.
+            summary_threshold : int, default=100000
+                Number of rows above which mode='auto' switches to summary mode.
+            summary : Pandas DataFrame, default=None
+                Precomputed means, one row per combination of x, split, cat_col and cat_row, with
+                a column for each and the mean in column y. A pandas groupby result indexed by
+                them is also accepted. See stats.stats_group_mean. When given, df is not used
+                and may be None.
     """
-    # create FacetGrid object
-    g = sns.FacetGrid(
-        df, row=cat_row, col=cat_col, aspect=aspect, height=height, margin_titles=True
-    )
+    if summary is not None:
+        mode = "summary"
+    elif mode == "auto":
+        mode = "summary" if len(df) > summary_threshold else "raw"
+    elif mode not in ("raw", "summary"):
+        raise ValueError("mode must be 'raw', 'summary' or 'auto', not '{}'".format(mode))
+
+    if mode == "summary":
+        # one mean per combination, so the facet grid and its subsets hold only the means
+        by = [name for name in (x, split, cat_row, cat_col) if name is not None]
+        with profiling.phase("prep"):
+            if summary is not None:
+                df = stats.stats_group_mean(summary, by, y)
+            else:
+                df = self.stats(df).group_mean(y, by)
 
-    # map pointplot to FacetGrid object
-    g.map(
-        sns.pointplot,
-        x,
-        y,
-        split,
-        order=df[x].sort_values().drop_duplicates().values.tolist(),
-        hue_order=df[split].sort_values().drop_duplicates().values.tolist(),
-        palette=sns.color_palette(
-            style.color_gen(color_map, num=len(np.unique(df[split].values)))
-        ),
-        alpha=alpha,
-        ci=None,
-    )
+    # create FacetGrid object
+    with profiling.phase("layout"):
+        g = sns.FacetGrid(
+            df, row=cat_row, col=cat_col, aspect=aspect, height=height, margin_titles=True
+        )
+    self.figures.append(g.fig)
+
+    # draw pointplot on each facet axis directly rather than through pyplot's current axes
+    # category encodings, shared with other charts of the same data through the stats cache
+    levels = self.stats(df).encoding(x)
+    hue = self.stats(df).encoding(split)
+    palette = sns.color_palette(hue.colors(color_map))
+    for (row_ix, col_ix, _), facet_df in g.facet_data():
+        if facet_df.empty:
+            continue
+        facet_ax = g.facet_axis(row_ix, col_ix)
+
+        if mode == "summary":
+            # means of the facet in rows of x and columns of split, one line per split
+            rows = df.index.get_indexer(facet_df.index)
+            x_codes, hue_codes = levels.codes[rows], hue.codes[rows]
+            keep = (x_codes >= 0) & (hue_codes >= 0)
+            means = np.full((len(levels), len(hue)), np.nan)
+            means[x_codes[keep], hue_codes[keep]] = facet_df[y].to_numpy(dtype=np.float64)[keep]
+
+            # line and marker sizes of seaborn's point plots
+            linewidth = 1.8 * matplotlib.rcParams["lines.linewidth"]
+            for hue_ix, color in enumerate(palette):
+                facet_ax.plot(
+                    np.arange(len(levels)),
+                    means[:, hue_ix],
+                    color=color,
+                    marker="o",
+                    linewidth=linewidth,
+                    markersize=linewidth * np.sqrt(2 * np.pi),
+                    markeredgewidth=0.75 * linewidth,
+                    alpha=alpha,
+                )
+            facet_ax.set_xticks(np.arange(len(levels)))
+            facet_ax.set_xticklabels([str(level) for level in levels.order])
+            facet_ax.set_xlim(-0.5, len(levels) - 0.5)
+        else:
+            sns.pointplot(
+                x=x,
+                y=y,
+                hue=split,
+                data=facet_df,
+                order=levels.order,
+                hue_order=hue.order,
+                palette=palette,
+                alpha=alpha,
+                ci=None,
+                ax=facet_ax,
+            )
+    g.set_axis_labels(x, y)
 
     # format x any y ticklabels, x and y labels, and main title
     for ax in g.axes.flat:
@@ -672,24 +741,13 @@ def facet_two_cat_point(self, df, x, y, split, cat_col=None, cat_row=None, bbox=
             color=style.style_grey,
         )
 
-        # resize y tick labels
-        labels = ax.get_yticklabels()
-        if len(labels) > 0:
-            _ = ax.set_yticklabels(
-                ax.get_yticklabels(),
-                rotation=0,
-                fontsize=0.8 * self.chart_scale,
-                color=style.style_grey,
-            )
-        # resize x tick labels
-        labels = ax.get_xticklabels()
-        if len(labels) > 0:
-            _ = ax.set_xticklabels(
-                ax.get_xticklabels(),
-                rotation=0,
-                fontsize=0.8 * self.chart_scale,
-                color=style.style_grey,
-            )
+        # resize tick labels
+        util.util_label_formatter(
+            ax=ax,
+            x_size=0.8 * self.chart_scale,
+            y_size=0.8 * self.chart_scale,
+            color=style.style_grey,
+        )
 
         if ax.texts:
             # this contains the right ylabel text
@@ -709,24 +767,11 @@ def facet_two_cat_point(self, df, x, y, split, cat_col=None, cat_row=None, bbox=
             ax.texts[0].remove()
 
     ## create custom legend
-    # create labels
-    if legend_labels is None:
-        legend_labels = np.unique(df[df[split].notnull()][split])
-    else:
-        legend_labels = np.array(legend_labels)
-
-    # generate colors
-    color_list = style.color_gen(color_map, num=len(legend_labels))
-
-    label_color = {}
-    for ix, i in enumerate(legend_labels):
-        label_color[i] = color_list[ix]
-
-    # create legend Patches
-    patches = [Patch(color=v, label=k, alpha=alpha) for k, v in label_color.items()]
+    # one patch per category, labeled by legend labels if provided, otherwise by category
+    patches = hue.legend_handles(color_map, alpha=alpha, labels=legend_labels)
 
     # draw legend
-    leg = plt.legend(
+    leg = g.axes.flat[-1].legend(
         handles=patches,
         fontsize=1.0 * self.chart_scale,
         loc="upper right",
@@ -737,4 +782,4 @@ def facet_two_cat_point(self, df, x, y, split, cat_col=None, cat_row=None, bbox=
 
     # label font color
     for text in leg.get_texts():
-        plt.setp(text, color="grey")
+        text.set_color("grey")
@@ -0,0 +1,177 @@
+import numpy as np
+
+
+def kde_bin(x, weights, lo, hi, grid_size):
+    """
+    Documentation:
+
+        ---
+        Description:
+            Linearly bin values onto an evenly spaced grid. Each value splits its weight between
+            the two nearest grid points in proportion to its distance from each, which keeps the
+            binned estimate accurate to second order in the grid spacing.
+
+        ---
+        Parameters:
+            x : array
+                1-dimensional array of finite values within [lo, hi].
+            weights : array or None
+                Weight of each value. None gives every value a weight of 1.
+            lo : float
+                First grid point.
+            hi : float
+                Last grid point.
+            grid_size : int
+                Number of grid points.
+
+        ---
+        Returns:
+            counts : array
+                Binned weight at each grid point.
+    """
+    delta = (hi - lo) / (grid_size - 1)
+    pos = (x - lo) / delta
+    ix = np.minimum(pos.astype(np.intp), grid_size - 1)
+    frac = pos - ix
+
+    upper = frac if weights is None else frac * weights
+    lower = (1.0 - frac) if weights is None else (1.0 - frac) * weights
+
+    counts = np.bincount(ix, weights=lower, minlength=grid_size + 1)
+    counts[1:] += np.bincount(ix, weights=upper, minlength=grid_size + 1)[:-1]
+    return counts[:grid_size]
+
+
+def kde_bandwidth(grid, counts, n_eff, bw_method="scott", bw_adjust=1.0):
+    """
+    Documentation:
+
+        ---
+        Description:
+            Select a Gaussian kernel bandwidth from the binned data. The standard deviation is taken
+            from the moments of the binned counts, so selection costs O(grid) no matter how many
+            values were binned.
+
+        ---
+        Parameters:
+            grid : array
+                Grid points.
+            counts : array
+                Binned weight at each grid point.
+            n_eff : float
+                Number of observations, or the sum of the weights for weighted data.
+            bw_method : str or float, default="scott"
+                'scott' or 'silverman' rules of thumb, matching scipy.stats.gaussian_kde, or a float
+                used directly as the bandwidth factor.
+            bw_adjust : float, default=1.0
+                Multiplier applied to the selected bandwidth. Smaller values create more detailed curves.
+
+        ---
+        Returns:
+            bw : float
+                Kernel standard deviation in data units.
+    """
+    total = counts.sum()
+    mean = np.dot(grid, counts) / total
+    std = np.sqrt(max(np.dot((grid - mean) ** 2, counts) / total, 0.0))
+
+    if bw_method == "scott":
+        factor = n_eff ** (-1.0 / 5)
+    elif bw_method == "silverman":
+        factor = (n_eff * 3.0 / 4.0) ** (-1.0 / 5)
+    else:
+        factor = float(bw_method)
+
+    # a constant column has no spread. fall back to a unit bandwidth instead of a zero-width kernel
+    return (std if std > 0 else 1.0) * factor * bw_adjust
+
+
+def kde_estimate(x, weights=None, bw_method="scott", bw_adjust=1.0, grid_size=1024, cut=3):
+    """
+    Documentation:
+
+        ---
+        Description:
+            Gaussian kernel density estimate evaluated on a grid in O(n + grid log grid). Values are
+            linearly binned onto a grid spanning the data, the bandwidth is selected from the binned
+            moments, the grid is padded by cut bandwidths on each side, and the binned counts are
+            convolved with the sampled kernel using an FFT.
+
+        ---
+        Parameters:
+            x : array
+                Data for estimation. NaN and infinite values are ignored.
+            weights : array, default=None
+                Frequency weight of each value, e.g. the count of each distinct value in pre-aggregated
+                data. The estimate matches the one for the data expanded to one row per unit of weight.
+            bw_method : str or float, default="scott"
+                Bandwidth rule. See kde_bandwidth.
+            bw_adjust : float, default=1.0
+                Multiplier applied to the selected bandwidth.
+            grid_size : int, default=1024
+                Minimum number of grid points spanning the data. The grid is refined, up to 65536
+                points, when the bandwidth is narrow relative to the data range. The returned grid also
+                includes padding.
+            cut : float, default=3
+                Number of bandwidths the grid extends past the smallest and largest values.
+
+        ---
+        Returns:
+            support : array
+                Grid points.
+            density : array
+                Estimated density at each grid point. Integrates to 1.
+            bw : float
+                Selected kernel standard deviation in data units.
+    """
+    x = np.asarray(x, dtype=np.float64).ravel()
+    finite = np.isfinite(x)
+    if weights is not None:
+        weights = np.asarray(weights, dtype=np.float64).ravel()
+        finite &= np.isfinite(weights)
+        weights = weights[finite]
+    x = x[finite]
+
+    if len(x) == 0:
+        raise ValueError("kde_estimate requires at least one finite value")
+
+    total = float(len(x)) if weights is None else weights.sum()
+
+    lo, hi = x.min(), x.max()
+    if hi == lo:
+        # a constant column has no spread. center a unit-width grid on it and use a unit bandwidth
+        lo, hi = lo - 0.5, hi + 0.5
+        counts = kde_bin(x, weights, lo, hi, grid_size)
+        bw = kde_bandwidth(np.zeros(1), np.ones(1), total, bw_method=bw_method, bw_adjust=bw_adjust)
+    else:
+        # bin once over the data range and select the bandwidth from the binned moments
+        counts = kde_bin(x, weights, lo, hi, grid_size)
+        grid = np.linspace(lo, hi, grid_size)
+        bw = kde_bandwidth(grid, counts, total, bw_method=bw_method, bw_adjust=bw_adjust)
+
+        # long tails can leave the kernel narrower than a few grid cells. rebin on a finer grid
+        fine_size = min(int(np.ceil(4 * (hi - lo) / bw)) + 1, 65536)
+        if fine_size > grid_size:
+            grid_size = fine_size
+            counts = kde_bin(x, weights, lo, hi, grid_size)
+
+    delta = (hi - lo) / (grid_size - 1)
+
+    # extend the grid by cut bandwidths with the same spacing, so the binned counts are only padded
+    pad = int(np.ceil(cut * bw / delta))
+    counts = np.pad(counts, pad)
+    support = lo + delta * np.arange(-pad, grid_size + pad)
+
+    # gaussian kernel sampled at grid offsets, truncated at 4 bandwidths or the grid length
+    reach = min(int(np.ceil(4 * bw / delta)), len(counts) - 1)
+    offsets = delta * np.arange(-reach, reach + 1)
+    kernel = np.exp(-0.5 * (offsets / bw) ** 2)
+
+    # linear convolution through a zero-padded real FFT
+    size = len(counts) + len(kernel) - 1
+    n_fft = 1 << (size - 1).bit_length()
+    density = np.fft.irfft(np.fft.rfft(counts, n_fft) * np.fft.rfft(kernel, n_fft), n_fft)
+    density = density[reach:reach + len(counts)]
+
+    density = np.maximum(density, 0.0) / (total * bw * np.sqrt(2 * np.pi))
+    return support, density, bw
@@ -0,0 +1,137 @@
+import functools
+
+import numpy as np
+
+
+def layout_squarify(sizes, x=0.0, y=0.0, dx=100.0, dy=100.0):
+    """
+    Documentation:
+
+        ---
+        Description:
+            Squarified treemap layout of Bruls, Huizing and van Wijk, producing the same rectangles
+            as squarify.squarify. Rectangles are laid out in rows along the shorter side of the
+            remaining area, and a row grows while adding the next size does not worsen its most
+            elongated rectangle. Instead of re-laying out the row once per candidate size, the
+            aspect ratios of every candidate row are computed at once from a cumulative sum, so
+            the work per row is a handful of array operations and the layout of tens of thousands
+            of sizes takes milliseconds.
+
+        ---
+        Parameters:
+            sizes : array
+                Positive sizes normalized to the total area, i.e. summing to dx * dy. Sizes sorted
+                in descending order give the squarest rectangles.
+            x : float, default=0.0
+                Left edge of the area.
+            y : float, default=0.0
+                Bottom edge of the area.
+            dx : float, default=100.0
+                Width of the area.
+            dy : float, default=100.0
+                Height of the area.
+
+        ---
+        Returns:
+            rects : array
+                Array of shape (len(sizes), 4) holding the x, y, dx and dy of each rectangle, in
+                the order of sizes.
+    """
+    sizes = np.asarray(sizes, dtype=np.float64)
+    n = len(sizes)
+    rects = np.empty((n, 4))
+
+    start, window = 0, 64
+    while start < n:
+        remaining = sizes[start:]
+        side = dy if dx >= dy else dx
+
+        # worst aspect ratio of the rows holding the next 1, 2, ... sizes. every rectangle in a
+        # row has the same thickness, so the worst ratio belongs to its largest or smallest size
+        while True:
+            candidates = remaining[:window]
+            thickness = np.cumsum(candidates) / side
+            worst = np.maximum(
+                layout_ratio(np.maximum.accumulate(candidates), thickness),
+                layout_ratio(np.minimum.accumulate(candidates), thickness),
+            )
+
+            # the row stops growing at the first size that makes its worst ratio worse
+            worse = np.flatnonzero(worst[:-1] < worst[1:])
+            if len(worse) or len(candidates) == len(remaining):
+                count = worse[0] + 1 if len(worse) else len(candidates)
+                break
+            window *= 2
+
+        row = remaining[:count]
+        width = thickness[count - 1]
+        lengths = row / width
+        offsets = np.cumsum(np.concatenate(([0.0], lengths[:-1])))
+
+        # rows fill the height of wide areas and the width of tall areas
+        if dx >= dy:
+            rects[start:start + count] = np.column_stack(
+                (np.full(count, x), y + offsets, np.full(count, width), lengths)
+            )
+            x, dx = x + width, dx - width
+        else:
+            rects[start:start + count] = np.column_stack(
+                (x + offsets, np.full(count, y), lengths, np.full(count, width))
+            )
+            y, dy = y + width, dy - width
+
+        # the next row is likely to hold a similar number of sizes
+        start += count
+        window = max(64, 2 * count)
+    return rects
+
+
+def layout_ratio(size, thickness):
+    """
+    Documentation:
+
+        ---
+        Description:
+            Aspect ratio, at least 1, of a rectangle of a given area and thickness.
+    """
+    length = size / thickness
+    return np.maximum(thickness / length, length / thickness)
+
+
+def layout_treemap(sizes, dx=100.0, dy=100.0):
+    """
+    Documentation:
+
+        ---
+        Description:
+            Normalize sizes to an area of dx by dy with its bottom left corner at the origin and
+            return their squarified layout. Layouts are cached by the exact contents of sizes and
+            the area, so redrawing a treemap of unchanged counts skips the layout entirely.
+
+        ---
+        Parameters:
+            sizes : array
+                Positive sizes, in any units.
+            dx : float, default=100.0
+                Width of the area.
+            dy : float, default=100.0
+                Height of the area.
+
+        ---
+        Returns:
+            rects : array
+                Read-only array of shape (len(sizes), 4) holding the x, y, dx and dy of each
+                rectangle. See layout_squarify.
+    """
+    sizes = np.ascontiguousarray(sizes, dtype=np.float64)
+    return layout_treemap_cached(sizes.tobytes(), float(dx), float(dy))
+
+
+@functools.lru_cache(maxsize=64)
+def layout_treemap_cached(key, dx, dy):
+    sizes = np.frombuffer(key, dtype=np.float64)
+    rects = layout_squarify(sizes * (dx * dy) / sizes.sum(), 0.0, 0.0, dx, dy)
+
+    # cached results are shared between calls
+    rects.flags.writeable = False
+    return rects
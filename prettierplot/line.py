@@ -1,7 +1,6 @@
 import numpy as np
 import pandas as pd
 import seaborn as sns
-import matplotlib.pyplot as plt
 
 import prettierplot.style as style
 import prettierplot.util as util
@@ -76,7 +75,7 @@ def line(self, x, y, label=None, df=None, linecolor=style.style_grey, linestyle=
         y = y.reshape(-1, 1) if len(y.shape) == 1 else y
 
     # add line to plot
-    plt.plot(
+    ax.plot(
         x,
         y * 100 if "p" in y_units else y,
         color=linecolor,
@@ -91,7 +90,7 @@ def line(self, x, y, label=None, df=None, linecolor=style.style_grey, linestyle=
 
     # add legend to figure
     if label is not None:
-        plt.legend(
+        ax.legend(
             loc="upper right",
             bbox_to_anchor=bbox,
             ncol=1,
@@ -101,8 +100,10 @@ def line(self, x, y, label=None, df=None, linecolor=style.style_grey, linestyle=
 
     # optionally set axis lower / upper limits
     if axis_limits:
-        x_min, x_max, y_min, y_max = util.util_set_axes(x=x, y=y)
-        plt.axis([x_min, x_max, y_min, y_max])
+        x_min, x_max, y_min, y_max = util.util_set_axes(
+            x=x, y=y, x_extent=self.stats(x).extent(), y_extent=self.stats(y).extent()
+        )
+        ax.axis([x_min, x_max, y_min, y_max])
 
     # optionally create smaller buffer around plot area to prevent cutting off elements
     if plot_buffer:
@@ -116,23 +117,16 @@ def line(self, x, y, label=None, df=None, linecolor=style.style_grey, linestyle=
     if y_ticks is not None:
         ax.set_yticks(y_ticks)
 
-    # format x and y ticklabels
-    ax.set_yticklabels(
-        ax.get_yticklabels() * 100 if "p" in y_units else ax.get_yticklabels(),
-        rotation=0,
-        fontsize=1.0 * self.chart_scale,
-        color=style.style_grey,
-    )
-    ax.set_xticklabels(
-        ax.get_xticklabels() * 100 if "p" in y_units else ax.get_xticklabels(),
-        rotation=0,
-        fontsize=1.0 * self.chart_scale,
+    # axis tick label formatting
+    util.util_label_formatter(
+        ax=ax,
+        x_units=x_units,
+        y_units=y_units,
+        x_size=1.0 * self.chart_scale,
+        y_size=1.0 * self.chart_scale,
         color=style.style_grey,
     )
 
-    # axis tick label formatting
-    util.util_label_formatter(ax=ax, x_units=x_units, y_units=y_units)
-
 
 def multi_line(self, x, y, label=None, df=None, linecolor=None, linestyle=None, bbox=(1.2, 0.9), x_units="f",
                 x_ticks=None, y_units="f", y_ticks=None, marker_on=False, plot_buffer=False, axis_limits=False,
@@ -212,7 +206,7 @@ def multi_line(self, x, y, label=None, df=None, linecolor=None, linestyle=None,
     # add multiple lines to plot
     for ix in np.arange(y.shape[1]):
         y_col = y[:, ix]
-        plt.plot(
+        ax.plot(
             x,
             y_col * 100 if "p" in y_units else y_col,
             color=linecolor if linecolor is not None else color_list[ix],
@@ -227,7 +221,7 @@ def multi_line(self, x, y, label=None, df=None, linecolor=None, linestyle=None,
 
     # add legend to figure
     if label is not None:
-        plt.legend(
+        ax.legend(
             loc="upper right",
             bbox_to_anchor=bbox,
             ncol=1,
@@ -237,8 +231,10 @@ def multi_line(self, x, y, label=None, df=None, linecolor=None, linestyle=None,
 
     # optionally set axis lower / upper limits
     if axis_limits:
-        x_min, x_max, y_min, y_max = util.util_set_axes(x=x, y=y)
-        plt.axis([x_min, x_max, y_min, y_max])
+        x_min, x_max, y_min, y_max = util.util_set_axes(
+            x=x, y=y, x_extent=self.stats(x).extent(), y_extent=self.stats(y).extent()
+        )
+        ax.axis([x_min, x_max, y_min, y_max])
 
     # optionally create smaller buffer around plot area to prevent cutting off elements
     if plot_buffer:
@@ -252,20 +248,12 @@ def multi_line(self, x, y, label=None, df=None, linecolor=None, linestyle=None,
     if y_ticks is not None:
         ax.set_yticks(y_ticks)
 
-    # format x and y ticklabels
-    ax.set_yticklabels(
-        ax.get_yticklabels() * 100 if "p" in y_units else ax.get_yticklabels(),
-        rotation=0,
-        fontsize=1.1 * self.chart_scale,
-        color=style.style_grey,
-    )
-
-    ax.set_xticklabels(
-        ax.get_xticklabels() * 100 if "p" in y_units else ax.get_xticklabels(),
-        rotation=0,
-        fontsize=1.1 * self.chart_scale,
+    # axis tick label formatting
+    util.util_label_formatter(
+        ax=ax,
+        x_units=x_units,
+        y_units=y_units,
+        x_size=1.1 * self.chart_scale,
+        y_size=1.1 * self.chart_scale,
         color=style.style_grey,
     )
-
-    # axis tick label formatting
-    util.util_label_formatter(ax=ax, x_units=x_units, y_units=y_units)
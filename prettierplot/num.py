@@ -1,21 +1,28 @@
+import collections.abc
+import os
+import warnings
+
 import numpy as np
 import pandas as pd
 import seaborn as sns
 import matplotlib.pyplot as plt
+from matplotlib.lines import Line2D
 from matplotlib.patches import Patch
-from matplotlib.colors import ListedColormap, LinearSegmentedColormap
+from matplotlib.colors import ListedColormap, LinearSegmentedColormap, LogNorm, to_rgba_array
 
 from scipy.stats import linregress
 
+import prettierplot.profiling as profiling
+import prettierplot.stream as stream
 import prettierplot.style as style
 import prettierplot.util as util
-
-import textwrap
+from prettierplot.kde import kde_estimate
 
 
 def scatter_2d(self, x, y, df=None, x_units="f", x_ticks=None, y_units="f", y_ticks=None, plot_buffer=True,
                         size=5, axis_limits=True, color=style.style_grey, facecolor="w", alpha=0.8,
-                        x_rotate=None, ax=None):
+                        x_rotate=None, mode="auto", density_threshold=1000000, bins=None, color_map="viridis",
+                        log_scale=True, ax=None):
     """
     Documentation:
 
@@ -58,6 +65,21 @@ def scatter_2d(self, x, y, df=None, x_units="f", x_ticks=None, y_units="f", y_ti
                 Controls transparency of objects. Accepts value between 0.0 and 1.0.
             x_rotate : int, default=None
                 Rotates x-axis tick mark labels x degrees.
+            mode : str, default="auto"
+                Controls how points are drawn. Options include:
+                - 'points' - draw every point as a marker
+                - 'density' - count points on a grid and draw the counts as a single image. Render
+                  time stays roughly constant as the number of points grows
+                - 'auto' - 'density' when there are more than density_threshold points, otherwise 'points'
+            density_threshold : int, default=1000000
+                Number of points above which mode='auto' switches to a density image.
+            bins : int or tuple of ints, default=None
+                Number of grid cells along the x-axis and y-axis in density mode. Default matches the
+                axis' size in pixels, so each cell maps onto roughly one screen pixel.
+            color_map : str specifying built-in matplotlib colormap, default="viridis"
+                Color map applied to the density image.
+            log_scale : bool, default=True
+                Color the density image on a log scale so sparse regions remain visible next to dense ones.
             ax : axes object, default=None
                 Axis object for the visualization.
     """
@@ -73,21 +95,61 @@ def scatter_2d(self, x, y, df=None, x_units="f", x_ticks=None, y_units="f", y_ti
         x = x.reshape(-1, 1)
         y = y.reshape(-1, 1)
 
-    # plot 2-dimensional scatter
-    plt.scatter(
-        x=x,
-        y=y * 100 if "p" in y_units else y,
-        color=color,
-        s=size * self.chart_scale,
-        alpha=alpha,
-        facecolor=facecolor,
-        linewidth=0.167 * self.chart_scale,
-    )
+    # scale percentages before drawing so axis limits and density bins match what is plotted
+    if "p" in y_units:
+        y = y * 100
+
+    if mode == "auto":
+        mode = "density" if len(x) > density_threshold else "points"
+    elif mode not in ("points", "density"):
+        raise ValueError("mode must be 'points', 'density' or 'auto', not '{}'".format(mode))
+
+    # compute axis limits up front so the density grid spans exactly the visible area
+    x_extent, y_extent = self.stats(x).extent(), self.stats(y).extent()
+    if axis_limits:
+        x_min, x_max, y_min, y_max = util.util_set_axes(x=x, y=y, x_extent=x_extent, y_extent=y_extent)
+    else:
+        (x_min, x_max), (y_min, y_max) = x_extent, y_extent
+
+    if mode == "density":
+        # default to one grid cell per pixel of the axis
+        if bins is None:
+            extent = ax.get_window_extent()
+            bins = (max(int(extent.width), 1), max(int(extent.height), 1))
+        elif np.isscalar(bins):
+            bins = (bins, bins)
+
+        with profiling.phase("prep"):
+            counts = util.util_bin_2d(
+                x=x, y=y, bins=bins, x_range=(x_min, x_max), y_range=(y_min, y_max)
+            )
+
+        # empty cells are masked so the axis background shows through
+        ax.imshow(
+            np.ma.masked_equal(counts, 0),
+            extent=(x_min, x_max, y_min, y_max),
+            origin="lower",
+            aspect="auto",
+            interpolation="nearest",
+            cmap=color_map,
+            norm=LogNorm() if log_scale else None,
+            alpha=alpha,
+        )
+    else:
+        # plot 2-dimensional scatter
+        ax.scatter(
+            x=x,
+            y=y,
+            color=color,
+            s=size * self.chart_scale,
+            alpha=alpha,
+            facecolor=facecolor,
+            linewidth=0.167 * self.chart_scale,
+        )
 
     # optionally set axis lower / upper limits
     if axis_limits:
-        x_min, x_max, y_min, y_max = util.util_set_axes(x=x, y=y)
-        plt.axis([x_min, x_max, y_min, y_max])
+        ax.axis([x_min, x_max, y_min, y_max])
 
     # optionally create smaller buffer around plot area to prevent cutting off elements
     if plot_buffer:
@@ -101,34 +163,29 @@ def scatter_2d(self, x, y, df=None, x_units="f", x_ticks=None, y_units="f", y_ti
     if y_ticks is not None:
         ax.set_yticks(y_ticks)
 
-    # format x and y ticklabels
-    ax.set_yticklabels(
-        ax.get_yticklabels() * 100 if "p" in y_units else ax.get_yticklabels(),
-        rotation=0,
-        fontsize=1.0 * self.chart_scale,
-        color=style.style_grey,
-    )
-
-    ax.set_xticklabels(
-        ax.get_xticklabels() * 100 if "p" in y_units else ax.get_xticklabels(),
-        rotation=0,
-        fontsize=1.0 * self.chart_scale,
+    # use label formatter utility function to customize chart labels
+    util.util_label_formatter(
+        ax=ax,
+        x_units=x_units,
+        y_units=y_units,
+        x_rotate=x_rotate,
+        x_size=1.0 * self.chart_scale,
+        y_size=1.0 * self.chart_scale,
         color=style.style_grey,
     )
 
-    # use label formatter utility function to customize chart labels
-    util.util_label_formatter(ax=ax, x_units=x_units, y_units=y_units, x_rotate=x_rotate)
-
 def scatter_2d_hue(self, x, y, target, label, df=None, x_units="f", x_ticks=None, y_units="f", y_ticks=None,
                         plot_buffer=True, size=10, axis_limits=True, color=style.style_grey, facecolor="w",
-                        bbox=(1.2, 0.9), color_map="viridis", alpha=0.8, x_rotate=None, ax=None):
+                        bbox=(1.2, 0.9), color_map="viridis", alpha=0.8, x_rotate=None, single_artist=False,
+                        ax=None):
     """
     Documentation:
 
         ---
         Description:
             Create 2-dimensional scatter plot with a third dimension represented as a color hue in the
-            scatter dots.
+            scatter dots. Points are grouped by target value in a single pass, so the cost grows with
+            the number of rows rather than rows times classes.
 
         ---
         Parameters:
@@ -139,7 +196,8 @@ def scatter_2d_hue(self, x, y, target, label, df=None, x_units="f", x_ticks=None
             target : array or string
                 Either 1-dimensional array of values or a column name in a Pandas DataFrame.
             label : list
-                Labels corresponding to color hue.
+                Labels corresponding to color hue, in sorted order of the target values. If None, the
+                target values themselves are used.
             df : Pandas DataFrame, default=None
                 Pandas DataFrame containing data to plot. Can be any size - plotted columns will be
                 chosen by columns names specified in x and y parameters.
@@ -173,6 +231,12 @@ def scatter_2d_hue(self, x, y, target, label, df=None, x_units="f", x_ticks=None
                 Controls transparency of objects. Accepts value between 0.0 and 1.0.
             x_rotate : int, default=None
                 Rotates x-axis tick mark labels x degrees.
+            single_artist : bool, default=False
+                Draw every point in one collection with a per-point color array instead of one
+                collection per class. Artist creation no longer grows with the number of classes and
+                points are layered in their original order rather than class by class. Agg rasterizes
+                per-point colors more slowly than single-color collections, so this mainly pays off with
+                many classes or vector output formats.
             ax : axes object, default=None
                 Axis object for the visualization.
     """
@@ -180,38 +244,80 @@ def scatter_2d_hue(self, x, y, target, label, df=None, x_units="f", x_ticks=None
         ax = self.ax
 
     # if a Pandas DataFrame is passed to function, create x and y and target arrays using columns names
-    # passed into function. Also concatenates columns into single object
+    # passed into function. arrays stay columnar so string targets never upcast x and y to object
     if df is not None:
-        x = df[[x, y, target]].values
         x = df[x].values
         y = df[y].values
         target = df[target].values
-    # concatenate the x, y and target arrays
     else:
-        x = np.c_[x, y, target]
+        x = np.asarray(x).ravel()
+        y = np.asarray(y).ravel()
+        target = np.asarray(target).ravel()
 
-    # unique target values
-    target_ids = np.unique(x[:, 2])
+    with profiling.phase("prep"):
+        # encode target values as integer codes in sorted order. missing targets get code -1
+        encoding = self.stats(target).encoding()
+        codes, target_ids = encoding.codes, encoding.levels
 
-    # generate color list
-    color_list = style.color_gen(name=color_map, num=len(target_ids))
+        # stable sort groups row positions by class while keeping rows in order within each class
+        order = np.argsort(codes, kind="stable")
+        bounds = np.searchsorted(codes[order], np.arange(len(target_ids) + 1))
 
-    # loop through sets of target values, labels and colors to create 2_d scatter with hue
-    for target_id, target_name, color in zip(target_ids, label, color_list):
-        plt.scatter(
-            x=x[x[:, 2] == target_id][:, 0],
-            y=x[x[:, 2] == target_id][:, 1],
-            color=color,
-            label=target_name,
+    # generate color list
+    color_list = encoding.colors(color_map)
+    names = label if label is not None else target_ids
+
+    if single_artist:
+        # one collection colored per point, drawn in the original row order
+        keep = codes >= 0
+        ax.scatter(
+            x=x[keep],
+            y=y[keep],
+            edgecolors=to_rgba_array(color_list)[codes[keep]],
+            facecolor=facecolor,
             s=size * self.chart_scale,
             alpha=alpha,
-            facecolor="w",
             linewidth=0.234 * self.chart_scale,
         )
 
+        # proxy artists give the legend one handle per class
+        handles = [
+            Line2D(
+                [],
+                [],
+                linestyle="none",
+                marker="o",
+                markersize=np.sqrt(size * self.chart_scale),
+                markerfacecolor=facecolor,
+                markeredgecolor=color,
+                markeredgewidth=0.234 * self.chart_scale,
+                alpha=alpha,
+                label=target_name,
+            )
+            for target_name, color in zip(names, color_list)
+        ]
+    else:
+        # one collection per class, each drawn from its slice of the sorted row positions
+        handles = []
+        for ix, (target_name, color) in enumerate(zip(names, color_list)):
+            rows = order[bounds[ix]:bounds[ix + 1]]
+            handles.append(
+                ax.scatter(
+                    x=x[rows],
+                    y=y[rows],
+                    color=color,
+                    label=target_name,
+                    s=size * self.chart_scale,
+                    alpha=alpha,
+                    facecolor=facecolor,
+                    linewidth=0.234 * self.chart_scale,
+                )
+            )
+
     # add legend to figure
     if label is not None:
-        plt.legend(
+        ax.legend(
+            handles=handles,
             loc="upper right",
             bbox_to_anchor=bbox,
             ncol=1,
@@ -221,8 +327,10 @@ def scatter_2d_hue(self, x, y, target, label, df=None, x_units="f", x_ticks=None
 
     # optionally set axis lower / upper limits
     if axis_limits:
-        x_min, x_max, y_min, y_max = util.util_set_axes(x=x, y=y)
-        plt.axis([x_min, x_max, y_min, y_max])
+        x_min, x_max, y_min, y_max = util.util_set_axes(
+            x=x, y=y, x_extent=self.stats(x).extent(), y_extent=self.stats(y).extent()
+        )
+        ax.axis([x_min, x_max, y_min, y_max])
 
     # optionally create smaller buffer around plot area to prevent cutting off elements
     if plot_buffer:
@@ -236,33 +344,28 @@ def scatter_2d_hue(self, x, y, target, label, df=None, x_units="f", x_ticks=None
     if y_ticks is not None:
         ax.set_yticks(y_ticks)
 
-    # format x and y ticklabels
-    ax.set_yticklabels(
-        ax.get_yticklabels() * 100 if "p" in y_units else ax.get_yticklabels(),
-        rotation=0,
-        fontsize=1.0 * self.chart_scale,
-        color=style.style_grey,
-    )
-
-    ax.set_xticklabels(
-        ax.get_xticklabels() * 100 if "p" in y_units else ax.get_xticklabels(),
-        rotation=0,
-        fontsize=1.0 * self.chart_scale,
+    # use label formatter utility function to customize chart labels
+    util.util_label_formatter(
+        ax=ax,
+        x_units=x_units,
+        y_units=y_units,
+        x_rotate=x_rotate,
+        x_size=1.0 * self.chart_scale,
+        y_size=1.0 * self.chart_scale,
         color=style.style_grey,
     )
 
-    # use label formatter utility function to customize chart labels
-    util.util_label_formatter(ax=ax, x_units=x_units, y_units=y_units, x_rotate=x_rotate)
-
 def dist_plot(self, x, color, x_units="f", y_units="f", fit=None, kde=False, x_rotate=None, alpha=0.8,
-                    bbox=(1.2, 0.9), legend_labels=None, color_map="viridis", ax=None):
+                    bbox=(1.2, 0.9), legend_labels=None, color_map="viridis", weights=None, ax=None):
     """
     Documentation:
 
         ---
         Description:
             Creates distribution plot for numeric variable. Optionally overlays a kernel density
-            estimation curve.
+            estimation curve and a fitted distribution. Bar heights are normalized to a density
+            whenever a curve is overlaid. The kernel density curve comes from the binned FFT
+            estimator in prettierplot.kde.
 
         ---
         Parameters:
@@ -294,45 +397,62 @@ def dist_plot(self, x, color, x_units="f", y_units="f", fit=None, kde=False, x_r
                 Custom legend labels.
             color_map : str specifying built-in matplotlib colormap, default="viridis"
                 Color map applied to plots.
+            weights : array, default=None
+                Frequency weight of each value in x, e.g. counts of pre-aggregated data. Applied to the
+                histogram and the kernel density curve, but not to the fitted distribution.
             ax : axes object, default=None
                 Axis object for the visualization.
     """
     if ax is None:
         ax = self.ax
 
-    # create distribution plot with an optional fit curve
-    g = sns.distplot(
-        a=x,
-        kde=kde,
+    with profiling.phase("prep"):
+        x = np.asarray(x, dtype=np.float64).ravel()
+        finite = np.isfinite(x)
+        if weights is not None:
+            weights = np.asarray(weights, dtype=np.float64).ravel()[finite]
+        x = x[finite]
+
+        # Freedman-Diaconis bin count, capped at 50
+        q25, q75 = np.percentile(x, [25, 75])
+        width = 2 * (q75 - q25) / len(x) ** (1.0 / 3)
+        bins = min(int(np.ceil((x.max() - x.min()) / width)), 50) if width > 0 else int(np.sqrt(len(x)))
+
+        if kde:
+            support, density, _ = kde_estimate(x, weights=weights)
+
+    # draw histogram, normalized to a density when a curve is overlaid
+    ax.hist(
+        x,
+        bins=max(bins, 1),
+        weights=weights,
+        density=bool(kde) or fit is not None,
         color=color,
-        axlabel=False,
-        fit=fit,
-        kde_kws={"lw": 0.2 * self.chart_scale},
-        hist_kws={"alpha": alpha},
-        ax=ax,
+        alpha=alpha,
     )
 
-    # tick label font size
-    ax.tick_params(axis="both", colors=style.style_grey, labelsize=1.2 * self.chart_scale)
+    # overlay kernel density estimate
+    if kde:
+        ax.plot(support, density, color=color, lw=0.2 * self.chart_scale)
 
-    # format x and y ticklabels
-    ax.set_yticklabels(
-        ax.get_yticklabels() * 100 if "p" in y_units else ax.get_yticklabels(),
-        rotation=0,
-        fontsize=1.1 * self.chart_scale,
-        color=style.style_grey,
-    )
+    # overlay fitted distribution
+    if fit is not None:
+        params = fit.fit(x)
+        fit_x = support if kde else np.linspace(x.min(), x.max(), 200)
+        ax.plot(fit_x, fit.pdf(fit_x, *params), color="#282828", lw=0.2 * self.chart_scale)
 
-    ax.set_xticklabels(
-        ax.get_xticklabels() * 100 if "p" in y_units else ax.get_xticklabels(),
-        rotation=0,
-        fontsize=1.1 * self.chart_scale,
-        color=style.style_grey,
-    )
+    # tick label font size
+    ax.tick_params(axis="both", colors=style.style_grey, labelsize=1.2 * self.chart_scale)
 
     # use label formatter utility function to customize chart labels
     util.util_label_formatter(
-        ax=ax, x_units=x_units, y_units=y_units, x_rotate=x_rotate
+        ax=ax,
+        x_units=x_units,
+        y_units=y_units,
+        x_rotate=x_rotate,
+        x_size=1.1 * self.chart_scale,
+        y_size=1.1 * self.chart_scale,
+        color=style.style_grey,
     )
 
     ## create custom legend
@@ -352,7 +472,7 @@ def dist_plot(self, x, color, x_units="f", y_units="f", fit=None, kde=False, x_r
         patches = [Patch(color=v, label=k, alpha=alpha) for k, v in label_color.items()]
 
         # draw legend
-        leg = plt.legend(
+        leg = ax.legend(
             handles=patches,
             fontsize=1.0 * self.chart_scale,
             loc="upper right",
@@ -363,15 +483,18 @@ def dist_plot(self, x, color, x_units="f", y_units="f", fit=None, kde=False, x_r
 
         # label font color
         for text in leg.get_texts():
-            plt.setp(text, color="grey")
+            text.set_color("grey")
 
-def kde_plot(self, x, color, x_units="f", y_units="f", shade=False, line_width=0.25, bw=1.0, ax=None):
+def kde_plot(self, x, color, x_units="f", y_units="f", shade=False, line_width=0.25, bw=1.0, weights=None,
+                ax=None):
     """
     Documentation:
 
         ---
         Description:
-            Create kernel density curve for a feature.
+            Create kernel density curve for a feature. The density is estimated by linearly binning the
+            data onto a grid and convolving with a Gaussian kernel through an FFT, which runs in
+            O(n + grid log grid) rather than O(n x grid).
 
         ---
         Parameters:
@@ -392,48 +515,48 @@ def kde_plot(self, x, color, x_units="f", y_units="f", shade=False, line_width=0
             line_width : float or int, default= 0.25
                 Controlsthickness of kde lines
             bw : float, default=1.0
-                Scaling factor for the KDE curve. Smaller values create more detailed curves
+                Scaling factor for the KDE curve's bandwidth. Smaller values create more detailed curves
+            weights : array, default=None
+                Frequency weight of each value in x, e.g. counts of pre-aggregated data, so the data
+                does not need to be expanded to one row per observation.
             ax : axes object, default=None
                 Axis object for the visualization.
     """
     if ax is None:
         ax = self.ax
 
-    # create kernel density estimation line
-    g = sns.kdeplot(
-        data=x,
-        shade=shade,
-        color=color,
-        legend=None,
-        linewidth=self.chart_scale * line_width,
-        ax=ax
-    )
+    # estimate density on a grid
+    with profiling.phase("prep"):
+        support, density, _ = kde_estimate(x, weights=weights, bw_adjust=bw)
 
-    # format x and y ticklabels
-    ax.set_yticklabels(
-        ax.get_yticklabels() * 100 if "p" in y_units else ax.get_yticklabels(),
-        rotation=0,
-        fontsize=1.1 * self.chart_scale,
-        color=style.style_grey,
-    )
+    # create kernel density estimation line, anchored to zero on the y-axis
+    line, = ax.plot(support, density, color=color, linewidth=self.chart_scale * line_width)
+    line.sticky_edges.y.append(0)
 
-    ax.set_xticklabels(
-        ax.get_xticklabels() * 100 if "p" in y_units else ax.get_xticklabels(),
-        rotation=0,
-        fontsize=1.1 * self.chart_scale,
+    # optionally shade area under the curve
+    if shade:
+        ax.fill_between(support, density, color=color, alpha=0.25, linewidth=0)
+
+    # use label formatter utility function to customize chart labels
+    util.util_label_formatter(
+        ax=ax,
+        x_units=x_units,
+        y_units=y_units,
+        x_size=1.1 * self.chart_scale,
+        y_size=1.1 * self.chart_scale,
         color=style.style_grey,
     )
-    # use label formatter utility function to customize chart labels
-    util.util_label_formatter(ax=ax, x_units=x_units, y_units=y_units)
 
 def reg_plot(self, x, y, data, dot_color=style.style_grey, dot_size=2.0, line_color=style.style_blue, line_width = 0.3,
-            x_jitter=None, x_units="f", y_units="f", x_rotate=None, alpha=0.3, ax=None):
+            x_jitter=None, x_units="f", y_units="f", x_rotate=None, alpha=0.3, ci=95, band="confidence",
+            method="analytic", n_boot=1000, n_jobs=None, max_points=50000, stratify=None, seed=0, ax=None):
     """
     Documentation:
 
         ---
         Description:
-            create scatter plot with regression line.
+            create scatter plot with regression line. The ordinary least squares fit and its band are
+            computed on every row, while the scatter layer draws at most max_points rows.
 
         ---
         Parameters:
@@ -453,7 +576,7 @@ def reg_plot(self, x, y, data, dot_color=style.style_grey, dot_size=2.0, line_co
                 Regression line width.
             x_jitter : float, default=None
                 optional paramter for randomly displacing dots along the x_axis to enable easier
-                visibility of individual dots.
+                visibility of individual dots. Only the drawn dots are displaced, not the fitted data.
             x_units : str, default='f'
                 Determines unit of measurement for x-axis tick labels. 'f' displays float. 'p' displays
                 percentages, d' displays dollars. Repeat character (e.g 'ff' or 'ddd') for additional
@@ -466,58 +589,105 @@ def reg_plot(self, x, y, data, dot_color=style.style_grey, dot_size=2.0, line_co
                 Rotates x_axis tick mark labels x degrees.
             alpha : float, default=0.3
                 Controls transparency of objects. Accepts value between 0.0 and 1.0.
+            ci : float, default=95
+                Confidence level of the band around the regression line, in percent. None draws no band.
+            band : str, default="confidence"
+                'confidence' shades the interval for the mean response. 'prediction' shades the wider
+                interval for individual observations. Prediction bands require method='analytic'.
+            method : str, default="analytic"
+                'analytic' computes the band in closed form from the OLS standard errors and the t
+                distribution. 'bootstrap' refits the line on n_boot resamples of the rows.
+            n_boot : int, default=1000
+                Number of bootstrap resamples when method='bootstrap'.
+            n_jobs : int, default=None
+                Number of threads used for bootstrap resamples. None uses one thread, -1 uses all cores.
+            max_points : int, default=50000
+                Maximum number of rows drawn in the scatter layer. Larger datasets are randomly sampled.
+                None draws every row.
+            stratify : str, default=None
+                Name of a column in data. When set, the scatter sample keeps each of its groups in
+                proportion to its share of the rows.
+            seed : int, default=0
+                Seed for the scatter sample, the jitter and the bootstrap resamples.
             ax : axes object, default=None
                 Axis object for the visualization.
     """
     if ax is None:
         ax = self.ax
 
-    # create regression plot
-    g = sns.regplot(
-        x=x,
-        y=y,
-        data=data,
-        x_jitter=x_jitter,
-        scatter_kws={
-            "alpha": alpha,
-            "color": dot_color,
-            "s": dot_size * self.chart_scale,
-            },
-        line_kws={
-            "color": line_color,
-            "linewidth": self.chart_scale * line_width,
-            },
-        ax=ax,
-    ).set(xlabel=None, ylabel=None)
-
-    # format x and y ticklabels
-    ax.set_yticklabels(
-        ax.get_yticklabels() * 100 if "p" in y_units else ax.get_yticklabels(),
-        rotation=0,
-        fontsize=1.1 * self.chart_scale,
-        color=style.style_grey,
-    )
+    if band not in ("confidence", "prediction"):
+        raise ValueError("band must be 'confidence' or 'prediction', not '{}'".format(band))
+    if method not in ("analytic", "bootstrap"):
+        raise ValueError("method must be 'analytic' or 'bootstrap', not '{}'".format(method))
+    if band == "prediction" and method == "bootstrap":
+        raise ValueError("prediction bands are only available with method='analytic'")
+
+    with profiling.phase("prep"):
+        # drop rows missing either variable, selecting each column once in case x and y match
+        columns = [x, y] if stratify is None else [x, y, stratify]
+        frame = data[list(dict.fromkeys(columns))].dropna(subset=list(dict.fromkeys([x, y])))
+        x_values = frame[x].to_numpy(dtype=np.float64)
+        y_values = frame[y].to_numpy(dtype=np.float64)
+
+        # fit on every row and evaluate the line across the observed x range
+        fit = linregress(x_values, y_values)
+        grid = np.linspace(x_values.min(), x_values.max(), 100)
+        y_hat = fit.intercept + fit.slope * grid
+
+        if ci is not None and method == "analytic":
+            lower, upper = util.util_ols_band(x_values, y_values, fit, grid, ci=ci, band=band)
+        elif ci is not None:
+            lower, upper = util.util_ols_bootstrap(
+                x_values, y_values, grid, ci=ci, n_boot=n_boot, n_jobs=n_jobs, seed=seed
+            )
 
-    ax.set_xticklabels(
-        ax.get_xticklabels() * 100 if "p" in y_units else ax.get_xticklabels(),
-        rotation=0,
-        fontsize=1.1 * self.chart_scale,
-        color=style.style_grey,
+        # cap the scatter layer with a reproducible sample
+        rs = np.random.RandomState(seed)
+        rows = util.util_sample_rows(
+            len(frame),
+            max_points,
+            strata=None if stratify is None else frame[stratify].values,
+            random_state=rs,
+        )
+        x_scatter = x_values[rows]
+        y_scatter = y_values[rows]
+
+        if x_jitter is not None:
+            x_scatter = x_scatter + rs.uniform(-x_jitter, x_jitter, size=len(x_scatter))
+
+    # draw sampled points, the regression line and its band
+    ax.scatter(
+        x_scatter,
+        y_scatter,
+        color=dot_color,
+        s=dot_size * self.chart_scale,
+        alpha=alpha,
     )
+    ax.plot(grid, y_hat, color=line_color, linewidth=self.chart_scale * line_width)
+    if ci is not None:
+        ax.fill_between(grid, lower, upper, color=line_color, alpha=0.15, linewidth=0)
 
     # use label formatter utility function to customize chart labels
     util.util_label_formatter(
-        ax=ax, x_units=x_units, y_units=y_units, x_rotate=x_rotate
+        ax=ax,
+        x_units=x_units,
+        y_units=y_units,
+        x_rotate=x_rotate,
+        x_size=1.1 * self.chart_scale,
+        y_size=1.1 * self.chart_scale,
+        color=style.style_grey,
     )
 
-def pair_plot_custom(self, df, columns=None, color=style.style_blue, gradient_col=None):
+def pair_plot_custom(self, df, columns=None, color=style.style_blue, gradient_col=None, upper="corr", n_jobs=None):
     """
     Documentation:
 
         ---
         Description:
             Create pair plot that produces a grid of scatter plots for all unique pairs of
-            numeric features and a series of KDE plots along the diagonal.
+            numeric features and a series of KDE plots along the diagonal. Column arrays are
+            extracted once, per-panel statistics (masks, kernel density estimates, correlations)
+            are computed in a thread pool, and scatter plots are drawn only in the lower triangle.
 
         ---
         Parameters:
@@ -527,74 +697,118 @@ def pair_plot_custom(self, df, columns=None, color=style.style_blue, gradient_co
                 List of strings describing columns in Pandas DataFrame to be visualized. If None,
                 all columns are visualized.
             color : str, default=style.style_blue
-                Color applied to KDE along diagonal. Also used as the  high end of gradient if
-                a gradient_col is specified.
+                Color applied to KDE along diagonal and to the scatter plots. Also used as the high
+                end of gradient if a gradient_col is specified.
             gradient_col : str, default=None
                 Introduce third dimension to scatter plots through a color hue that differentiates
                 dots based on the category.
+            upper : str, default="corr"
+                Contents of the upper triangle. Options include:
+                - 'corr' - Pearson correlation coefficient of each pair
+                - 'blank' - nothing
+                - 'scatter' - mirrored scatter plots, as drawn in the lower triangle
+            n_jobs : int, default=None
+                Number of threads used to compute panel statistics. None uses one thread, -1 uses
+                all cores. Artists are always added from the calling thread.
     """
-    # custom plot formatting settings for this particular chart.
-    with plt.rc_context(
-        {
-            "axes.titlesize": 3.5 * self.chart_scale,
-            "axes.labelsize": 0.9 * self.chart_scale,  # axis title font size
-            "xtick.labelsize": 0.8 * self.chart_scale,
-            "xtick.major.size": 0.5 * self.chart_scale,
-            "xtick.major.width": 0.05 * self.chart_scale,
-            "xtick.color": style.style_grey,
-            "ytick.labelsize": 0.8 * self.chart_scale,
-            "ytick.major.size": 0.5 * self.chart_scale,
-            "ytick.major.width": 0.05 * self.chart_scale,
-            "ytick.color": style.style_grey,
-            "figure.facecolor": style.style_white,
-            "axes.facecolor": style.style_white,
-            "axes.spines.left": False,
-            "axes.spines.bottom": False,
-            "axes.spines.top": False,
-            "axes.spines.right": False,
-            "axes.edgecolor": style.style_grey,
-            "axes.grid": False,
-        }
-    ):
+    from concurrent.futures import ThreadPoolExecutor
 
-        # optionally limit to a subset of columns
-        if columns is not None:
-            df = df[columns]
+    if upper not in ("corr", "blank", "scatter"):
+        raise ValueError("upper must be 'corr', 'blank' or 'scatter', not '{}'".format(upper))
 
-        # ensure values are numeric to ensure that scattering works
-        df = util.number_coerce(df, columns=columns)
+    # custom plot formatting settings for this particular chart.
+    with style.rc_scope(style.rc_compile("pair_plot_custom", self.chart_scale)):
+
+        with profiling.phase("prep"):
+            # optionally limit to a subset of columns
+            if columns is not None:
+                df = df[columns]
+
+            # ensure values are numeric to ensure that scattering works
+            df = util.number_coerce(df, columns=columns)
+
+            # extract every column once
+            names = list(df.columns)
+            arrays = [df[name].values.astype(np.float64) for name in names]
+            finite = [np.isfinite(values) for values in arrays]
+
+            # one colormap and one normalized hue array for every panel
+            if gradient_col is not None:
+                hue = df[gradient_col].values.astype(np.float64)
+                cmap = LinearSegmentedColormap.from_list(name="", colors=["white", color])
+
+            def diagonal_panel(i):
+                return kde_estimate(arrays[i][finite[i]])
+
+            def pair_panel(i, j):
+                # rows where both columns are present, plus the pair's correlation
+                mask = finite[i] & finite[j]
+                x, y = arrays[j][mask], arrays[i][mask]
+                r = np.corrcoef(x, y)[0, 1] if len(x) > 1 else np.nan
+                return x, y, None if gradient_col is None else hue[mask], r
+
+            pairs = [(i, j) for i in range(len(names)) for j in range(i)]
+            if n_jobs is None or n_jobs == 1:
+                diagonals = [diagonal_panel(i) for i in range(len(names))]
+                panels = [pair_panel(i, j) for i, j in pairs]
+            else:
+                if n_jobs < 0:
+                    n_jobs = max(os.cpu_count() + 1 + n_jobs, 1)
+                with ThreadPoolExecutor(max_workers=n_jobs) as executor:
+                    diagonals = list(executor.map(diagonal_panel, range(len(names))))
+                    panels = list(executor.map(lambda pair: pair_panel(*pair), pairs))
 
         # create figure and axes
-        fig, axes = plt.subplots(
-            ncols=len(df.columns),
-            nrows=len(df.columns),
-            constrained_layout=True,
-            figsize=(1.2 * self.chart_scale, 0.9 * self.chart_scale),
-        )
-
-        # unpack axes
-        for (i, j), ax in np.ndenumerate(axes):
-            # set diagonal plots as kde plots
-            if i == j:
-                sns.kdeplot(df.iloc[:, i], ax=ax, legend=False, shade=True, color=color)
+        with profiling.phase("layout"):
+            fig = self.new_figure(
+                constrained_layout=True,
+                figsize=(1.2 * self.chart_scale, 0.9 * self.chart_scale),
+            )
+            axes = fig.subplots(ncols=len(names), nrows=len(names), squeeze=False)
 
-            # set lower triangle plots as scatter plots
+        def scatter_panel(ax, x, y, c, x_name, y_name):
+            if c is None:
+                ax.scatter(x, y, color=color, edgecolor="w", linewidth=0.05 * self.chart_scale)
             else:
-                sns.scatterplot(
-                    x=df.iloc[:, j],
-                    y=df.iloc[:, i],
-                    hue=gradient_col if gradient_col is None else df[gradient_col],
-                    data=df,
-                    palette=LinearSegmentedColormap.from_list(
-                        name="", colors=["white", color]
-                    ),
-                    legend=False,
-                    ax=ax,
-                )
-        plt.show()
+                ax.scatter(x, y, c=c, cmap=cmap, edgecolor="w", linewidth=0.05 * self.chart_scale)
+            ax.set_xlabel(x_name)
+            ax.set_ylabel(y_name)
+
+        # diagonal kde plots
+        for i, (support, density, _) in enumerate(diagonals):
+            ax = axes[i, i]
+            line, = ax.plot(support, density, color=color)
+            line.sticky_edges.y.append(0)
+            ax.fill_between(support, density, color=color, alpha=0.25, linewidth=0)
+            ax.set_xlabel(names[i])
+            ax.set_ylabel("Density")
+
+        # lower triangle scatter plots, with the upper triangle filled from the same statistics
+        for (i, j), (x, y, c, r) in zip(pairs, panels):
+            scatter_panel(axes[i, j], x, y, c, names[j], names[i])
+
+            if upper == "scatter":
+                scatter_panel(axes[j, i], y, x, c, names[i], names[j])
+            else:
+                axes[j, i].axis("off")
+                if upper == "corr":
+                    axes[j, i].text(
+                        0.5,
+                        0.5,
+                        "r = {:.2f}".format(r),
+                        ha="center",
+                        va="center",
+                        fontsize=1.2 * self.chart_scale,
+                        color=style.style_grey,
+                        transform=axes[j, i].transAxes,
+                    )
+
+        if self.interactive:
+            plt.show()
 
 def pair_plot(self, df, columns=None, target=None, diag_kind="auto", legend_labels=None, drop_na=True,
-                    bbox=(2.0, 1.0), alpha=0.7, color_map="viridis"):
+                    bbox=(2.0, 1.0), alpha=0.7, color_map="viridis", large_data="auto", large_threshold=100000,
+                    bins=50):
     """
     Documentation:
 
@@ -603,6 +817,9 @@ def pair_plot(self, df, columns=None, target=None, diag_kind="auto", legend_labe
             Create pair plot that produces a grid of scatter plots for all unique pairs of
             number features and a series of KDE or histogram plots along the diagonal.
 
+            Not thread-safe unless large_data is in effect: seaborn's PairGrid creates the figure
+            through pyplot. See PrettierPlot.detach_figures.
+
         ---
         Parameters:
             df : Pandas DataFrame
@@ -610,9 +827,10 @@ def pair_plot(self, df, columns=None, target=None, diag_kind="auto", legend_labe
             columns : list, default=None
                 List of strings describing columns in Pandas DataFrame to be visualized. If None,
                 all columns are visualized.
-            target : Pandas Series, default=None
+            target : Pandas Series or array, default=None
                 Introduce third dimension to scatter plots through a color hue that differentiates
-                dots based on the category value.
+                dots based on the category value. A Series is aligned to df by index. When large_data
+                is in effect, an array with one value per row of df is also accepted.
             diag_kind : str, default='auto.
                 Type of plot created along diagonal.
             drop_na : boolean, default=True
@@ -625,28 +843,28 @@ def pair_plot(self, df, columns=None, target=None, diag_kind="auto", legend_labe
                 Controls transparency of objects. Accepts value between 0.0 and 1.0.
             color_map : str specifying built-in matplotlib colormap, default="viridis"
                 Color map applied to plots.
+            large_data : boolean or str, default="auto"
+                Replace the scatter plots with 2-dimensional histograms and draw the diagonal from
+                binned counts, so the chart renders in bounded time for tens of millions of rows. Each
+                column is binned once and the target is factorized once, and every panel is then a
+                single np.bincount call. When target is provided, each cell is colored by the mix of
+                classes it contains and shaded by its count. "auto" switches to this mode when df has
+                more than large_threshold rows.
+            large_threshold : int, default=100000
+                Number of rows above which large_data="auto" switches to 2-dimensional histograms.
+            bins : int, default=50
+                Number of bins along each axis of the 2-dimensional histograms, and of the diagonal
+                histograms, when large_data is in effect.
     """
+    if large_data == "auto":
+        large_data = len(df) > large_threshold
+
     # custom plot formatting settings for this particular chart.
-    with plt.rc_context(
-        {
-            "axes.titlesize": 3.5 * self.chart_scale,
-            "axes.labelsize": 1.5 * self.chart_scale,  # axis title font size
-            "xtick.labelsize": 1.2 * self.chart_scale,
-            "xtick.major.size": 0.5 * self.chart_scale,
-            "xtick.major.width": 0.05 * self.chart_scale,
-            "xtick.color": style.style_grey,
-            "ytick.labelsize": 1.2 * self.chart_scale,
-            "ytick.major.size": 0.5 * self.chart_scale,
-            "ytick.major.width": 0.05 * self.chart_scale,
-            "ytick.color": style.style_grey,
-            "figure.facecolor": style.style_white,
-            "axes.facecolor": style.style_white,
-            "axes.spines.left": False,
-            "axes.spines.bottom": False,
-            "axes.edgecolor": style.style_grey,
-            "axes.grid": False,
-        }
-    ):
+    with style.rc_scope(style.rc_compile("pair_plot", self.chart_scale)):
+        if large_data:
+            pair_plot_binned(self, df, columns, target, diag_kind, legend_labels, drop_na, bbox, alpha, color_map, bins)
+            return
+
         # optionally drop rows with nulls
         if drop_na:
             df = df.dropna()
@@ -660,94 +878,63 @@ def pair_plot(self, df, columns=None, target=None, diag_kind="auto", legend_labe
             df = df.merge(target, left_index=True, right_index=True)
 
         # create pair plot
-        g = sns.pairplot(
-            data=df if target is None else df.dropna(),
-            vars=df.columns
-            if target is None
-            else [x for x in df.columns if x is not target.name],
-            hue=target if target is None else target.name,
-            diag_kind=diag_kind,
-            height=0.2 * self.chart_scale,
-            plot_kws={
-                "s": 2.0 * self.chart_scale,
-                "edgecolor": None,
-                "linewidth": 1,
-                "alpha": alpha,
-                "marker": "o",
-                "facecolor": style.style_grey if target is None else None,
-            },
-            diag_kws={
-                "facecolor": style.style_grey if target is None else style.style_white,
-                "linewidth": 2,
+        with profiling.phase("layout"):
+            g = sns.pairplot(
+                data=df if target is None else df.dropna(),
+                vars=df.columns
+                if target is None
+                else [x for x in df.columns if x is not target.name],
+                hue=target if target is None else target.name,
+                diag_kind=diag_kind,
+                height=0.2 * self.chart_scale,
+                plot_kws={
+                    "s": 2.0 * self.chart_scale,
+                    "edgecolor": None,
+                    "linewidth": 1,
+                    "alpha": alpha,
+                    "marker": "o",
+                    "facecolor": style.style_grey if target is None else None,
                 },
-            # diag_kws={"facecolor": style.style_grey if target is None else None},
-            palette=None
-            if target is None
-            else sns.color_palette(
-                style.color_gen(color_map, num=len(np.unique(target)))
-            ),
-        )
+                diag_kws={
+                    "facecolor": style.style_grey if target is None else style.style_white,
+                    "linewidth": 2,
+                    },
+                # diag_kws={"facecolor": style.style_grey if target is None else None},
+                palette=None
+                if target is None
+                else sns.color_palette(self.stats(target).encoding().colors(color_map)),
+            )
+
+        self.figures.append(g.fig)
 
         # plot formatting
         for ax in g.axes.flat:
 
             _ = ax.set_xlabel(
-                    "\n".join(textwrap.wrap(str(ax.get_xlabel()).replace("_", " "), 12))
+                    util.util_wrap_label(str(ax.get_xlabel()))
                 , rotation=40, ha="right")
             _ = ax.set_ylabel(
-                    "\n".join(textwrap.wrap(str(ax.get_ylabel()).replace("_", " "), 12))
+                    util.util_wrap_label(str(ax.get_ylabel()))
                 , rotation=40, ha="right")
             _ = ax.xaxis.labelpad = 20
             _ = ax.yaxis.labelpad = 40
             _ = ax.xaxis.label.set_color(style.style_grey)
             _ = ax.yaxis.label.set_color(style.style_grey)
 
-            # wrap long x-tick labels
-            plt.xlabel(
-                # 0,
-                [
-                    "\n".join(textwrap.wrap(str(i).replace("_", " "), 12))
-                    for i in ax.get_xlabel()
-                ],
-                # ha="center",
-            )
-
-            # wrap long y-tick labels
-            plt.ylabel(
-                # 0,
-                [
-                    "\n".join(textwrap.wrap(str(i).replace("_", " "), 12))
-                    for i in ax.get_xlabel()
-                ],
-                # va="center_baseline",
-            )
-
         # adjust subplot relative positioning
-        plt.subplots_adjust(hspace=0.0, wspace=0.0)
+        with profiling.phase("layout"):
+            g.fig.subplots_adjust(hspace=0.0, wspace=0.0)
 
         # add custom legend describing hue labels
         if target is not None:
             g._legend.remove()
 
             ## create custom legend
-            # create labels
-            if legend_labels is None:
-                legend_labels = np.unique(df[df[target.name].notnull()][target.name])
-            else:
-                legend_labels = np.array(legend_labels)
-
-            # generate colors
-            color_list = style.color_gen("viridis", num=len(legend_labels))
-
-            label_color = {}
-            for ix, i in enumerate(legend_labels):
-                label_color[i] = color_list[ix]
-
-            # create legend Patches
-            patches = [Patch(color=v, label=k, alpha=alpha) for k, v in label_color.items()]
+            # one patch per class, labeled by legend labels if provided, otherwise by class
+            patches = self.stats(target).encoding().legend_handles(color_map, alpha=alpha, labels=legend_labels)
 
             # draw legend
-            leg = plt.legend(
+            leg = g.axes.flat[-1].legend(
                 handles=patches,
                 fontsize=0.6 * self.chart_scale * np.log1p(len(g.axes.flat)),
                 loc="upper right",
@@ -758,27 +945,292 @@ def pair_plot(self, df, columns=None, target=None, diag_kind="auto", legend_labe
 
             # label font color
             for text in leg.get_texts():
-                plt.setp(text, color="grey")
+                text.set_color("grey")
 
-def hist(self, x, color, label, alpha=0.8):
+def pair_plot_binned(self, df, columns, target, diag_kind, legend_labels, drop_na, bbox, alpha, color_map, bins):
     """
     Documentation:
 
         ---
         Description:
-            Create histogram of numeric variable.
+            Draw pair_plot from binned counts rather than individual points. Called by pair_plot
+            when large_data is in effect, inside its rc context. Every column is mapped to bin
+            indices once, the target is factorized once, and each panel's counts for all classes
+            come from a single np.bincount call over the combined class and bin index.
 
         ---
         Parameters:
-            x : array
-                1-dimensional array of values to plot on x_axis.
+            See pair_plot.
+    """
+    with profiling.phase("prep"):
+        # optionally limit to a subset of columns
+        if columns is not None:
+            df = df[columns]
+
+        # a Series target that is also a column of df is not plotted against itself
+        target_name = getattr(target, "name", None)
+        names = [name for name in df.columns if target_name is None or name != target_name]
+        arrays = [df[name].values.astype(np.float64) for name in names]
+
+        # one factorization of the target. missing classes are coded -1
+        if target is None:
+            codes, uniques = None, [None]
+        else:
+            hue = target.reindex(df.index) if isinstance(target, pd.Series) else np.asarray(target)
+            encoding = self.stats(hue).encoding()
+            codes, uniques = encoding.codes, encoding.levels
+
+        # optionally drop rows with a null in any plotted column, and always drop rows without a class
+        keep = None
+        if drop_na:
+            keep = np.logical_and.reduce([~np.isnan(values) for values in arrays])
+        if codes is not None and (codes < 0).any():
+            keep = codes >= 0 if keep is None else keep & (codes >= 0)
+        if keep is not None and not keep.all():
+            arrays = [values[keep] for values in arrays]
+            codes = None if codes is None else codes[keep]
+
+        n_classes = len(uniques)
+        extents = [
+            (np.nanmin(values), np.nanmax(values)) if np.isfinite(values).any() else (0.0, 1.0)
+            for values in arrays
+        ]
+
+        # bin every column once. out of range and NaN values get the index bins
+        indices = [util.util_bin_index(values, bins, extent) for values, extent in zip(arrays, extents)]
+
+        def class_counts(ix, size):
+            # counts of every class in every bin from a single bincount
+            valid = ix < size
+            combined = ix[valid].astype(np.intp)
+            if codes is not None:
+                combined += codes[valid] * size
+            return np.bincount(combined, minlength=n_classes * size).reshape(n_classes, size)
+
+        # diagonal counts. kernel density estimates are computed from a fine grid of counts, so
+        # the raw values are never revisited
+        if diag_kind == "auto":
+            diag_kind = "hist" if target is None else "kde"
+        elif diag_kind not in ("hist", "kde"):
+            raise ValueError("diag_kind must be 'auto', 'hist' or 'kde', not '{}'".format(diag_kind))
+
+        diagonals = []
+        for values, extent, ix in zip(arrays, extents, indices):
+            if diag_kind == "hist":
+                diagonals.append((np.linspace(extent[0], extent[1], bins + 1), class_counts(ix, bins)))
+            else:
+                grid_size = 1024
+                counts = class_counts(util.util_bin_index(values, grid_size, extent), grid_size)
+                edges = np.linspace(extent[0], extent[1], grid_size + 1)
+                centers = (edges[:-1] + edges[1:]) / 2
+                curves = []
+                for class_count in counts:
+                    if class_count.sum() == 0:
+                        curves.append(None)
+                        continue
+                    support, density, _ = kde_estimate(centers, weights=class_count)
+                    # scale each class by its share of the rows, as seaborn does with a hue
+                    curves.append((support, density * class_count.sum() / counts.sum()))
+                diagonals.append(curves)
+
+        # class colors, and a white to grey colormap when there is no target
+        if target is None:
+            cmap = LinearSegmentedColormap.from_list(name="", colors=[style.style_white, style.style_grey])
+        else:
+            color_list = encoding.colors(color_map)
+            class_rgb = to_rgba_array(color_list)[:, :3]
+
+    # create figure and axes. columns share the x-axis, and off-diagonal rows share the y-axis range
+    with profiling.phase("layout"):
+        n = len(names)
+
+        # a target adds a column of space for the legend
+        n_wide = n if target is None else n + 1
+        fig = self.new_figure(figsize=(0.2 * self.chart_scale * n_wide, 0.2 * self.chart_scale * n))
+        axes = fig.subplots(ncols=n, nrows=n, sharex="col", squeeze=False)
+
+    def draw_counts(ax, counts, x_extent, y_extent):
+        if target is None:
+            ax.imshow(
+                np.ma.masked_equal(counts[0], 0),
+                extent=(x_extent[0], x_extent[1], y_extent[0], y_extent[1]),
+                origin="lower",
+                aspect="auto",
+                interpolation="nearest",
+                cmap=cmap,
+                norm=LogNorm(vmin=1),
+                alpha=alpha,
+            )
+        else:
+            # color each cell by its mix of classes, and shade it by its count on a log scale
+            total = counts.sum(axis=0)
+            image = np.zeros(total.shape + (4,))
+            filled = total > 0
+            image[..., :3] = np.tensordot(counts, class_rgb, axes=(0, 0)) / np.maximum(total, 1)[..., None]
+            image[..., 3][filled] = alpha * (0.2 + 0.8 * np.log1p(total[filled]) / np.log1p(total.max()))
+            ax.imshow(
+                image,
+                extent=(x_extent[0], x_extent[1], y_extent[0], y_extent[1]),
+                origin="lower",
+                aspect="auto",
+                interpolation="nearest",
+            )
+
+    # off-diagonal 2-dimensional histograms. each pair is counted once and drawn in both triangles
+    for i in range(n):
+        for j in range(i):
+            with profiling.phase("prep"):
+                counts = class_counts(indices[i].astype(np.intp) * (bins + 1) + indices[j], (bins + 1) ** 2)
+                counts = counts.reshape(n_classes, bins + 1, bins + 1)[:, :bins, :bins]
+
+            draw_counts(axes[i, j], counts, extents[j], extents[i])
+            draw_counts(axes[j, i], counts.transpose(0, 2, 1), extents[i], extents[j])
+
+    # diagonal histograms or kernel density estimates
+    for i in range(n):
+        ax = axes[i, i]
+        if diag_kind == "hist":
+            # binned counts drawn as histograms of the bin centers, weighted by count. Axes.stairs
+            # would draw them directly but needs matplotlib 3.4
+            edges, counts = diagonals[i]
+            centers = (edges[:-1] + edges[1:]) / 2
+            if target is None:
+                ax.hist(centers, bins=edges, weights=counts[0], histtype="stepfilled", color=style.style_grey)
+            else:
+                for k in range(n_classes):
+                    ax.hist(
+                        centers,
+                        bins=edges,
+                        weights=counts[k],
+                        histtype="step",
+                        color=color_list[k],
+                        linewidth=2,
+                        alpha=alpha,
+                    )
+        else:
+            for k, curve in enumerate(diagonals[i]):
+                if curve is None:
+                    continue
+                support, density = curve
+                class_color = style.style_grey if target is None else color_list[k]
+                ax.plot(support, density, color=class_color, linewidth=2)
+                ax.fill_between(support, density, color=class_color, alpha=0.25 * alpha, linewidth=0)
+        ax.set_ylim(bottom=0)
+
+        # density curves extend past the data. keep each shared column on the binned range
+        ax.set_xlim(extents[i])
+
+    # plot formatting. only the outer axes carry tick labels and axis labels
+    for (i, j), ax in np.ndenumerate(axes):
+        ax.tick_params(labelbottom=i == n - 1, labelleft=j == 0 and i != j)
+        if i == n - 1:
+            ax.set_xlabel(
+                util.util_wrap_label(str(names[j])), rotation=40, ha="right"
+            )
+            ax.xaxis.labelpad = 20
+            ax.xaxis.label.set_color(style.style_grey)
+        if j == 0:
+            ax.set_ylabel(
+                util.util_wrap_label(str(names[i])), rotation=40, ha="right"
+            )
+            ax.yaxis.labelpad = 40
+            ax.yaxis.label.set_color(style.style_grey)
+
+    # make room for the rotated labels, then close the gaps between panels as seaborn does
+    with profiling.phase("layout"):
+        fig.tight_layout(rect=(0, 0, n / n_wide, 1))
+        fig.subplots_adjust(hspace=0.0, wspace=0.0)
+
+    # add custom legend describing hue labels
+    if target is not None:
+        if legend_labels is None:
+            legend_labels = list(uniques)
+
+        # create legend Patches
+        patches = [Patch(color=color_list[k], label=legend_labels[k], alpha=alpha) for k in range(n_classes)]
+
+        # draw legend
+        leg = axes[-1, -1].legend(
+            handles=patches,
+            fontsize=0.6 * self.chart_scale * np.log1p(axes.size),
+            loc="upper right",
+            markerscale=0.15 * self.chart_scale * np.log1p(axes.size),
+            ncol=1,
+            bbox_to_anchor=bbox,
+        )
+
+        # label font color
+        for text in leg.get_texts():
+            text.set_color("grey")
+
+def hist(self, x, color, label, alpha=0.8, bins=10, range=None, column=None, sample_size=1000000, ax=None):
+    """
+    Documentation:
+
+        ---
+        Description:
+            Create histogram of numeric variable. Data that does not fit in memory can be passed
+            as an iterator of chunks, which are counted one at a time by a HistogramAccumulator.
+
+        ---
+        Parameters:
+            x : array, iterator, callable or HistogramAccumulator
+                1-dimensional array of values to plot on x_axis. Alternatively:
+                - an iterator of chunks, e.g. pd.read_csv(path, chunksize=100000) or
+                  pyarrow.parquet.ParquetFile(path).iter_batches(columns=["age"]). Bin edges are
+                  agreed from the first sample_size values, and widened by merging neighbouring
+                  bins whenever a later chunk falls outside them.
+                - a function with no arguments returning such an iterator. Bin edges are agreed
+                  from a first pass over the data.
+                - an accumulator that has already been filled, e.g. by stream_histogram_parallel.
+                Streamed values outside explicit bins or range are not drawn, and a warning names
+                how many were left out.
             color : str (some sort of color code)
                 Histogram color.
             label : str
                 Legend label.
             alpha : float, default=0.8
                 Controls transparency of bars. Accepts value between 0.0 and 1.0.
+            bins : int or array, default=10
+                Number of evenly spaced bins, or bin edges including the rightmost edge.
+            range : tuple of floats, default=None
+                Lower and upper edge of the bins.
+            column : str, default=None
+                Column to read from DataFrame chunks when x is streamed.
+            sample_size : int, default=1000000
+                Number of streamed values read before bin edges are agreed when x is an iterator.
+            ax : axes object, default=None
+                Axis object for the visualization.
     """
-    # create histogram
-    plt.hist(x=x, color=color, label=label, alpha=alpha)
+    if ax is None:
+        ax = self.ax
+
+    # accumulate streamed chunks
+    if callable(x) or isinstance(x, collections.abc.Iterator):
+        with profiling.phase("prep"):
+            x = stream.stream_histogram(
+                x, bins=bins, range=range, column=column, sample_size=sample_size
+            )
+
+    # draw accumulated counts with one bar per bin, exactly as plt.hist would
+    if isinstance(x, stream.HistogramAccumulator):
+        dropped = x.underflow + x.overflow
+        if dropped:
+            warnings.warn(
+                "{} values outside the bin edges [{}, {}] are not drawn".format(
+                    dropped, x.edges[0], x.edges[-1]
+                )
+            )
+
+        ax.hist(
+            x=x.edges[:-1],
+            bins=x.edges,
+            weights=x.counts,
+            color=color,
+            label=label,
+            alpha=alpha,
+        )
+    else:
+        # create histogram
+        ax.hist(x=x, bins=bins, range=range, color=color, label=label, alpha=alpha)
 
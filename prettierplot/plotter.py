@@ -1,10 +1,91 @@
-import numpy as np
-import pandas as pd
-import seaborn as sns
-import matplotlib.pyplot as plt
+import contextlib
+import functools
+import importlib
 
+from matplotlib.backend_bases import FigureCanvasBase
+from matplotlib.figure import Figure
+
+import prettierplot.profiling as profiling
 import prettierplot.style as style
-import prettierplot.util as util
+
+
+class LazyMethod:
+    """
+    Documentation:
+
+        ---
+        Description:
+            Descriptor that binds a plotting function to PrettierPlot on first access. The
+            module containing the function, along with its heavier dependencies (seaborn,
+            scikit-learn, scipy), is only imported when the method is first used.
+            Once resolved, the descriptor replaces itself with the function so later lookups
+            cost the same as a regular method. Plotting methods are wrapped so that they run
+            inside the instance's style context.
+
+        ---
+        Parameters:
+            module : str
+                Name of the prettierplot submodule containing the function.
+            name : str, default=None
+                Name of the function within the submodule. Defaults to the attribute name.
+            static : bool, default=False
+                Bind the function as a staticmethod rather than an instance method.
+            styled : bool, default=True
+                Run the method inside PrettierPlot.style_context. Ignored for staticmethods.
+    """
+
+    def __init__(self, module, name=None, static=False, styled=True):
+        self.module = module
+        self.name = name
+        self.static = static
+        self.styled = styled and not static
+
+    def __set_name__(self, owner, name):
+        self.owner = owner
+        self.attr = name
+        if self.name is None:
+            self.name = name
+
+    def resolve(self):
+        """
+        Documentation:
+
+            ---
+            Description:
+                Import the submodule, fetch the function and replace this descriptor on the
+                owning class.
+        """
+        func = getattr(importlib.import_module("prettierplot." + self.module), self.name)
+        if self.styled:
+            func = styled_method(func)
+        setattr(self.owner, self.attr, staticmethod(func) if self.static else func)
+        return func
+
+    def __get__(self, instance, owner):
+        func = self.resolve()
+        return func if instance is None or self.static else func.__get__(instance, owner)
+
+
+def styled_method(func):
+    """
+    Documentation:
+
+        ---
+        Description:
+            Wrap a plotting method so its body runs inside the instance's style context and, when
+            profiling is enabled, is recorded by the instance's profiler. Figures that seaborn
+            registered with pyplot are detached afterwards. See PrettierPlot.detach_figures.
+    """
+
+    @functools.wraps(func)
+    def method(self, *args, **kwargs):
+        with self.style_context(), self.profile_call(func.__name__):
+            try:
+                return func(self, *args, **kwargs)
+            finally:
+                self.detach_figures()
+
+    return method
 
 
 class PrettierPlot:
@@ -20,42 +101,46 @@ class PrettierPlot:
             figure, or the position variable can be utilized to create a subplot arrangement.
     """
 
-    from .cat import (
-        bar_v,
-        bar_h,
-        box_plot_v,
-        box_plot_h,
-        stacked_bar_h,
-        tree_map,
-    )
-    from .data import titanic, attrition, housing
-    from .eval import (
-        prob_plot,
-        corr_heatmap,
-        corr_heatmap_target,
-        roc_curve_plot,
-        decision_region,
-    )
-    from .facet import (
-        facet_cat,
-        facet_two_cat_bar,
-        facet_cat_num_hist,
-        facet_two_cat_point,
-        facet_cat_num_scatter,
-    )
-    from .line import line, multi_line
-    from .num import (
-        scatter_2d,
-        scatter_2d_hue,
-        dist_plot,
-        kde_plot,
-        reg_plot,
-        pair_plot,
-        pair_plot_custom,
-        hist,
-    )
-
-    def __init__(self, chart_scale=15, plot_orientation=None):
+    # plotting methods are bound lazily. see LazyMethod
+    bar_v = LazyMethod("cat")
+    bar_h = LazyMethod("cat")
+    box_plot_v = LazyMethod("cat")
+    box_plot_h = LazyMethod("cat")
+    stacked_bar_h = LazyMethod("cat")
+    tree_map = LazyMethod("cat")
+
+    titanic = LazyMethod("data", styled=False)
+    attrition = LazyMethod("data", styled=False)
+    housing = LazyMethod("data", styled=False)
+
+    prob_plot = LazyMethod("eval")
+    corr_heatmap = LazyMethod("eval")
+    corr_heatmap_target = LazyMethod("eval")
+    roc_curve_plot = LazyMethod("eval")
+    decision_region = LazyMethod("eval")
+
+    facet_cat = LazyMethod("facet")
+    facet_two_cat_bar = LazyMethod("facet")
+    facet_cat_num_hist = LazyMethod("facet")
+    facet_two_cat_point = LazyMethod("facet")
+    facet_cat_num_scatter = LazyMethod("facet")
+
+    line = LazyMethod("line")
+    multi_line = LazyMethod("line")
+
+    scatter_2d = LazyMethod("num")
+    scatter_2d_hue = LazyMethod("num")
+    dist_plot = LazyMethod("num")
+    kde_plot = LazyMethod("num")
+    reg_plot = LazyMethod("num")
+    pair_plot = LazyMethod("num")
+    pair_plot_custom = LazyMethod("num")
+    hist = LazyMethod("num")
+
+    render_many = LazyMethod("batch", static=True)
+
+    def __init__(self, chart_scale=15, plot_orientation=None, interactive=True, theme="grey", figure_pool=None,
+                 profile=False, profile_log=None, stats_cache=None):
         """
         Documentation:
             ---
@@ -74,12 +159,63 @@ class PrettierPlot:
                     - 'square' - plot that is as tall as it is wide
                     - 'wide_narrow' - plot that is much wider than it is tall
                     - 'wide_standard' - plot that is wider than it is tall
+                interactive : bool, default=True
+                    Controls whether figures are registered with pyplot's figure manager so they display
+                    in notebooks and interactive sessions. When False, figures are standalone Figure
+                    objects that never touch pyplot's global state, so PrettierPlot objects can be used
+                    from multiple threads. Save these with self.savefig, which draws inside the style
+                    context. Methods built on seaborn's FacetGrid or PairGrid are the exception: they
+                    create their figure through pyplot and are not thread-safe. See detach_figures.
+                theme : str, default="grey"
+                    Name of the style theme in style.themes. The theme is compiled once per chart_scale
+                    and applied only while this object creates figures, draws or saves, so global
+                    rcParams are left untouched for other plotting code. Because matplotlib reads the
+                    theme from its process-wide rcParams, themed work is serialized across threads.
+                    See style.RcScope.
+                figure_pool : FigurePool, default=None
+                    Optional pool.FigurePool from which figures are drawn and to which they are returned
+                    by close. Pooled figures are standalone, so interactive is ignored when a pool is given.
+                profile : bool, default=False
+                    Record wall time, allocations and artists created per phase (prep, artists, ticks,
+                    layout, draw) for every method call and savefig. Records are available through
+                    self.profile, a profiling.Profiler whose report method returns a DataFrame.
+                profile_log : str or file-like object, default=None
+                    Append each profiling record to this JSON-lines log. Implies profile=True.
+                stats_cache : bool or StatsCache, default=None
+                    Cache column statistics (unique values, counts, extents, quantiles, correlation
+                    matrices) across plotting calls, so a DataFrame passed to many charts has each
+                    statistic computed once. True creates a stats.StatsCache for this object. Pass the
+                    same StatsCache to several PrettierPlot objects to share it across a report.
+
+            ---
+            Lifecycle:
+                Figures are released by close, or automatically when PrettierPlot is used as a context
+                manager:
+
+                    with PrettierPlot(chart_scale=10, interactive=False) as p:
+                        ax = p.make_canvas()
+                        p.bar_v(x=x, counts=counts)
+                        p.savefig("bar_v.png")
         """
         self.chart_scale = chart_scale
         self.plot_orientation = plot_orientation
+        self.interactive = interactive and figure_pool is None
+        self.theme = theme
+        self.figure_pool = figure_pool
+        self.profile = (
+            profiling.Profiler(log=profile_log) if profile or profile_log is not None else None
+        )
+
+        if stats_cache is True:
+            from prettierplot.stats import StatsCache
+
+            stats_cache = StatsCache()
+        elif stats_cache is False:
+            stats_cache = None
+        self.stats_cache = stats_cache
 
-        # set graphic style
-        sns.set(rc=style.rc_grey)
+        # every figure created by this object, starting with the main figure
+        self.figures = []
 
         # dynamically set chart width and height parameters
         if plot_orientation == "tall":
@@ -99,10 +235,168 @@ class PrettierPlot:
             chart_height = self.chart_scale * 0.5
 
         # create figure, force white background, and set dimensions
-        self.fig = plt.figure(facecolor="white")
-        self.fig.set_figheight(chart_height)
-        self.fig.set_figwidth(chart_width)
+        self.fig = self.new_figure(facecolor="white", figsize=(chart_width, chart_height))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """
+        Documentation:
+            ---
+            Description:
+                Release every figure created by this object. Pooled figures are cleared and returned
+                to the pool, figures registered with pyplot are closed, and standalone figures are
+                cleared so their artists can be garbage collected.
+        """
+        for fig in self.figures:
+            if self.figure_pool is not None and self.figure_pool.owns(fig):
+                self.figure_pool.release(fig)
+            elif getattr(fig.canvas, "manager", None) is not None:
+                import matplotlib.pyplot as plt
+
+                plt.close(fig)
+            else:
+                fig.clear()
+
+        self.figures = []
+        self.fig = None
+        self.ax = None
+
+    def new_figure(self, **kwargs):
+        """
+        Documentation:
+            ---
+            Description:
+                Create a figure owned by this object. Figures come from figure_pool when one is
+                set, are created through pyplot when interactive is True, and are standalone Figure
+                objects otherwise.
+
+            ---
+            Parameters:
+                **kwargs : dict
+                    Keyword arguments passed to the Figure constructor.
+
+            returns
+                fig : figure object
+                    Newly created figure.
+        """
+        with self.style_context():
+            if self.figure_pool is not None:
+                fig = self.figure_pool.acquire(**kwargs)
+            elif self.interactive:
+                import matplotlib.pyplot as plt
+
+                fig = plt.figure(**kwargs)
+            else:
+                fig = Figure(**kwargs)
+
+        self.figures.append(fig)
+        return fig
+
+    def detach_figures(self):
+        """
+        Documentation:
+            ---
+            Description:
+                Remove figures built by seaborn's FacetGrid or PairGrid from pyplot's figure manager
+                when interactive is False. These grids always create their figure through pyplot and
+                use pyplot while drawing, so plotting methods detach them once they return: each
+                figure is given a standalone canvas so pyplot neither shows it nor keeps it alive.
+                Creating the figure still goes through pyplot's global state, so the methods that
+                use these grids (facet_cat_num_scatter, facet_cat_num_hist, facet_two_cat_point and
+                pair_plot without large_data) are not thread-safe, whatever the value of interactive.
+        """
+        if self.interactive:
+            return
+
+        for fig in self.figures:
+            if getattr(fig.canvas, "manager", None) is not None:
+                import matplotlib.pyplot as plt
+
+                plt.close(fig)
+                FigureCanvasBase(fig)
+
+    def style_context(self):
+        """
+        Documentation:
+            ---
+            Description:
+                Context manager that applies this object's compiled theme to matplotlib's rcParams
+                for the duration of the block and restores the previous values afterwards. Plotting
+                methods, make_canvas and savefig already run inside it. Blocks on other threads wait
+                until this one exits, so charts drawn concurrently never mix themes or chart scales.
+
+            returns
+                context : context manager
+        """
+        return style.rc_scope(style.rc_compile(self.theme, self.chart_scale))
+
+    def profile_call(self, method, phase="artists"):
+        """
+        Documentation:
+            ---
+            Description:
+                Context manager that records a method call with this object's profiler. Does nothing
+                when profiling is disabled.
+
+            ---
+            Parameters:
+                method : str
+                    Name of the method being recorded.
+                phase : str, default="artists"
+                    Phase that unmarked time within the call is attributed to.
+
+            returns
+                context : context manager
+        """
+        if self.profile is None:
+            return contextlib.nullcontext()
+        return self.profile.call(method, self, phase=phase)
+
+    def stats(self, data):
+        """
+        Documentation:
+            ---
+            Description:
+                Column statistics of a DataFrame, Series or array, served from this object's
+                stats_cache when one is set. Plotting methods use this for unique values, extents
+                and correlation matrices.
+
+            ---
+            Parameters:
+                data : Pandas DataFrame, Pandas Series or array
+                    Data of interest.
+
+            returns
+                stats : stats.DataStats
+                    Accessor with counts, unique, extent, quantiles and corr methods.
+        """
+        from prettierplot.stats import DataStats
+
+        return DataStats(data, cache=self.stats_cache)
+
+    def savefig(self, *args, **kwargs):
+        """
+        Documentation:
+            ---
+            Description:
+                Save the most recent figure created by this object inside its style context. This is
+                the canvas figure unless a figure-level method such as pair_plot or a facet method
+                built its own.
+
+            ---
+            Parameters:
+                *args, **kwargs
+                    Passed through to Figure.savefig.
+        """
+        with self.style_context(), self.profile_call("savefig", phase="draw"):
+            self.figures[-1].savefig(*args, **kwargs)
 
+    @styled_method
     def make_canvas(self, title="", x_label="", x_shift=0.0, y_label="", y_shift=0.8, position=111, nrows=None,
                     ncols=None, index=None, sharex=None, sharey=None, title_scale=1.0):
         """
@@ -179,14 +473,14 @@ class PrettierPlot:
         ax.spines["top"].set_visible(False)
 
         # add axis labels
-        plt.xlabel(
+        ax.set_xlabel(
             x_label,
             fontsize=1.667 * self.chart_scale * title_scale,
             labelpad=1.667 * self.chart_scale,
             position=(x_shift, 0.5),
             horizontalalignment="left",
         )
-        plt.ylabel(
+        ax.set_ylabel(
             y_label,
             fontsize=1.667 * self.chart_scale * title_scale,
             labelpad=1.667 * self.chart_scale,
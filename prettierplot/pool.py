@@ -0,0 +1,185 @@
+import threading
+
+import numpy as np
+import matplotlib
+from matplotlib.figure import Figure, SubplotParams
+
+
+class FigurePool:
+    """
+    Documentation:
+
+        ---
+        Description:
+            Pool of standalone Figure objects that are cleared and reused instead of being
+            reallocated for every chart. Figures are grouped by the keyword arguments they were
+            created with (figsize, facecolor, dpi, ...), so a released figure is only handed
+            back out for a chart of the same size and shape, and its canvas and renderer buffers
+            can be reused. Pooled figures are never registered with pyplot.
+
+        ---
+        Parameters:
+            max_size : int, default=16
+                Maximum number of idle figures kept per figure shape. Figures released beyond
+                this limit are cleared and dropped.
+    """
+
+    def __init__(self, max_size=16):
+        self.max_size = max_size
+        self.lock = threading.Lock()
+        self.idle = {}
+        self.keys = {}
+
+    def acquire(self, **kwargs):
+        """
+        Documentation:
+
+            ---
+            Description:
+                Return an idle figure created with the same keyword arguments, or create a new one.
+                Reused figures are reset to the state a new figure would have under the current
+                rcParams, so margins, size, colors and layout engine left by the previous chart do
+                not carry over.
+
+            ---
+            Parameters:
+                **kwargs : dict
+                    Keyword arguments passed to the Figure constructor.
+
+            ---
+            Returns:
+                fig : figure object
+                    Empty figure.
+        """
+        key = self.pool_key(kwargs)
+
+        with self.lock:
+            idle = self.idle.get(key)
+            fig = idle.pop() if idle else None
+
+        if fig is None:
+            fig = Figure(**kwargs)
+        else:
+            self.reset(fig, kwargs)
+
+        with self.lock:
+            self.keys[id(fig)] = key
+        return fig
+
+    def release(self, fig):
+        """
+        Documentation:
+
+            ---
+            Description:
+                Clear a figure and return it to the pool. Figures that did not come from this pool
+                are cleared and otherwise ignored.
+
+            ---
+            Parameters:
+                fig : figure object
+                    Figure previously returned by acquire.
+        """
+        fig.clear()
+
+        with self.lock:
+            key = self.keys.pop(id(fig), None)
+            if key is None:
+                return
+
+            idle = self.idle.setdefault(key, [])
+            if len(idle) < self.max_size:
+                idle.append(fig)
+
+    def owns(self, fig):
+        """
+        Documentation:
+
+            ---
+            Description:
+                Check whether a figure is currently checked out of this pool.
+        """
+        with self.lock:
+            return id(fig) in self.keys
+
+    def clear(self):
+        """
+        Documentation:
+
+            ---
+            Description:
+                Drop every idle figure held by the pool.
+        """
+        with self.lock:
+            self.idle = {}
+
+    @staticmethod
+    def reset(fig, kwargs):
+        """
+        Documentation:
+
+            ---
+            Description:
+                Restore the figure-level state that Figure.clear leaves behind (subplot parameters,
+                size, dpi, colors, frame and layout engine) to what the Figure constructor sets for
+                the same keyword arguments. Charts change this state with tight_layout,
+                subplots_adjust, set_size_inches and set_facecolor.
+
+            ---
+            Parameters:
+                fig : figure object
+                    Cleared figure to reset.
+                kwargs : dict
+                    Keyword arguments the figure was created with.
+        """
+        rc = matplotlib.rcParams
+        subplotpars = kwargs.get("subplotpars") or SubplotParams()
+        fig.subplotpars.update(
+            left=subplotpars.left,
+            right=subplotpars.right,
+            bottom=subplotpars.bottom,
+            top=subplotpars.top,
+            wspace=subplotpars.wspace,
+            hspace=subplotpars.hspace,
+        )
+
+        fig.set_dpi(kwargs.get("dpi") or rc["figure.dpi"])
+        fig.set_size_inches(kwargs.get("figsize") or rc["figure.figsize"], forward=False)
+        fig.set_facecolor(kwargs.get("facecolor") or rc["figure.facecolor"])
+        fig.set_edgecolor(kwargs.get("edgecolor") or rc["figure.edgecolor"])
+        fig.set_linewidth(kwargs.get("linewidth", 0.0))
+        fig.set_frameon(kwargs.get("frameon", rc["figure.frameon"]))
+
+        # the constructor picks the layout engine from layout, tight_layout or constrained_layout in
+        # that order, and from rcParams when none is given
+        layout = kwargs.get("layout")
+        tight_layout = kwargs.get("tight_layout")
+        constrained_layout = kwargs.get("constrained_layout")
+        if not hasattr(fig, "set_layout_engine"):
+            fig.set_tight_layout(tight_layout)
+            fig.set_constrained_layout(constrained_layout)
+        elif layout is not None:
+            fig.set_layout_engine(layout)
+        elif tight_layout is not None:
+            fig.set_layout_engine("tight", **(tight_layout if isinstance(tight_layout, dict) else {}))
+        elif constrained_layout:
+            fig.set_layout_engine(
+                "constrained", **(constrained_layout if isinstance(constrained_layout, dict) else {})
+            )
+        elif constrained_layout is not None:
+            # no engine, as for constrained_layout=False
+            if rc["figure.autolayout"] or rc["figure.constrained_layout.use"]:
+                fig.set_layout_engine("none")
+            else:
+                fig.set_layout_engine(None)
+        else:
+            fig.set_layout_engine(None)
+
+    @staticmethod
+    def pool_key(value):
+        # hashable form of the constructor kwargs, e.g. tight_layout={"pad": 0.5}
+        if isinstance(value, dict):
+            return tuple((name, FigurePool.pool_key(item)) for name, item in sorted(value.items()))
+        elif isinstance(value, (list, tuple, np.ndarray)):
+            return tuple(FigurePool.pool_key(item) for item in value)
+        return value
@@ -0,0 +1,287 @@
+import contextlib
+import json
+import threading
+import time
+import tracemalloc
+
+
+# phases currently open on each thread. methods and helpers mark phases with profiling.phase
+active = threading.local()
+
+# profiled calls running in the process, and whether tracemalloc was started for them
+tracing = {"calls": 0, "started": False}
+tracing_lock = threading.Lock()
+
+# tracemalloc.reset_peak is new in Python 3.9. without it, peaks are approximated by the memory
+# traced at phase boundaries
+peak_resettable = hasattr(tracemalloc, "reset_peak")
+
+
+class Profiler:
+    """
+    Documentation:
+
+        ---
+        Description:
+            Opt-in per-phase instrumentation for PrettierPlot. Each plotting method call (and each
+            savefig) produces one record holding the wall time, memory allocations and number of
+            artists created, broken down by phase:
+            - 'prep' - data preparation such as np.unique, groupby or df.corr()
+            - 'artists' - creation of lines, patches, collections and text. Time spent inside a
+              method but outside any explicitly marked phase is attributed here
+            - 'ticks' - tick formatting
+            - 'layout' - tight_layout and FacetGrid / PairGrid construction
+            - 'draw' - rendering and encoding in savefig
+
+            Allocations are measured with tracemalloc. If it is not already tracing, it is started
+            when a profiled call begins and stopped when the last profiled call running in the
+            process ends, so unprofiled work never pays for tracing. tracemalloc is process-wide,
+            so allocation figures are only exact when one chart is built at a time. Before Python
+            3.9, which added tracemalloc.reset_peak, a phase's peak is approximated by the memory
+            traced when it starts and ends. Wall time and net allocations are exclusive of nested
+            phases, while each phase's peak is measured from its own starting point and includes
+            any phases nested inside it.
+
+        ---
+        Parameters:
+            log : str or file-like object, default=None
+                Destination for a JSON-lines log. When set, each record is appended as one JSON
+                object per line as soon as the call finishes.
+    """
+
+    def __init__(self, log=None):
+        self.log = log
+        self.records = []
+        self.lock = threading.Lock()
+
+    @contextlib.contextmanager
+    def call(self, method, owner=None, phase="artists"):
+        """
+        Documentation:
+
+            ---
+            Description:
+                Context manager that profiles one method call. Calls made while another call is
+                already being profiled on the same thread are folded into the outer record.
+
+            ---
+            Parameters:
+                method : str
+                    Name of the method being profiled.
+                owner : PrettierPlot, default=None
+                    Object whose figures are searched to count the artists created by the call.
+                phase : str, default="artists"
+                    Phase that time outside any explicitly marked phase is attributed to.
+        """
+        stack = getattr(active, "stack", None)
+        if stack:
+            yield
+            return
+
+        record = {
+            "method": method,
+            "timestamp": time.time(),
+            "wall": 0.0,
+            "alloc_net": 0,
+            "alloc_peak": 0,
+            "artists": 0,
+            "phases": {},
+            "error": None,
+        }
+        artists_start = self.count_artists(owner)
+
+        active.record = record
+        active.stack = []
+        tracing_acquire()
+        try:
+            with phase_frame(phase):
+                yield
+        except Exception as error:
+            record["error"] = "{}: {}".format(type(error).__name__, error)
+            raise
+        finally:
+            active.stack = None
+            active.record = None
+            tracing_release()
+
+            phases = record["phases"].values()
+            record["wall"] = sum(p["wall"] for p in phases)
+            record["alloc_net"] = sum(p["alloc_net"] for p in phases)
+            record["alloc_peak"] = max((p["alloc_peak"] for p in phases), default=0)
+            record["artists"] = self.count_artists(owner) - artists_start
+            self.add(record)
+
+    def add(self, record):
+        """
+        Documentation:
+
+            ---
+            Description:
+                Store a finished record and append it to the JSON-lines log.
+        """
+        with self.lock:
+            self.records.append(record)
+            if self.log is None:
+                return
+
+            line = json.dumps(record) + "\n"
+            if hasattr(self.log, "write"):
+                self.log.write(line)
+            else:
+                with open(self.log, "a") as f:
+                    f.write(line)
+
+    def report(self):
+        """
+        Documentation:
+
+            ---
+            Description:
+                Summarize the collected records as a DataFrame with one row per method call and
+                phase.
+
+            ---
+            Returns:
+                df : Pandas DataFrame
+                    Columns are call, method, phase, wall, alloc_net, alloc_peak, artists and
+                    error. wall is in seconds and allocations are in bytes. artists is reported
+                    on each call's rows rather than per phase.
+        """
+        import pandas as pd
+
+        rows = []
+        with self.lock:
+            records = list(self.records)
+
+        for call, record in enumerate(records):
+            for name, values in record["phases"].items():
+                rows.append(
+                    {
+                        "call": call,
+                        "method": record["method"],
+                        "phase": name,
+                        "wall": values["wall"],
+                        "alloc_net": values["alloc_net"],
+                        "alloc_peak": values["alloc_peak"],
+                        "artists": record["artists"],
+                        "error": record["error"],
+                    }
+                )
+
+        return pd.DataFrame(
+            rows,
+            columns=["call", "method", "phase", "wall", "alloc_net", "alloc_peak", "artists", "error"],
+        )
+
+    def clear(self):
+        """
+        Documentation:
+
+            ---
+            Description:
+                Discard every collected record. The JSON-lines log is left untouched.
+        """
+        with self.lock:
+            self.records = []
+
+    @staticmethod
+    def count_artists(owner):
+        if owner is None:
+            return 0
+        return sum(len(fig.findobj()) for fig in getattr(owner, "figures", []))
+
+
+def tracing_acquire():
+    """
+    Documentation:
+
+        ---
+        Description:
+            Register a profiled call, starting tracemalloc if this is the first one running and
+            nothing else is tracing.
+    """
+    with tracing_lock:
+        if tracing["calls"] == 0:
+            tracing["started"] = not tracemalloc.is_tracing()
+            if tracing["started"]:
+                tracemalloc.start()
+        tracing["calls"] += 1
+
+
+def tracing_release():
+    """
+    Documentation:
+
+        ---
+        Description:
+            Unregister a profiled call, stopping tracemalloc once no profiled call is running if it
+            was started by tracing_acquire.
+    """
+    with tracing_lock:
+        tracing["calls"] -= 1
+        if tracing["calls"] == 0 and tracing["started"]:
+            tracemalloc.stop()
+            tracing["started"] = False
+
+
+def traced_memory():
+    traced, peak = tracemalloc.get_traced_memory()
+    return traced, peak if peak_resettable else traced
+
+
+@contextlib.contextmanager
+def phase_frame(name):
+    stack = active.stack
+    traced, peak = traced_memory()
+
+    # fold the enclosing phase's peak so far into its frame before resetting the counter
+    if stack:
+        stack[-1]["peak"] = max(stack[-1]["peak"], peak)
+    if peak_resettable:
+        tracemalloc.reset_peak()
+
+    frame = {"start": time.perf_counter(), "traced": traced, "peak": traced, "child_wall": 0.0,
+             "child_alloc": 0}
+    stack.append(frame)
+    try:
+        yield
+    finally:
+        stack.pop()
+        wall = time.perf_counter() - frame["start"]
+        traced, peak = traced_memory()
+        frame["peak"] = max(frame["peak"], peak)
+
+        # phases are exclusive - time and net allocations of nested phases belong to the nested phase
+        totals = active.record["phases"].setdefault(name, {"wall": 0.0, "alloc_net": 0, "alloc_peak": 0})
+        totals["wall"] += wall - frame["child_wall"]
+        totals["alloc_net"] += traced - frame["traced"] - frame["child_alloc"]
+        totals["alloc_peak"] = max(totals["alloc_peak"], frame["peak"] - frame["traced"])
+
+        if stack:
+            stack[-1]["child_wall"] += wall
+            stack[-1]["child_alloc"] += traced - frame["traced"]
+            stack[-1]["peak"] = max(stack[-1]["peak"], frame["peak"])
+
+
+def phase(name):
+    """
+    Documentation:
+
+        ---
+        Description:
+            Mark a block of code as belonging to a profiling phase. Does nothing unless a profiled
+            method call is running on the current thread, so plotting code can mark its phases
+            unconditionally.
+
+        ---
+        Parameters:
+            name : str
+                Phase name, one of 'prep', 'artists', 'ticks', 'layout' or 'draw'.
+
+        ---
+        Returns:
+            context : context manager
+    """
+    if getattr(active, "stack", None):
+        return phase_frame(name)
+    return contextlib.nullcontext()
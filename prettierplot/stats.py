@@ -0,0 +1,571 @@
+import collections
+import threading
+
+import numpy as np
+import pandas as pd
+
+import prettierplot.encode as encode
+
+
+class StatsCache:
+    """
+    Documentation:
+
+        ---
+        Description:
+            Least recently used cache of column statistics shared across plotting calls. Entries
+            are keyed by the identity of the data they were computed from plus a cheap content
+            fingerprint (see stats_fingerprint), the statistic and its parameters, so a DataFrame
+            passed to many charts has each statistic computed once. The least recently used
+            entries are evicted when the cached results exceed max_bytes.
+
+            The fingerprint samples a fixed number of rows, so edits to a DataFrame that touch
+            none of the sampled rows are not detected. Call clear after modifying data in place.
+
+        ---
+        Parameters:
+            max_bytes : int, default=268435456
+                Memory cap for cached results, 256MB by default. Results larger than the cap are
+                returned without being cached.
+    """
+
+    def __init__(self, max_bytes=256 * 2 ** 20):
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        self.entries = collections.OrderedDict()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def lookup(self, key, compute):
+        """
+        Documentation:
+
+            ---
+            Description:
+                Return the cached result for key, or compute, cache and return it.
+
+            ---
+            Parameters:
+                key : tuple
+                    Hashable cache key.
+                compute : callable
+                    Function with no arguments that computes the result.
+
+            ---
+            Returns:
+                value : object
+                    Cached or newly computed result.
+        """
+        with self.lock:
+            if key in self.entries:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return self.entries[key][0]
+
+        # compute outside the lock so other threads are not blocked by a slow statistic
+        value = compute()
+        size = stats_nbytes(value)
+
+        with self.lock:
+            self.misses += 1
+            if size <= self.max_bytes and key not in self.entries:
+                self.entries[key] = (value, size)
+                self.nbytes += size
+
+                # evict least recently used entries until the cache fits under its cap
+                while self.nbytes > self.max_bytes:
+                    _, (_, evicted) = self.entries.popitem(last=False)
+                    self.nbytes -= evicted
+        return value
+
+    def clear(self):
+        """
+        Documentation:
+
+            ---
+            Description:
+                Drop every cached statistic and reset the hit and miss counters.
+        """
+        with self.lock:
+            self.entries = collections.OrderedDict()
+            self.nbytes = 0
+            self.hits = 0
+            self.misses = 0
+
+
+def stats_nbytes(value):
+    """
+    Documentation:
+
+        ---
+        Description:
+            Approximate memory held by a cached result. Object arrays are counted by their
+            pointers only.
+    """
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return int(np.sum(value.memory_usage(index=True)))
+    if isinstance(value, pd.Index):
+        return int(value.memory_usage())
+    if isinstance(value, np.ndarray):
+        return int(value.nbytes)
+    if isinstance(value, (tuple, list)):
+        return sum(stats_nbytes(item) for item in value)
+    if hasattr(value, "nbytes"):
+        return int(value.nbytes)
+    return 64
+
+
+def stats_fingerprint(data, sample_size=1000):
+    """
+    Documentation:
+
+        ---
+        Description:
+            Cheap identity and content fingerprint of a DataFrame, Series or array. Combines the
+            object's identity (for arrays, the address of their data, so fresh views of the same
+            memory such as df[column].values match), its shape, columns and dtypes, and a hash of
+            at most sample_size evenly spaced rows.
+
+        ---
+        Parameters:
+            data : Pandas DataFrame, Pandas Series or array
+                Data to fingerprint.
+            sample_size : int, default=1000
+                Number of rows hashed.
+
+        ---
+        Returns:
+            fingerprint : tuple
+                Hashable fingerprint.
+    """
+    if isinstance(data, pd.DataFrame):
+        identity = id(data)
+        layout = (tuple(data.columns), tuple(str(dtype) for dtype in data.dtypes))
+    elif isinstance(data, pd.Series) and not isinstance(data.values, np.ndarray):
+        identity = id(data)
+        layout = (data.name, str(data.dtype))
+    else:
+        if not isinstance(data, (pd.Series, np.ndarray)):
+            data = np.asarray(data)
+        values = data.values if isinstance(data, pd.Series) else data
+        identity = (values.__array_interface__["data"][0], values.strides)
+        layout = (getattr(data, "name", None), str(values.dtype))
+
+    n = len(data)
+    positions = np.unique(np.linspace(0, n - 1, min(n, sample_size)).astype(np.intp)) if n else []
+
+    if isinstance(data, (pd.DataFrame, pd.Series)):
+        sample = pd.util.hash_pandas_object(data.iloc[positions], index=False).values
+    else:
+        sample = pd.util.hash_array(np.asarray(data[positions]).ravel())
+
+    return identity, np.shape(data), layout, int(sample.sum())
+
+
+class DataStats:
+    """
+    Documentation:
+
+        ---
+        Description:
+            Column statistics of a DataFrame, Series or array, computed through a StatsCache when
+            one is given and directly otherwise. Returned by PrettierPlot.stats.
+
+        ---
+        Parameters:
+            data : Pandas DataFrame, Pandas Series or array
+                Data of interest.
+            cache : StatsCache, default=None
+                Cache consulted for every statistic. None computes every statistic on request.
+    """
+
+    def __init__(self, data, cache=None):
+        self.data = data
+        self.cache = cache
+        self.key = stats_fingerprint(data) if cache is not None else None
+
+    def values(self, column=None):
+        """
+        Documentation:
+
+            ---
+            Description:
+                Values of a column of a DataFrame, or of the data itself when column is None.
+        """
+        if column is not None:
+            return self.data[column].values
+        if isinstance(self.data, (pd.Series, pd.DataFrame)):
+            return self.data.values
+        return np.asarray(self.data)
+
+    def lookup(self, name, column, params, compute):
+        if self.cache is None:
+            return compute()
+        return self.cache.lookup((self.key, name, column, params), compute)
+
+    def encoding(self, column=None):
+        """
+        Documentation:
+
+            ---
+            Description:
+                Integer encoding of a categorical column, from which its levels, order, counts
+                and palette are derived. See encode.CategoryEncoding.
+
+            ---
+            Parameters:
+                column : str, default=None
+                    Column of a DataFrame. None uses the data itself.
+
+            ---
+            Returns:
+                encoding : CategoryEncoding
+                    Encoding of the column.
+        """
+        return self.lookup("encoding", column, None, lambda: encode.CategoryEncoding(self.values(column)))
+
+    def counts(self, column=None):
+        """
+        Documentation:
+
+            ---
+            Description:
+                Sorted unique non-null values and the number of times each occurs. Categorical
+                data is counted from its codes directly, and its categories that occur at least
+                once are returned in category order. Shares its cache entry with encoding.
+
+            ---
+            Parameters:
+                column : str, default=None
+                    Column of a DataFrame. None uses the data itself.
+
+            ---
+            Returns:
+                uniques : array
+                    Sorted unique values.
+                counts : array
+                    Number of occurrences of each unique value.
+        """
+        encoding = self.encoding(column)
+        return encoding.levels, encoding.counts
+
+    def unique(self, column=None):
+        """
+        Documentation:
+
+            ---
+            Description:
+                Sorted unique non-null values. Shares its cache entry with encoding.
+
+            ---
+            Parameters:
+                column : str, default=None
+                    Column of a DataFrame. None uses the data itself.
+
+            ---
+            Returns:
+                uniques : array
+                    Sorted unique values.
+        """
+        return self.counts(column)[0]
+
+    def extent(self, column=None):
+        """
+        Documentation:
+
+            ---
+            Description:
+                Smallest and largest value, ignoring NaN.
+
+            ---
+            Parameters:
+                column : str, default=None
+                    Column of a DataFrame. None uses the data itself.
+
+            ---
+            Returns:
+                extent : tuple of floats
+                    Smallest and largest value.
+        """
+
+        def compute():
+            values = self.values(column)
+            return np.nanmin(values), np.nanmax(values)
+
+        return self.lookup("extent", column, None, compute)
+
+    def quantiles(self, q, column=None):
+        """
+        Documentation:
+
+            ---
+            Description:
+                Quantiles of the values, ignoring NaN.
+
+            ---
+            Parameters:
+                q : float or list of floats
+                    Quantiles to compute, between 0 and 1.
+                column : str, default=None
+                    Column of a DataFrame. None uses the data itself.
+
+            ---
+            Returns:
+                quantiles : array
+                    Quantile values in the order of q.
+        """
+        q = tuple(np.atleast_1d(q).tolist())
+        return self.lookup(
+            "quantiles", column, q, lambda: np.nanquantile(np.asarray(self.values(column), dtype=np.float64), q)
+        )
+
+    def corr(self, columns=None):
+        """
+        Documentation:
+
+            ---
+            Description:
+                Pearson correlation matrix of a DataFrame.
+
+            ---
+            Parameters:
+                columns : list of strings, default=None
+                    Columns to correlate. None uses every column.
+
+            ---
+            Returns:
+                corr_matrix : Pandas DataFrame
+                    Correlation matrix.
+        """
+        columns = None if columns is None else tuple(columns)
+        return self.lookup(
+            "corr",
+            columns,
+            None,
+            lambda: self.data.corr() if columns is None else self.data[list(columns)].corr(),
+        )
+
+    def corrwith(self, other):
+        """
+        Documentation:
+
+            ---
+            Description:
+                Pearson correlation of every column of a DataFrame with a Series, aligned on the
+                index. Cached under the fingerprint of both.
+
+            ---
+            Parameters:
+                other : Pandas Series
+                    Series to correlate each column with.
+
+            ---
+            Returns:
+                corr : Pandas Series
+                    Correlation coefficient of each column.
+        """
+        key = None if self.cache is None else stats_fingerprint(other)
+        return self.lookup("corrwith", None, key, lambda: self.data.corrwith(other))
+
+    def box_summary(self, column, by, whis=1.5, fliers=False):
+        """
+        Documentation:
+
+            ---
+            Description:
+                Per-group quartiles and Tukey whiskers of a numeric column, in the format drawn
+                by Axes.bxp. Rows are grouped with one stable sort of the group codes, and each
+                group's quartiles are then found by partitioning its contiguous slice rather than
+                sorting it. NaN values and missing groups are ignored. Groups are in sorted order,
+                or in category order for categorical data.
+
+            ---
+            Parameters:
+                column : str
+                    Name of numeric column.
+                by : str
+                    Name of categorical column to group by.
+                whis : float, default=1.5
+                    Whiskers extend to the most extreme values within whis times the
+                    interquartile range of the box.
+                fliers : boolean, default=False
+                    Also collect the values beyond the whiskers of each group.
+
+            ---
+            Returns:
+                summary : Pandas DataFrame
+                    One row per group, indexed by group label, with columns 'whislo', 'q1', 'med',
+                    'q3', 'whishi', 'mean' and 'count', and 'fliers' when requested.
+        """
+
+        def compute():
+            values = np.asarray(self.values(column), dtype=np.float64)
+            groups = self.values(by)
+            if isinstance(groups, pd.Categorical):
+                codes, uniques = groups.codes, groups.categories
+            else:
+                codes, uniques = pd.factorize(groups, sort=True)
+
+            keep = (codes >= 0) & ~np.isnan(values)
+            codes, values = codes[keep], values[keep]
+
+            # a stable sort on the small integer codes makes each group a contiguous slice
+            grouped = values[np.argsort(codes, kind="stable")]
+            counts = np.bincount(codes, minlength=len(uniques))
+            bounds = np.concatenate(([0], np.cumsum(counts)))
+
+            rows, labels = [], []
+            for ix in np.flatnonzero(counts):
+                group = grouped[bounds[ix]:bounds[ix + 1]]
+                q1, med, q3 = np.quantile(group, [0.25, 0.5, 0.75])
+                lo, hi = q1 - whis * (q3 - q1), q3 + whis * (q3 - q1)
+
+                row = {
+                    "whislo": group[group >= lo].min(),
+                    "q1": q1,
+                    "med": med,
+                    "q3": q3,
+                    "whishi": group[group <= hi].max(),
+                    "mean": group.mean(),
+                    "count": len(group),
+                }
+                if fliers:
+                    row["fliers"] = group[(group < lo) | (group > hi)]
+                rows.append(row)
+                labels.append(uniques[ix])
+
+            return pd.DataFrame(rows, index=pd.Index(labels, name=by))
+
+        return self.lookup("box_summary", (column, by), (whis, fliers), compute)
+
+    def group_mean(self, column, by):
+        """
+        Documentation:
+
+            ---
+            Description:
+                Mean of a numeric column for every combination of one or more categorical
+                columns, in one pass over the data. The combination of each row is numbered from
+                the shared encodings of the group columns, and sums and counts of all
+                combinations are accumulated at once with np.bincount. NaN values and rows missing
+                a group are ignored, and combinations with no rows are left out.
+
+            ---
+            Parameters:
+                column : str
+                    Name of numeric column.
+                by : list
+                    Names of categorical columns to group by.
+
+            ---
+            Returns:
+                summary : Pandas DataFrame
+                    One row per combination, with one categorical column per group column, in the
+                    order of that column's levels, followed by the mean in column and the number of
+                    rows in 'count'.
+        """
+        by = tuple(by)
+
+        def compute():
+            values = np.asarray(self.values(column), dtype=np.float64)
+            encodings = [self.encoding(name) for name in by]
+            shape = tuple(len(encoding) for encoding in encodings)
+
+            keep = ~np.isnan(values)
+            for encoding in encodings:
+                keep &= encoding.codes >= 0
+
+            # number every combination of levels, then sum and count all combinations at once
+            combination = np.ravel_multi_index(tuple(encoding.codes[keep] for encoding in encodings), shape)
+            size = int(np.prod(shape))
+            sums = np.bincount(combination, weights=values[keep], minlength=size)
+            counts = np.bincount(combination, minlength=size)
+
+            present = np.flatnonzero(counts)
+            summary = pd.DataFrame(
+                {
+                    name: pd.Categorical.from_codes(codes, categories=encoding.levels)
+                    for name, encoding, codes in zip(by, encodings, np.unravel_index(present, shape))
+                }
+            )
+            summary[column] = sums[present] / counts[present]
+            summary["count"] = counts[present]
+            return summary
+
+        return self.lookup("group_mean", (column, by), None, compute)
+
+
+def stats_box_summary(summary, by=None):
+    """
+    Documentation:
+
+        ---
+        Description:
+            Validate five-number summaries computed elsewhere, e.g. by a SQL query over a
+            warehouse table, and return them in the format of DataStats.box_summary. Columns
+            named 'min', 'median' and 'max' are accepted in place of 'whislo', 'med' and
+            'whishi', in which case the whiskers span the full range of each group.
+
+        ---
+        Parameters:
+            summary : Pandas DataFrame
+                One row per group with columns 'whislo', 'q1', 'med', 'q3' and 'whishi', plus
+                optionally 'mean' and 'fliers'. Groups are labeled by the index, or by column by.
+            by : str, default=None
+                Name of the column holding group labels. Ignored if summary has no such column.
+
+        ---
+        Returns:
+            summary : Pandas DataFrame
+                One row per group, indexed by group label, in the order given.
+    """
+    summary = summary.rename(columns={"min": "whislo", "median": "med", "max": "whishi"})
+    if by is not None and by in summary.columns:
+        summary = summary.set_index(by)
+
+    missing = [name for name in ("whislo", "q1", "med", "q3", "whishi") if name not in summary.columns]
+    if missing:
+        raise ValueError("summary is missing columns {}".format(missing))
+    return summary
+
+
+def stats_group_mean(summary, by, column):
+    """
+    Documentation:
+
+        ---
+        Description:
+            Validate per-group means computed elsewhere, e.g. by a SQL query over a warehouse
+            table, and return them in the format of DataStats.group_mean. Group columns held in
+            the index, as returned by a pandas groupby, are moved to columns.
+
+        ---
+        Parameters:
+            summary : Pandas DataFrame or Pandas Series
+                One row per combination of groups, with one column per group and the mean in
+                column.
+            by : list
+                Names of the group columns.
+            column : str
+                Name of the column holding the means.
+
+        ---
+        Returns:
+            summary : Pandas DataFrame
+                One row per combination, with a default index.
+    """
+    if isinstance(summary, pd.Series):
+        summary = summary.to_frame(column if summary.name is None else summary.name)
+    if any(name not in summary.columns and name in summary.index.names for name in by):
+        summary = summary.reset_index()
+
+    missing = [name for name in list(by) + [column] if name not in summary.columns]
+    if missing:
+        raise ValueError("summary is missing columns {}".format(missing))
+    if summary.duplicated(subset=list(by)).any():
+        raise ValueError("summary has more than one row for a combination of {}".format(list(by)))
+    return summary.reset_index(drop=True)
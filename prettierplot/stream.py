@@ -0,0 +1,406 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+import prettierplot.util as util
+
+
+def stream_values(chunk, column=None):
+    """
+    Documentation:
+
+        ---
+        Description:
+            Convert a single chunk of streamed data to a 1-dimensional float array.
+
+        ---
+        Parameters:
+            chunk : array, Pandas Series, Pandas DataFrame or Arrow RecordBatch / Table
+                Chunk of data. Objects with a to_pandas method, such as the batches yielded by
+                pyarrow.parquet.ParquetFile.iter_batches, are converted to Pandas first.
+            column : str, default=None
+                Column to read from DataFrame chunks. May be omitted for single column chunks.
+
+        ---
+        Returns:
+            values : array
+                1-dimensional float64 array.
+    """
+    if hasattr(chunk, "to_pandas"):
+        chunk = chunk.to_pandas()
+
+    if isinstance(chunk, pd.DataFrame):
+        if column is not None:
+            chunk = chunk[column]
+        elif chunk.shape[1] == 1:
+            chunk = chunk.iloc[:, 0]
+        else:
+            raise ValueError("column must be specified for chunks with more than one column")
+
+    return np.asarray(chunk, dtype=np.float64).ravel()
+
+
+class HistogramAccumulator:
+    """
+    Documentation:
+
+        ---
+        Description:
+            Histogram that is built incrementally from chunks of data, so the full array never
+            needs to be held in memory. Each chunk is binned with a single np.bincount call and
+            added to the running counts. Accumulators with identical bin edges, for example one
+            per file processed in parallel, can be merged. Values below the first edge or above
+            the last edge are not binned but are counted in underflow and overflow, and NaN
+            values are counted in missing.
+
+        ---
+        Parameters:
+            edges : array
+                Monotonically increasing bin edges, including the rightmost edge. As with
+                np.histogram, every bin but the last is half-open and the last bin includes
+                its right edge.
+    """
+
+    def __init__(self, edges):
+        self.edges = np.asarray(edges, dtype=np.float64)
+        if self.edges.ndim != 1 or len(self.edges) < 2 or (np.diff(self.edges) <= 0).any():
+            raise ValueError("edges must be a monotonically increasing array of at least two values")
+
+        # evenly spaced edges are binned arithmetically instead of by binary search
+        widths = np.diff(self.edges)
+        self.uniform = bool(np.allclose(widths, widths[0]))
+
+        self.counts = np.zeros(len(self.edges) - 1, dtype=np.int64)
+        self.underflow = 0
+        self.overflow = 0
+        self.missing = 0
+
+    @property
+    def total(self):
+        """
+        Documentation:
+
+            ---
+            Description:
+                Number of values seen so far, including missing and out of range values.
+        """
+        return int(self.counts.sum()) + self.underflow + self.overflow + self.missing
+
+    def update(self, chunk, column=None):
+        """
+        Documentation:
+
+            ---
+            Description:
+                Add a chunk of data to the histogram.
+
+            ---
+            Parameters:
+                chunk : array, Pandas Series, Pandas DataFrame or Arrow RecordBatch / Table
+                    Chunk of data. See stream_values.
+                column : str, default=None
+                    Column to read from DataFrame chunks.
+
+            ---
+            Returns:
+                self : HistogramAccumulator
+                    The accumulator, so updates can be chained.
+        """
+        values = stream_values(chunk, column=column)
+        bins = len(self.counts)
+        lo, hi = self.edges[0], self.edges[-1]
+
+        if self.uniform:
+            ix = util.util_bin_index(values, bins, (lo, hi))
+        else:
+            # values on the last edge belong to the last bin
+            ix = np.searchsorted(self.edges, values, side="right") - 1
+            ix[values == hi] = bins - 1
+            ix[(ix < 0) | np.isnan(values)] = bins
+
+        self.counts += np.bincount(ix, minlength=bins + 1)[:bins]
+        self.underflow += int(np.count_nonzero(values < lo))
+        self.overflow += int(np.count_nonzero(values > hi))
+        self.missing += int(np.count_nonzero(np.isnan(values)))
+        return self
+
+    def widen(self, lo, hi):
+        """
+        Documentation:
+
+            ---
+            Description:
+                Coarsen evenly spaced bins until they span lo and hi, keeping the number of bins.
+                Each step doubles the bin width and adds neighbouring pairs of bins together,
+                anchored on the edge that does not need to move, so the counts are re-binned
+                without revisiting the data. The one approximation is a value lying exactly on
+                the previous last edge, which stays in the bin left of that edge.
+
+            ---
+            Parameters:
+                lo : float
+                    Smallest value the bins must span.
+                hi : float
+                    Largest value the bins must span.
+
+            ---
+            Returns:
+                self : HistogramAccumulator
+                    The accumulator, so calls can be chained.
+        """
+        if not self.uniform:
+            raise ValueError("only evenly spaced bins can be widened")
+
+        bins = len(self.counts)
+        while lo < self.edges[0] or hi > self.edges[-1]:
+            width = 2 * (self.edges[1] - self.edges[0])
+            counts = np.zeros_like(self.counts)
+
+            # extend upward from the first edge, or downward from the last
+            if hi > self.edges[-1]:
+                pairs = np.append(self.counts, [0] * (bins % 2)).reshape(-1, 2).sum(axis=1)
+                counts[:len(pairs)] = pairs
+                start = self.edges[0]
+            else:
+                pairs = np.append([0] * (bins % 2), self.counts).reshape(-1, 2).sum(axis=1)
+                counts[bins - len(pairs):] = pairs
+                start = self.edges[-1] - bins * width
+
+            self.counts = counts
+            self.edges = start + width * np.arange(bins + 1)
+        return self
+
+    def merge(self, other):
+        """
+        Documentation:
+
+            ---
+            Description:
+                Add the counts of another accumulator to this one.
+
+            ---
+            Parameters:
+                other : HistogramAccumulator
+                    Accumulator built with the same bin edges.
+
+            ---
+            Returns:
+                self : HistogramAccumulator
+                    The accumulator, so merges can be chained.
+        """
+        if not np.array_equal(self.edges, other.edges):
+            raise ValueError("only accumulators with identical bin edges can be merged")
+
+        self.counts += other.counts
+        self.underflow += other.underflow
+        self.overflow += other.overflow
+        self.missing += other.missing
+        return self
+
+
+def stream_extent(chunks, column=None):
+    """
+    Documentation:
+
+        ---
+        Description:
+            Smallest and largest finite value across an iterable of chunks, computed in a single
+            pass without holding more than one chunk in memory.
+
+        ---
+        Parameters:
+            chunks : iterable
+                Iterable of chunks. See stream_values.
+            column : str, default=None
+                Column to read from DataFrame chunks.
+
+        ---
+        Returns:
+            extent : tuple of floats
+                Smallest and largest value, or None if no finite value was seen.
+    """
+    lo, hi = np.inf, -np.inf
+    for chunk in chunks:
+        values = stream_values(chunk, column=column)
+        values = values[np.isfinite(values)]
+        if len(values):
+            lo, hi = min(lo, values.min()), max(hi, values.max())
+
+    return (lo, hi) if lo <= hi else None
+
+
+def stream_edges(extent, bins=10):
+    """
+    Documentation:
+
+        ---
+        Description:
+            Evenly spaced bin edges spanning an extent, widened by 0.5 on each side when the
+            extent is a single value, as np.histogram does.
+
+        ---
+        Parameters:
+            extent : tuple of floats or None
+                Smallest and largest value. None, for data without finite values, gives edges
+                spanning [0, 1].
+            bins : int, default=10
+                Number of bins.
+
+        ---
+        Returns:
+            edges : array
+                bins + 1 bin edges.
+    """
+    lo, hi = extent if extent is not None else (0.0, 1.0)
+    if lo == hi:
+        lo, hi = lo - 0.5, hi + 0.5
+    return np.linspace(lo, hi, bins + 1)
+
+
+def stream_histogram(chunks, bins=10, range=None, column=None, sample_size=1000000):
+    """
+    Documentation:
+
+        ---
+        Description:
+            Build a histogram from a stream of chunks. When neither explicit bin edges nor a
+            range are given, edges are agreed before counting:
+            - if chunks is a callable returning a fresh iterable, a first pass computes the exact
+              extent of the data and a second pass counts it.
+            - otherwise chunks are buffered until sample_size values have been read, edges span
+              the sample, and the buffered chunks are replayed before the rest of the stream is
+              counted. When a later chunk falls outside the edges, they are widened by merging
+              neighbouring bins (see HistogramAccumulator.widen), so every finite value is counted.
+            Values outside explicit bin edges or range are recorded in the accumulator's underflow
+            and overflow counts, as np.histogram leaves them out.
+
+        ---
+        Parameters:
+            chunks : iterable or callable
+                Iterable of chunks, or a function with no arguments that returns one, e.g.
+                lambda: pyarrow.parquet.ParquetFile(path).iter_batches(columns=["age"]). See
+                stream_values for the accepted chunk types.
+            bins : int or array, default=10
+                Number of evenly spaced bins, or bin edges including the rightmost edge.
+            range : tuple of floats, default=None
+                Lower and upper edge of the bins. Skips edge agreement when bins is an int.
+            column : str, default=None
+                Column to read from DataFrame chunks.
+            sample_size : int, default=1000000
+                Number of values read before agreeing on edges when chunks is not callable.
+
+        ---
+        Returns:
+            accumulator : HistogramAccumulator
+                Accumulated counts.
+    """
+    if not np.isscalar(bins):
+        edges = bins
+    elif range is not None:
+        edges = np.linspace(range[0], range[1], bins + 1)
+    elif callable(chunks):
+        edges = stream_edges(stream_extent(chunks(), column=column), bins)
+    else:
+        return stream_histogram_sampled(chunks, bins, column, sample_size)
+
+    if callable(chunks):
+        chunks = chunks()
+
+    accumulator = HistogramAccumulator(edges)
+    for chunk in chunks:
+        accumulator.update(chunk, column=column)
+    return accumulator
+
+
+def stream_histogram_sampled(chunks, bins, column, sample_size):
+    # buffer chunks until the sample is large enough, then replay them ahead of the rest
+    chunks = iter(chunks)
+    buffered, seen = [], 0
+    for chunk in chunks:
+        values = stream_values(chunk, column=column)
+        buffered.append(values)
+        seen += len(values)
+        if seen >= sample_size:
+            break
+
+    accumulator = HistogramAccumulator(stream_edges(stream_extent(buffered), bins))
+    for values in buffered:
+        accumulator.update(values)
+
+    # edges only span the sample, so later chunks may need wider bins
+    for chunk in chunks:
+        values = stream_values(chunk, column=column)
+        extent = stream_extent([values])
+        if extent is not None:
+            accumulator.widen(*extent)
+        accumulator.update(values)
+    return accumulator
+
+
+def stream_histogram_parallel(sources, reader, bins=10, range=None, column=None, n_jobs=None):
+    """
+    Documentation:
+
+        ---
+        Description:
+            Build a histogram from several sources, such as a directory of parquet files, in
+            parallel. Each worker reads one source at a time into its own accumulator, and the
+            accumulators are merged at the end. When neither explicit bin edges nor a range are
+            given, a first parallel pass computes the extent of every source so that all workers
+            agree on the same edges. Workers are threads, since file readers and numpy release
+            the GIL for most of their work.
+
+        ---
+        Parameters:
+            sources : list
+                Sources to read, e.g. file paths.
+            reader : callable
+                Function that takes a source and returns an iterable of chunks, e.g.
+                lambda path: pyarrow.parquet.ParquetFile(path).iter_batches(columns=["age"]). It is
+                called twice per source when edges are agreed with a first pass.
+            bins : int or array, default=10
+                Number of evenly spaced bins, or bin edges including the rightmost edge.
+            range : tuple of floats, default=None
+                Lower and upper edge of the bins. Skips the first pass when bins is an int.
+            column : str, default=None
+                Column to read from DataFrame chunks.
+            n_jobs : int, default=None
+                Number of threads. None uses one thread, -1 uses all cores.
+
+        ---
+        Returns:
+            accumulator : HistogramAccumulator
+                Merged counts of every source.
+    """
+    if n_jobs is None:
+        n_jobs = 1
+    elif n_jobs < 0:
+        n_jobs = max(os.cpu_count() + 1 + n_jobs, 1)
+
+    def source_histogram(source, edges):
+        accumulator = HistogramAccumulator(edges)
+        for chunk in reader(source):
+            accumulator.update(chunk, column=column)
+        return accumulator
+
+    with ThreadPoolExecutor(max_workers=n_jobs) as executor:
+        if not np.isscalar(bins):
+            edges = bins
+        elif range is not None:
+            edges = np.linspace(range[0], range[1], bins + 1)
+        else:
+            extents = [
+                extent
+                for extent in executor.map(lambda source: stream_extent(reader(source), column=column), sources)
+                if extent is not None
+            ]
+            extent = (min(lo for lo, _ in extents), max(hi for _, hi in extents)) if extents else None
+            edges = stream_edges(extent, bins)
+
+        accumulator = HistogramAccumulator(edges)
+        for source_accumulator in executor.map(lambda source: source_histogram(source, edges), sources):
+            accumulator.merge(source_accumulator)
+
+    return accumulator
@@ -1,6 +1,10 @@
-import seaborn as sns
+import functools
+import threading
+
+import matplotlib
 import matplotlib.cm
 import matplotlib.colors
+from matplotlib import cycler
 
 
 def color_gen(name="viridis", num=2):
@@ -78,3 +82,202 @@ rc_grey = {
     "figure.facecolor": "white",
     "font.family": ["DejaVu Sans"]
 }
+
+
+# seaborn darkgrid / notebook base that rc_grey was historically layered on via sns.set
+rc_base = {
+    "axes.linewidth": 1.25,
+    "axes.prop_cycle": cycler(
+        "color",
+        [
+            "#4c72b0",
+            "#dd8452",
+            "#55a868",
+            "#c44e52",
+            "#8172b3",
+            "#937860",
+            "#da8bc3",
+            "#8c8c8c",
+            "#ccb974",
+            "#64b5cd",
+        ],
+    ),
+    "font.sans-serif": ["Arial", "DejaVu Sans", "Liberation Sans", "Bitstream Vera Sans", "sans-serif"],
+    "font.size": 12.0,
+    "grid.linewidth": 1.0,
+    "legend.fontsize": 11.0,
+    "legend.title_fontsize": 12.0,
+    "lines.solid_capstyle": "round",
+    "patch.edgecolor": "w",
+    "patch.force_edgecolor": True,
+    "text.color": ".15",
+    "xtick.minor.size": 4.0,
+    "xtick.minor.width": 1.0,
+    "ytick.minor.size": 4.0,
+    "ytick.minor.width": 1.0,
+}
+
+
+def rc_pair_plot(chart_scale):
+    """
+    Documentation:
+
+        ---
+        Description:
+            rc parameters layered on top of rc_grey for pair_plot.
+    """
+    return {
+        "axes.titlesize": 3.5 * chart_scale,
+        "axes.labelsize": 1.5 * chart_scale,  # axis title font size
+        "xtick.labelsize": 1.2 * chart_scale,
+        "xtick.major.size": 0.5 * chart_scale,
+        "xtick.major.width": 0.05 * chart_scale,
+        "xtick.color": style_grey,
+        "ytick.labelsize": 1.2 * chart_scale,
+        "ytick.major.size": 0.5 * chart_scale,
+        "ytick.major.width": 0.05 * chart_scale,
+        "ytick.color": style_grey,
+        "figure.facecolor": style_white,
+        "axes.facecolor": style_white,
+        "axes.spines.left": False,
+        "axes.spines.bottom": False,
+        "axes.edgecolor": style_grey,
+        "axes.grid": False,
+    }
+
+
+def rc_pair_plot_custom(chart_scale):
+    """
+    Documentation:
+
+        ---
+        Description:
+            rc parameters layered on top of rc_grey for pair_plot_custom.
+    """
+    return {
+        "axes.titlesize": 3.5 * chart_scale,
+        "axes.labelsize": 0.9 * chart_scale,  # axis title font size
+        "xtick.labelsize": 0.8 * chart_scale,
+        "xtick.major.size": 0.5 * chart_scale,
+        "xtick.major.width": 0.05 * chart_scale,
+        "xtick.color": style_grey,
+        "ytick.labelsize": 0.8 * chart_scale,
+        "ytick.major.size": 0.5 * chart_scale,
+        "ytick.major.width": 0.05 * chart_scale,
+        "ytick.color": style_grey,
+        "figure.facecolor": style_white,
+        "axes.facecolor": style_white,
+        "axes.spines.left": False,
+        "axes.spines.bottom": False,
+        "axes.spines.top": False,
+        "axes.spines.right": False,
+        "axes.edgecolor": style_grey,
+        "axes.grid": False,
+    }
+
+
+# themes available to rc_compile. values are rc dicts or functions of chart_scale
+themes = {
+    "grey": rc_grey,
+    "pair_plot": rc_pair_plot,
+    "pair_plot_custom": rc_pair_plot_custom,
+}
+
+
+@functools.lru_cache(maxsize=None)
+def rc_compile(theme="grey", chart_scale=15):
+    """
+    Documentation:
+
+        ---
+        Description:
+            Merge rc_base, rc_grey and the requested theme into a single validated set of rc
+            parameters. Results are cached, so each theme and chart_scale combination is only
+            built once per process.
+
+        Parameters:
+            theme : str, default="grey"
+                Name of a theme in style.themes.
+            chart_scale : float or int, default=15
+                Chart proportionality control passed to themes that scale with chart size.
+
+        ---
+        Returns:
+            rc : matplotlib.RcParams
+                Validated rc parameters. Treat as read-only.
+    """
+    rc = dict(rc_base)
+    rc.update(rc_grey)
+
+    theme_rc = themes[theme]
+    rc.update(theme_rc(chart_scale) if callable(theme_rc) else theme_rc)
+    return matplotlib.RcParams(rc)
+
+
+class RcScope:
+    """
+    Documentation:
+
+        ---
+        Description:
+            Context manager factory that applies compiled rc parameters for the duration of a
+            block and restores the caller's rcParams afterwards. matplotlib reads rcParams from
+            a single process-wide dict while artists are created and drawn, so a scope holds a
+            re-entrant lock from entry to exit. Themed renders from several threads are therefore
+            serialized: a scope entered on one thread waits until every scope open on another
+            thread has exited, and a chart never picks up another thread's theme or chart_scale.
+            Scopes nest freely on the same thread.
+
+            matplotlib code that runs outside any scope, on any thread, is not blocked and sees
+            the theme of whichever scope is open at the time.
+    """
+
+    def __init__(self):
+        self.lock = threading.RLock()
+        self.stack = []
+        self.saved = None
+
+    def __call__(self, rc):
+        return RcScopeContext(self, rc)
+
+    def enter(self, rc):
+        # held until the matching exit
+        self.lock.acquire()
+        try:
+            if not self.stack:
+                self.saved = matplotlib.rcParams.copy()
+            if not self.stack or self.stack[-1] is not rc:
+                matplotlib.rcParams.update(rc)
+            self.stack.append(rc)
+        except BaseException:
+            self.lock.release()
+            raise
+
+    def exit(self, rc):
+        try:
+            # only the thread holding the lock has open scopes, so they exit in order
+            self.stack.pop()
+            if not self.stack:
+                dict.update(matplotlib.rcParams, self.saved)
+                self.saved = None
+            elif self.stack[-1] is not rc:
+                matplotlib.rcParams.update(self.stack[-1])
+        finally:
+            self.lock.release()
+
+
+class RcScopeContext:
+    def __init__(self, scope, rc):
+        self.scope = scope
+        self.rc = rc
+
+    def __enter__(self):
+        self.scope.enter(self.rc)
+        return self.rc
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.scope.exit(self.rc)
+
+
+# process-wide scope used by PrettierPlot.style_context
+rc_scope = RcScope()
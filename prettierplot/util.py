@@ -1,8 +1,17 @@
+import functools
+import textwrap
+
 import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
+import matplotlib
 import matplotlib.ticker as tkr
 from matplotlib import cm
+from matplotlib import colors as matplotlib_colors
+from matplotlib.collections import PolyCollection
+from matplotlib.font_manager import FontProperties
+from matplotlib.textpath import text_to_path
+
+import prettierplot.profiling as profiling
 
 
 def util_plot_buffer(ax, x, y):
@@ -27,15 +36,56 @@ def util_plot_buffer(ax, x, y):
     ax.set_ylim(y_lim[0] - y_margin, y_lim[1] + y_margin)
 
 
+# tick label format strings keyed by units code. repeat the character for more decimal places
+units_fmt = {
+    char * (decimals + 1): template.format(decimals)
+    for char, template in (("d", "${{x:,.{}f}}"), ("p", "{{x:,.{}f}}%"), ("f", "{{x:,.{}f}}"))
+    for decimals in range(5)
+}
+
+
+@functools.lru_cache(maxsize=None)
+def util_tick_formatter(units):
+    """
+    Documentation:
+
+        ---
+        Description:
+            Return the cached tick formatter for a units code. StrMethodFormatter holds no state
+            besides an axis reference it never reads, so one instance per units code is shared by
+            every axis.
+
+        ---
+        Parameters:
+            units : str
+                Units code such as 'f', 'ff', 'p' or 'ddd'. None and 's' (string) return None,
+                which leaves the axis' existing formatter in place.
+
+        ---
+        Returns:
+            formatter : matplotlib.ticker.StrMethodFormatter or None
+    """
+    if units is None or units == "s":
+        return None
+    try:
+        return tkr.StrMethodFormatter(units_fmt[units])
+    except KeyError:
+        raise ValueError(
+            "unknown units code '{}'. use 's' or repeat one of 'd', 'p', 'f' up to 5 times".format(units)
+        )
+
+
 def util_label_formatter(ax, x_units=None, y_units=None, x_size=None, y_size=None, x_rotate=None,
-                            y_rotate=None):
+                            y_rotate=None, color=None):
     """
     Documentation:
 
         ---
         Description:
             Formats tick labels as dollars, percentages, or decimals. Applies varying levels
-            of precision to labels
+            of precision to labels. Formatting is declarative - a cached formatter is installed on
+            each axis and label size, color and rotation are set through tick_params - so labels
+            stay correct when limits later change and no tick label Text objects are rewritten.
 
         ---
         Parameters:
@@ -51,111 +101,232 @@ def util_label_formatter(ax, x_units=None, y_units=None, x_size=None, y_size=Non
                 'p' displays percentages, '$' displays dollars.
             y_size : int or float, default=None
                 y-axis label size.
+            x_rotate : int or float, default=None
+                Number of degrees to rotate the x-tick labels.
+            y_rotate : int or float, default=None
+                Number of degrees to rotate the y-tick labels.
+            color : str (some sort of color code), default=None
+                Tick label color applied to both axes.
+    """
+    with profiling.phase("ticks"):
+        ## x-axis
+        # apply tick label formatting to x-tick labels
+        formatter = util_tick_formatter(x_units)
+        if formatter is not None:
+            ax.xaxis.set_major_formatter(formatter)
+
+        # apply x-tick rotation, size and color
+        x_params = {}
+        if x_rotate is not None:
+            x_params["labelrotation"] = x_rotate
+        if x_size is not None:
+            x_params["labelsize"] = x_size
+        if color is not None:
+            x_params["labelcolor"] = color
+        if x_params:
+            ax.tick_params(axis="x", **x_params)
+
+        ## y_axis
+        # apply tick label formatting to y-tick labels
+        formatter = util_tick_formatter(y_units)
+        if formatter is not None:
+            ax.yaxis.set_major_formatter(formatter)
+
+        # apply y-tick rotation, size and color
+        y_params = {}
+        if y_rotate is not None:
+            y_params["labelrotation"] = y_rotate
+        if y_size is not None:
+            y_params["labelsize"] = y_size
+        if color is not None:
+            y_params["labelcolor"] = color
+        if y_params:
+            ax.tick_params(axis="y", **y_params)
+
+
+@functools.lru_cache(maxsize=65536)
+def util_wrap_label(label, width=12):
+    """
+    Documentation:
+
+        ---
+        Description:
+            Replace underscores with spaces and wrap a tick label onto lines of at most width
+            characters. Results are cached by label and width, so the labels of a DataFrame's
+            columns are wrapped once no matter how many charts show them.
+
+        ---
+        Parameters:
+            label : str
+                Label text.
+            width : int, default=12
+                Maximum number of characters per line.
+
+        ---
+        Returns:
+            label : str
+                Wrapped label, with lines separated by newlines.
+    """
+    return "\n".join(textwrap.wrap(label.replace("_", " "), width))
+
+
+def util_text_extent(text, fontsize):
+    """
+    Documentation:
+
+        ---
+        Description:
+            Width and height, in points, of text drawn at a font size in the current default
+            font. Lines are measured with the font's own metrics rather than by rendering, and
+            results are cached by text, font size and font family, so each distinct label is
+            measured once.
+
+        ---
+        Parameters:
+            text : str
+                Text to measure. Lines are separated by newlines.
+            fontsize : float
+                Font size in points.
+
+        ---
+        Returns:
+            width : float
+                Width of the widest line, in points.
+            height : float
+                Height of all lines, at matplotlib's default line spacing of 1.2, in points.
+    """
+    return util_text_extent_cached(text, float(fontsize), tuple(matplotlib.rcParams["font.family"]))
+
+
+@functools.lru_cache(maxsize=65536)
+def util_text_extent_cached(text, fontsize, family):
+    prop = FontProperties(family=list(family), size=fontsize)
+    lines = text.split("\n")
+    width = max(text_to_path.get_text_width_height_descent(line, prop, ismath=False)[0] for line in lines)
+    return width, 1.2 * fontsize * len(lines)
+
+
+def util_fit_labels(labels, spacing, fontsize, wrap=12, along="width", min_fontsize=None):
+    """
+    Documentation:
+
+        ---
+        Description:
+            Wrap tick labels and find the largest font size, up to fontsize, at which every
+            label fits in the space between neighbouring ticks, using measured label extents.
+            When labels would need a font smaller than min_fontsize, the font size is held at
+            min_fontsize and only every step-th label is shown.
+
+        ---
+        Parameters:
+            labels : list
+                Tick labels.
+            spacing : float
+                Distance between neighbouring ticks, in points.
+            fontsize : float
+                Largest font size, in points.
+            wrap : int, default=12
+                Maximum number of characters per line. None leaves labels unwrapped.
+            along : str, default="width"
+                Label extent that must fit in spacing. 'width' for horizontal labels along the
+                x-axis. 'height' for labels stacked along the y-axis, or x-axis labels rotated
+                by 90 degrees.
+            min_fontsize : float, default=None
+                Smallest font size before labels are thinned. None uses half of fontsize.
+
+        ---
+        Returns:
+            labels : list
+                Wrapped labels.
+            fontsize : float
+                Font size at which the shown labels fit.
+            step : int
+                Show every step-th label.
     """
-    ## x-axis
-    # format as dollars
-    if x_units == "d":
-        fmt = "${x:,.0f}"
-    elif x_units == "dd":
-        fmt = "${x:,.1f}"
-    elif x_units == "ddd":
-        fmt = "${x:,.2f}"
-    elif x_units == "dddd":
-        fmt = "${x:,.3f}"
-    elif x_units == "ddddd":
-        fmt = "${x:,.4f}"
-
-    # format as percent
-    elif x_units == "p":
-        fmt = "{x:,.0f}%"
-    elif x_units == "pp":
-        fmt = "{x:,.1f}%"
-    elif x_units == "ppp":
-        fmt = "{x:,.2f}%"
-    elif x_units == "pppp":
-        fmt = "{x:,.3f}%"
-    elif x_units == "ppppp":
-        fmt = "{x:,.4f}%"
-
-    # format as float
-    elif x_units == "f":
-        fmt = "{x:,.0f}"
-    elif x_units == "ff":
-        fmt = "{x:,.1f}"
-    elif x_units == "fff":
-        fmt = "{x:,.2f}"
-    elif x_units == "ffff":
-        fmt = "{x:,.3f}"
-    elif x_units == "fffff":
-        fmt = "{x:,.4f}"
-
-    # apply tick label formatting to x-tick labels
-    if x_units is not None and x_units != "s":
-        tick = tkr.StrMethodFormatter(fmt)
-        ax.xaxis.set_major_formatter(tick)
-
-    # apply x-tick rotation
-    if x_rotate is not None:
-        ax.tick_params(labelrotation=x_rotate, axis="x")
-
-    # resize x-tick label
-    if x_size is not None:
-        for tk in ax.get_xticklabels():
-            tk.set_fontsize(x_size)
-
-    ## y_axis
-    # format as dollars
-    if y_units == "d":
-        fmt = "${x:,.0f}"
-    elif y_units == "dd":
-        fmt = "${x:,.1f}"
-    elif y_units == "ddd":
-        fmt = "${x:,.2f}"
-    elif y_units == "dddd":
-        fmt = "${x:,.3f}"
-    elif y_units == "ddddd":
-        fmt = "${x:,.4f}"
-
-    # format as percent
-    elif y_units == "p":
-        fmt = "{x:,.0f}%"
-    elif y_units == "pp":
-        fmt = "{x:,.1f}%"
-    elif y_units == "ppp":
-        fmt = "{x:,.2f}%"
-    elif y_units == "pppp":
-        fmt = "{x:,.3f}%"
-    elif y_units == "ppppp":
-        fmt = "{x:,.4f}%"
-
-    # format as float
-    elif y_units == "f":
-        fmt = "{x:,.0f}"
-    elif y_units == "ff":
-        fmt = "{x:,.1f}"
-    elif y_units == "fff":
-        fmt = "{x:,.2f}"
-    elif y_units == "ffff":
-        fmt = "{x:,.3f}"
-    elif y_units == "ffff":
-        fmt = "{x:,.4f}"
-
-    # apply tick label formatting to y-tick labels
-    if y_units is not None and y_units != "s":
-        tick = tkr.StrMethodFormatter(fmt)
-        ax.yaxis.set_major_formatter(tick)
-
-    # apply y-tick rotation
-    if y_rotate is not None:
-        ax.tick_params(labelrotation=y_rotate, axis="y")
-
-    # resize y-tick label
-    if y_size is not None:
-        for tk in ax.get_yticklabels():
-            tk.set_fontsize(y_size)
-
-
-def util_set_axes(x, y, x_thresh=0.75, y_thresh=0.75):
+    labels = [util_wrap_label(str(label), wrap) if wrap else str(label) for label in labels]
+    min_fontsize = 0.5 * fontsize if min_fontsize is None else min_fontsize
+    if not labels or spacing <= 0:
+        return labels, fontsize, 1
+
+    # label extents grow in proportion to font size, so labels are measured once
+    extents = np.array([util_text_extent(label, fontsize) for label in labels])
+    needed = extents[:, 0 if along == "width" else 1].max()
+    if needed <= 0:
+        return labels, fontsize, 1
+
+    # 10% of the spacing is left as a gap between labels
+    scale = 0.9 * spacing / needed
+    if fontsize * scale >= min_fontsize:
+        return labels, min(fontsize, fontsize * scale), 1
+    return labels, min_fontsize, int(np.ceil(min_fontsize / (fontsize * scale)))
+
+
+def util_fit_tick_labels(ax, axis, positions, labels, fontsize, wrap=12, rotation=0, **kwargs):
+    """
+    Documentation:
+
+        ---
+        Description:
+            Place wrapped tick labels on an axis at the largest font size, up to fontsize, at
+            which they fit between their ticks, thinning them when they cannot fit at a legible
+            size. See util_fit_labels. Assumes the ticks are evenly spread across the axis, as
+            the bars of a bar chart or the cells of a heatmap are.
+
+        ---
+        Parameters:
+            ax : axes object
+                Axis object for the visualization.
+            axis : str
+                'x' or 'y'.
+            positions : array
+                Tick positions, one per label.
+            labels : list
+                Tick labels.
+            fontsize : float
+                Largest font size, in points.
+            wrap : int, default=12
+                Maximum number of characters per line. None leaves labels unwrapped.
+            rotation : float or int, default=0
+                Tick label rotation in degrees.
+            **kwargs
+                Passed on to set_xticklabels or set_yticklabels.
+
+        ---
+        Returns:
+            fontsize : float
+                Font size of the tick labels.
+    """
+    width, height = util_axes_extent(ax)
+    length = width if axis == "x" else height
+
+    # horizontal labels along the x-axis, and rotated labels along the y-axis, must fit by width
+    horizontal = abs(rotation) % 180 < 45 or abs(rotation) % 180 > 135
+    along = "width" if horizontal == (axis == "x") else "height"
+    labels, fontsize, step = util_fit_labels(labels, length / max(len(labels), 1), fontsize, wrap=wrap, along=along)
+
+    if axis == "x":
+        ax.set_xticks(np.asarray(positions)[::step])
+        ax.set_xticklabels(labels[::step], rotation=rotation, fontsize=fontsize, **kwargs)
+    else:
+        ax.set_yticks(np.asarray(positions)[::step])
+        ax.set_yticklabels(labels[::step], rotation=rotation, fontsize=fontsize, **kwargs)
+    return fontsize
+
+
+def util_axes_extent(ax):
+    """
+    Documentation:
+
+        ---
+        Description:
+            Width and height of an axis object, in points.
+    """
+    bbox = ax.get_window_extent()
+    points = 72 / ax.figure.dpi
+    return bbox.width * points, bbox.height * points
+
+
+def util_set_axes(x, y, x_thresh=0.75, y_thresh=0.75, x_extent=None, y_extent=None):
     """
     Documentation:
 
@@ -173,30 +344,450 @@ def util_set_axes(x, y, x_thresh=0.75, y_thresh=0.75):
                 Controls x-axis adjustment amount
             y_thresh : float
                 Controls y-axis adjustment amount
+            x_extent : tuple of floats, default=None
+                Precomputed minimum and maximum of x, e.g. from PrettierPlot.stats. x is not
+                scanned when given.
+            y_extent : tuple of floats, default=None
+                Precomputed minimum and maximum of y.
 
     """
-    x_min = round(np.nanmin(x), 5)
-    x_max = round(np.nanmax(x), 5)
+    x_min, x_max = x_extent if x_extent is not None else (np.nanmin(x), np.nanmax(x))
+    y_min, y_max = y_extent if y_extent is not None else (np.nanmin(y), np.nanmax(y))
+
+    x_min = round(x_min, 5)
+    x_max = round(x_max, 5)
     x_change = (x_max - x_min) / x_max
     x_min = 0 if 1.00 >= x_change >= x_thresh else np.round(x_min, 1)
     x_max = x_max + x_max * 0.01
 
-    y_min = round(np.nanmin(y), 5)
-    y_max = round(np.nanmax(y), 5)
+    y_min = round(y_min, 5)
+    y_max = round(y_max, 5)
     y_change = (y_max - y_min) / y_max
     y_min = 0 if 1.00 >= y_change >= y_thresh else np.round(y_min, 1)
     y_max = y_max + y_max * 0.01
     return x_min, x_max, y_min, y_max
 
 
-def number_coerce(df, columns=None):
+def util_bin_2d(x, y, bins, x_range, y_range):
+    """
+    Documentation:
+
+        ---
+        Description:
+            Count points on a regular 2-dimensional grid. Bin indices are computed arithmetically
+            and counted with a single np.bincount call, which is considerably faster than
+            np.histogram2d on millions of points. Points outside the ranges and NaN values are
+            dropped.
+
+        ---
+        Parameters:
+            x : array
+                1-dimensional array of x values.
+            y : array
+                1-dimensional array of y values.
+            bins : tuple of ints
+                Number of bins along the x-axis and the y-axis.
+            x_range : tuple of floats
+                Lower and upper edge of the x-axis grid.
+            y_range : tuple of floats
+                Lower and upper edge of the y-axis grid.
+
+        ---
+        Returns:
+            counts : array
+                Array of shape (y bins, x bins) with the number of points in each cell. Rows run
+                from the lowest to the highest y bin, ready for imshow with origin='lower'.
+    """
+    x_bins, y_bins = bins
+    x = np.asarray(x, dtype=np.float64).ravel()
+    y = np.asarray(y, dtype=np.float64).ravel()
+
+    # scale values to fractional bin positions. NaN fails both range checks and is dropped
+    x_pos = (x - x_range[0]) * (x_bins / ((x_range[1] - x_range[0]) or 1.0))
+    y_pos = (y - y_range[0]) * (y_bins / ((y_range[1] - y_range[0]) or 1.0))
+    keep = (x_pos >= 0) & (x_pos <= x_bins) & (y_pos >= 0) & (y_pos <= y_bins)
+
+    # points on the upper edge belong to the last bin
+    x_ix = np.minimum(x_pos[keep].astype(np.intp), x_bins - 1)
+    y_ix = np.minimum(y_pos[keep].astype(np.intp), y_bins - 1)
+
+    counts = np.bincount(y_ix * x_bins + x_ix, minlength=x_bins * y_bins)
+    return counts.reshape(y_bins, x_bins)
+
+
+def util_bin_index(x, bins, x_range):
+    """
+    Documentation:
+
+        ---
+        Description:
+            Map values to the index of their bin on a regular 1-dimensional grid, so the same
+            column can be binned once and combined with other columns or class codes in any
+            number of np.bincount calls. Values outside the range and NaN values are given the
+            index bins, one past the last bin.
+
+        ---
+        Parameters:
+            x : array
+                1-dimensional array of values.
+            bins : int
+                Number of bins.
+            x_range : tuple of floats
+                Lower and upper edge of the grid.
+
+        ---
+        Returns:
+            ix : array
+                Array of int32 bin indices, with bins marking values that fall in no bin.
+    """
+    x = np.asarray(x, dtype=np.float64).ravel()
+    pos = (x - x_range[0]) * (bins / ((x_range[1] - x_range[0]) or 1.0))
+
+    # NaN fails the range check, and points on the upper edge belong to the last bin
+    keep = (pos >= 0) & (pos <= bins)
+    ix = np.full(len(x), bins, dtype=np.int32)
+    ix[keep] = np.minimum(pos[keep], bins - 1)
+    return ix
+
+
+def util_ols_band(x, y, fit, grid, ci=95, band="confidence"):
+    """
+    Documentation:
+
+        ---
+        Description:
+            Closed-form band around an ordinary least squares line, from the residual standard
+            error and the t distribution with n - 2 degrees of freedom. Costs a single pass over
+            the data.
+
+        ---
+        Parameters:
+            x : array
+                Independent variable the line was fitted on.
+            y : array
+                Dependent variable the line was fitted on.
+            fit : LinregressResult
+                Result of scipy.stats.linregress(x, y).
+            grid : array
+                x values at which to evaluate the band.
+            ci : float, default=95
+                Confidence level in percent.
+            band : str, default="confidence"
+                'confidence' for the interval of the mean response, 'prediction' for the interval
+                of a new observation.
+
+        ---
+        Returns:
+            lower : array
+                Lower edge of the band at each grid value.
+            upper : array
+                Upper edge of the band at each grid value.
+    """
+    from scipy.stats import t
+
+    n = len(x)
+    x_mean = x.mean()
+    residuals = y - (fit.intercept + fit.slope * x)
+    s2 = np.dot(residuals, residuals) / (n - 2)
+    sxx = np.dot(x - x_mean, x - x_mean)
+
+    # variance of the fitted mean, plus the residual variance for a new observation
+    variance = s2 * (1.0 / n + (grid - x_mean) ** 2 / sxx)
+    if band == "prediction":
+        variance = variance + s2
+
+    half_width = t.ppf(0.5 + ci / 200.0, n - 2) * np.sqrt(variance)
+    y_hat = fit.intercept + fit.slope * grid
+    return y_hat - half_width, y_hat + half_width
+
+
+def util_ols_bootstrap(x, y, grid, ci=95, n_boot=1000, n_jobs=None, seed=0):
+    """
+    Documentation:
+
+        ---
+        Description:
+            Bootstrap band around an ordinary least squares line. Rows are resampled with
+            replacement n_boot times, the line is refitted on each resample, and the band is the
+            central ci percent of the refitted lines at each grid value. Resamples are split
+            across a pool of threads and each one draws from its own seeded generator, so the band
+            does not depend on n_jobs.
+
+        ---
+        Parameters:
+            x : array
+                Independent variable.
+            y : array
+                Dependent variable.
+            grid : array
+                x values at which to evaluate the band.
+            ci : float, default=95
+                Confidence level in percent.
+            n_boot : int, default=1000
+                Number of resamples.
+            n_jobs : int, default=None
+                Number of threads. None uses one thread, -1 uses all cores.
+            seed : int, default=0
+                Seed for the resamples.
+
+        ---
+        Returns:
+            lower : array
+                Lower edge of the band at each grid value.
+            upper : array
+                Upper edge of the band at each grid value.
+    """
+    import os
+    from concurrent.futures import ThreadPoolExecutor
+
+    n = len(x)
+    seeds = np.random.RandomState(seed).randint(0, 2 ** 31 - 1, size=n_boot)
+
+    def refit(boot_seed):
+        rows = np.random.RandomState(boot_seed).randint(0, n, size=n)
+        x_boot = x[rows]
+        y_boot = y[rows]
+        x_mean = x_boot.mean()
+        x_centered = x_boot - x_mean
+        slope = np.dot(x_centered, y_boot - y_boot.mean()) / np.dot(x_centered, x_centered)
+        return y_boot.mean() + slope * (grid - x_mean)
+
+    if n_jobs is None or n_jobs == 1:
+        lines = [refit(boot_seed) for boot_seed in seeds]
+    else:
+        if n_jobs < 0:
+            n_jobs = max(os.cpu_count() + 1 + n_jobs, 1)
+        with ThreadPoolExecutor(max_workers=n_jobs) as executor:
+            lines = list(executor.map(refit, seeds))
+
+    lower, upper = np.percentile(np.vstack(lines), [50 - ci / 2.0, 50 + ci / 2.0], axis=0)
+    return lower, upper
+
+
+def util_sample_rows(n, max_rows, strata=None, random_state=None):
+    """
+    Documentation:
+
+        ---
+        Description:
+            Reproducibly choose at most max_rows of n row positions. With strata, every group keeps
+            its share of the rows (rounded, with at least one row per group), so small groups are
+            not lost from the sample.
+
+        ---
+        Parameters:
+            n : int
+                Number of rows.
+            max_rows : int or None
+                Maximum number of rows to keep. None keeps every row.
+            strata : array, default=None
+                Group label of each row.
+            random_state : np.random.RandomState, default=None
+                Source of randomness. Defaults to a generator seeded with 0.
+
+        ---
+        Returns:
+            rows : array or slice
+                Sorted row positions, or slice(None) when every row is kept.
+    """
+    if max_rows is None or n <= max_rows:
+        return slice(None)
+
+    if random_state is None:
+        random_state = np.random.RandomState(0)
+
+    if strata is None:
+        return np.sort(random_state.choice(n, size=max_rows, replace=False))
+
+    # group row positions by stratum in one pass, then sample within each group
+    codes, uniques = pd.factorize(strata)
+    order = np.argsort(codes, kind="stable")
+    bounds = np.searchsorted(codes[order], np.arange(-1, len(uniques) + 1))
+
+    rows = []
+    for start, stop in zip(bounds[:-1], bounds[1:]):
+        size = stop - start
+        if size == 0:
+            continue
+        take = min(max(int(round(size * max_rows / n)), 1), size)
+        rows.append(order[start:stop][random_state.choice(size, size=take, replace=False)])
+    return np.sort(np.concatenate(rows))
+
+
+def util_top_k(labels, counts, top_k=None, other_label="Other"):
+    """
+    Documentation:
+
+        ---
+        Description:
+            Keep the top_k most frequent categories, in descending order of their counts, and
+            collapse the rest into a single trailing category. Ties keep their original order.
+
+        ---
+        Parameters:
+            labels : array
+                Category labels.
+            counts : array
+                Count of each category.
+            top_k : int, default=None
+                Number of categories to keep. None keeps every category in its original order.
+            other_label : str, default="Other"
+                Label of the category that collects the remaining counts.
+
+        ---
+        Returns:
+            labels : array
+                Kept category labels, followed by other_label when any category was collapsed.
+            counts : array
+                Count of each returned category.
+    """
+    labels = np.asarray(labels)
+    counts = np.asarray(counts)
+    if top_k is None or len(counts) <= top_k:
+        return labels, counts
+
+    # stable sort, so ties at the cut are broken by original order
+    top = np.argsort(-counts, kind="stable")[:top_k]
+
+    labels = np.append(labels[top].astype(object), other_label)
+    counts = np.append(counts[top], counts.sum() - counts[top].sum())
+    return labels, counts
+
+
+def util_box_plot(ax, summary, colors, vert=True, alpha=0.8, show_fliers=False, linewidth=1.0):
+    """
+    Documentation:
+
+        ---
+        Description:
+            Draw one box per row of a five-number summary with Axes.bxp, at positions 0, 1, 2...
+            in the style of seaborn's box plots.
+
+        ---
+        Parameters:
+            ax : axes object
+                Axis object for the visualization.
+            summary : Pandas DataFrame
+                Summary returned by DataStats.box_summary or stats.stats_box_summary.
+            colors : list
+                Face color of each box.
+            vert : boolean, default=True
+                Draw vertical boxes. False draws horizontal boxes.
+            alpha : float, default=0.8
+                Transparency of the box faces.
+            show_fliers : boolean, default=False
+                Draw the values in the summary's 'fliers' column, if it has one.
+            linewidth : float, default=1.0
+                Width of box, whisker and median lines.
+
+        ---
+        Returns:
+            positions : array
+                Position of each box along the categorical axis.
+    """
+    show_fliers = show_fliers and "fliers" in summary.columns
+    fields = ["whislo", "q1", "med", "q3", "whishi"] + (["fliers"] if show_fliers else [])
+    bxp_stats = summary[fields].to_dict("records")
+    positions = np.arange(len(bxp_stats))
+
+    line = {"color": "#262626", "linewidth": linewidth}
+    artists = ax.bxp(
+        bxp_stats,
+        positions=positions,
+        widths=0.8,
+        vert=vert,
+        patch_artist=True,
+        showfliers=show_fliers,
+        boxprops={"edgecolor": line["color"], "linewidth": linewidth},
+        whiskerprops=line,
+        capprops=line,
+        medianprops=line,
+        flierprops={"marker": "o", "markerfacecolor": "none", "markeredgecolor": "#262626"},
+        manage_ticks=False,
+    )
+    for box, color in zip(artists["boxes"], colors):
+        box.set_facecolor(matplotlib_colors.to_rgba(color, alpha))
+
+    # categorical axis spans the boxes with half a slot of padding, like seaborn
+    if vert:
+        ax.set_xlim(-0.5, len(positions) - 0.5)
+    else:
+        ax.set_ylim(len(positions) - 0.5, -0.5)
+    return positions
+
+
+def util_grouped_bars(ax, values, colors, alpha=0.8):
+    """
+    Documentation:
+
+        ---
+        Description:
+            Draw grouped bars, one group per row of values and one bar per column, as a single
+            PolyCollection. Groups are at positions 0, 1, 2... and the bars of a group share 0.8
+            of the space between groups, centered on the group's position, like seaborn's bar
+            plots. Bar positions come from one offset matrix, so the cost does not grow with the
+            number of Python calls per bar.
+
+        ---
+        Parameters:
+            ax : axes object
+                Axis object for the visualization.
+            values : array
+                Array of shape (groups, bars) holding the height of each bar. Bars with a NaN
+                height are not drawn.
+            colors : list
+                Face color of each column of bars.
+            alpha : float, default=0.8
+                Transparency of the bars.
+
+        ---
+        Returns:
+            bars : PolyCollection
+                Collection holding every bar.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    n_groups, n_bars = values.shape
+
+    # left edge of every bar, from one offset matrix
+    width = 0.8 / n_bars
+    offsets = (np.arange(n_bars) - n_bars / 2) * width
+    lefts = np.arange(n_groups)[:, None] + offsets[None, :]
+
+    keep = ~np.isnan(values)
+    bar_ix = np.nonzero(keep)[1]
+    x0 = lefts[keep]
+    x1 = x0 + width
+    y1 = values[keep]
+    y0 = np.zeros_like(y1)
+    verts = np.stack(
+        [np.column_stack(corner) for corner in ((x0, y0), (x0, y1), (x1, y1), (x1, y0))], axis=1
+    )
+
+    bars = PolyCollection(
+        verts,
+        facecolors=matplotlib_colors.to_rgba_array(colors[:n_bars])[bar_ix],
+        edgecolors="none",
+        linewidths=0,
+        alpha=alpha,
+    )
+    bars.sticky_edges.y.append(0)
+    ax.add_collection(bars, autolim=True)
+    ax.autoscale_view()
+    return bars
+
+
+def number_coerce(df, columns=None, sample_size=1000, n_jobs=None):
     """
     Documentation:
 
         ---
         Description:
             Convert categorical columns that include only numeric data to
-            float or int data type.
+            float or int data type. Each column is parsed in a single vectorized call.
+            A sample of each column is parsed first, so columns that clearly are not
+            numeric are skipped without parsing every value. Categorical
+            columns are converted by parsing their categories only. The input DataFrame
+            is not modified.
 
         ---
         Parameters:
@@ -204,22 +795,74 @@ def number_coerce(df, columns=None):
                 Pandas DataFrame containing columns to convert
             columns : list of strings
                 List of column names to convert.
+            sample_size : int, default=1000
+                Number of non-null values parsed from each column before committing to
+                parsing the full column.
+            n_jobs : int, default=None
+                Number of threads used to convert columns. None uses one thread, -1 uses
+                all cores.
         Returns:
-            Pandas DataFrame with converted columns.
+            Pandas DataFrame with converted columns. Columns that are not converted share
+            their data with df.
     """
+    import os
+    from concurrent.futures import ThreadPoolExecutor
+
     # if no subset of columns is provided, use all columns in df
     if columns is None:
         columns = df.columns
 
-    # iterate through all columns
-    for col in columns:
-
-        # exclude columns that contain only nulls
-        if not df[col].isnull().all():
-            try:
-                df[col] = df[col].apply(pd.to_numeric)
-            except ValueError:
-                pass
-        else:
-            pass
-    return df
+    def convert(col):
+        series = df[col]
+
+        # numeric and datetime-like columns are left as they are
+        is_category = isinstance(series.dtype, pd.CategoricalDtype)
+        if not (is_category or pd.api.types.is_object_dtype(series) or pd.api.types.is_string_dtype(series)):
+            return None
+
+        values = series.cat.categories if is_category else series.values
+        if len(values) == 0:
+            return None
+
+        try:
+            # skip columns whose sample already fails to parse
+            sample = pd.to_numeric(values[:sample_size])
+
+            # exclude columns that contain only nulls
+            if not is_category and np.isnan(sample.astype(np.float64)).all() and series.isnull().all():
+                return None
+
+            if is_category:
+                # parse each category once and map the codes onto the parsed values
+                parsed = pd.to_numeric(values).values
+                codes = series.cat.codes.values
+                converted = np.where(codes < 0, np.nan, parsed[codes])
+            elif sample.dtype == np.float64:
+                # numpy's float cast parses strings exactly and several times faster than
+                # pd.to_numeric. integer and boolean columns keep pd.to_numeric's dtypes
+                converted = values.astype(np.float64)
+            else:
+                converted = pd.to_numeric(series).values
+        except (ValueError, TypeError):
+            return None
+        return pd.Series(converted, index=series.index, name=series.name)
+
+    if n_jobs is None or n_jobs == 1:
+        converted = [convert(col) for col in columns]
+    else:
+        if n_jobs < 0:
+            n_jobs = max(os.cpu_count() + 1 + n_jobs, 1)
+        with ThreadPoolExecutor(max_workers=n_jobs) as executor:
+            converted = list(executor.map(convert, columns))
+
+    converted = {col: series for col, series in zip(columns, converted) if series is not None}
+    if not converted:
+        return df.copy(deep=False)
+
+    # assemble a new frame in one step. replacing columns one at a time splits the frame's
+    # object block on every assignment, which is quadratic in the number of columns
+    out = pd.concat(
+        [converted.get(col, df[col]) for col in df.columns], axis=1, copy=False
+    )
+    out.columns = df.columns
+    return out
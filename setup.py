@@ -49,7 +49,7 @@ def setup_package():
             "Programming Language :: Python :: 3",
             "Operating System :: OS Independent",
         ],
-        python_requires=">=3.6.1",
+        python_requires=">=3.7",
         install_requires=[i.strip() for i in open("requirements.txt").readlines()],
     )
 
@@ -0,0 +1,62 @@
+import os
+
+import numpy as np
+
+from prettierplot.batch import render_many
+
+
+class ExitOnUnpickle:
+    # unpickling this object inside a worker kills the worker process outright
+    def __reduce__(self):
+        return os._exit, (1,)
+
+
+def bar_v_spec(i, **kwargs):
+    spec = {
+        "method": "bar_v",
+        "kwargs": {
+            "x": np.array(["category_{}".format(j) for j in range(5)]),
+            "counts": np.arange(1, 6),
+        },
+        "chart_scale": 5,
+        "canvas": {"title": "chart {}".format(i)},
+    }
+    spec.update(kwargs)
+    return spec
+
+
+def test_render_many_serial():
+    results = render_many([bar_v_spec(i) for i in range(3)])
+    assert [result.index for result in results] == [0, 1, 2]
+    assert all(result.error is None and result.data.startswith(b"\x89PNG") for result in results)
+
+
+def test_render_many_reports_errors_per_spec():
+    specs = [bar_v_spec(i) for i in range(4)]
+    specs[1] = bar_v_spec(1, method="not_a_method")
+    results = render_many(specs, n_jobs=2)
+
+    assert [result.index for result in results] == [0, 1, 2, 3]
+    assert [result.error is None for result in results] == [True, False, True, True]
+    assert "not_a_method" in results[1].error
+
+
+def test_render_many_worker_crash_fails_only_its_chunk():
+    specs = [bar_v_spec(i) for i in range(16)]
+    specs[5] = bar_v_spec(5, kwargs={"x": ExitOnUnpickle()})
+    results = render_many(specs, n_jobs=4)
+
+    assert [result.index for result in results] == list(range(16))
+    failed = [result.index for result in results if result.error is not None]
+    assert failed == [5]
+    assert "BrokenProcessPool" in results[5].error
+    assert all(result.data.startswith(b"\x89PNG") for result in results if result.error is None)
+
+
+def test_render_many_worker_crash_fails_only_its_chunk_of_several():
+    specs = [bar_v_spec(i) for i in range(16)]
+    specs[9] = bar_v_spec(9, kwargs={"x": ExitOnUnpickle()})
+    results = render_many(specs, n_jobs=4, chunksize=4)
+
+    failed = [result.index for result in results if result.error is not None]
+    assert failed == [8, 9, 10, 11]
@@ -0,0 +1,20 @@
+import numpy as np
+import pytest
+from matplotlib.colors import to_rgba
+
+from prettierplot.plotter import PrettierPlot
+
+
+@pytest.mark.parametrize("colors", [["red", "blue"], ["red"], "red", ["red", "blue"] * 10])
+def test_tree_map_cycles_colors(colors):
+    counts = np.array([50, 30, 10, 5, 3, 2])
+    labels = ["category_{}".format(i) for i in range(len(counts))]
+
+    with PrettierPlot(chart_scale=5, interactive=False) as p:
+        p.make_canvas()
+        p.tree_map(counts=counts, labels=labels, colors=colors, alpha=1.0, min_share=0)
+        facecolors = p.ax.collections[0].get_facecolors()
+
+    cycle = [colors] if isinstance(colors, str) else colors
+    expected = [to_rgba(cycle[i % len(cycle)]) for i in range(len(counts))]
+    assert [tuple(color) for color in facecolors] == expected
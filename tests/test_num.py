@@ -0,0 +1,31 @@
+import numpy as np
+import pandas as pd
+
+from prettierplot.plotter import PrettierPlot
+
+
+def test_reg_plot_same_column_for_x_and_y():
+    df = pd.DataFrame({"a": [1.0, 2.0, np.nan, 4.0, 5.0], "b": ["x", "y", "x", "y", "x"]})
+
+    with PrettierPlot(chart_scale=5, interactive=False) as p:
+        p.make_canvas()
+        p.reg_plot(x="a", y="a", data=df, stratify="b", ci=None)
+        line = p.ax.lines[0]
+
+    np.testing.assert_allclose(line.get_xdata(), line.get_ydata())
+
+
+def test_pair_plot_binned_array_target():
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(rng.normal(size=(500, 3)), columns=["a", "b", "c"])
+    target = rng.integers(0, 2, size=500)
+
+    with PrettierPlot(chart_scale=5, interactive=False) as p:
+        p.pair_plot(df=df, target=target, large_data=True, bins=10)
+        array_axes = len(p.fig.axes)
+
+    with PrettierPlot(chart_scale=5, interactive=False) as p:
+        p.pair_plot(df=df, target=pd.Series(target, name="t"), large_data=True, bins=10)
+        series_axes = len(p.fig.axes)
+
+    assert array_axes == series_axes
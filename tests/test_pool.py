@@ -0,0 +1,80 @@
+import numpy as np
+import pytest
+from matplotlib.figure import Figure
+
+from prettierplot.plotter import PrettierPlot
+from prettierplot.pool import FigurePool
+
+
+def figure_state(fig):
+    engine = fig.get_layout_engine()
+    subplotpars = fig.subplotpars
+    return {
+        "size": tuple(fig.get_size_inches()),
+        "dpi": fig.dpi,
+        "facecolor": fig.get_facecolor(),
+        "edgecolor": fig.get_edgecolor(),
+        "layout": None if engine is None else type(engine).__name__,
+        "subplotpars": tuple(
+            getattr(subplotpars, name) for name in ("left", "right", "bottom", "top", "wspace", "hspace")
+        ),
+    }
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {},
+        {"figsize": (5, 4), "facecolor": "white"},
+        {"figsize": (6, 3), "constrained_layout": True},
+        {"constrained_layout": False},
+        {"tight_layout": True},
+        {"figsize": (3, 3), "tight_layout": {"pad": 0.5}},
+        {"layout": "constrained"},
+    ],
+)
+def test_acquire_resets_reused_figure(kwargs):
+    pool = FigurePool()
+    fig = pool.acquire(**kwargs)
+    fresh = figure_state(Figure(**kwargs))
+
+    # state changed by charts the way tight_layout, subplots_adjust and resizing do
+    fig.add_subplot().plot([0, 1], [0, 1])
+    fig.tight_layout()
+    fig.subplots_adjust(left=0.3, top=0.7)
+    fig.set_size_inches(3, 3)
+    fig.set_facecolor("red")
+    fig.set_dpi(50)
+    pool.release(fig)
+
+    reused = pool.acquire(**kwargs)
+    assert reused is fig
+    assert not reused.axes
+    assert figure_state(reused) == fresh
+
+
+def test_acquire_reuses_figure_with_dict_kwargs():
+    pool = FigurePool()
+    fig = pool.acquire(figsize=(3, 3), tight_layout={"pad": 0.5})
+    pool.release(fig)
+
+    reused = pool.acquire(figsize=[3, 3], tight_layout={"pad": 0.5})
+    assert reused is fig
+    assert reused.get_layout_engine().get()["pad"] == 0.5
+    assert pool.acquire(figsize=(3, 3), tight_layout={"pad": 1.0}) is not fig
+
+
+def test_pooled_plotter_matches_fresh_figure():
+    pool = FigurePool()
+    x = np.array(["a", "b", "c"])
+
+    with PrettierPlot(chart_scale=5, figure_pool=pool) as p:
+        p.make_canvas()
+        p.bar_v(x=x, counts=np.array([3, 1, 2]))
+        p.fig.tight_layout()
+        p.fig.set_facecolor("red")
+        first = p.fig
+
+    with PrettierPlot(chart_scale=5, interactive=False) as fresh, PrettierPlot(chart_scale=5, figure_pool=pool) as p:
+        assert p.fig is first
+        assert figure_state(p.fig) == figure_state(fresh.fig)
@@ -0,0 +1,43 @@
+import tracemalloc
+
+import numpy as np
+
+import prettierplot.profiling as profiling
+from prettierplot.plotter import PrettierPlot
+
+
+def render(p):
+    p.make_canvas(title="profiled")
+    p.bar_v(x=np.array(["a", "b", "c"]), counts=np.array([3, 1, 2]))
+
+
+def test_tracing_stops_after_profiled_calls():
+    assert not tracemalloc.is_tracing()
+    with PrettierPlot(chart_scale=5, interactive=False, profile=True) as p:
+        render(p)
+        assert not tracemalloc.is_tracing()
+
+    report = p.profile.report()
+    assert set(report["method"]) == {"make_canvas", "bar_v"}
+    assert (report["alloc_peak"] >= 0).all()
+
+
+def test_tracing_started_elsewhere_is_left_running():
+    tracemalloc.start()
+    try:
+        with PrettierPlot(chart_scale=5, interactive=False, profile=True) as p:
+            render(p)
+        assert tracemalloc.is_tracing()
+    finally:
+        tracemalloc.stop()
+
+
+def test_peaks_without_reset_peak(monkeypatch):
+    # Python before 3.9 has no tracemalloc.reset_peak
+    monkeypatch.setattr(profiling, "peak_resettable", False)
+    with PrettierPlot(chart_scale=5, interactive=False, profile=True) as p:
+        render(p)
+
+    report = p.profile.report()
+    assert len(report) > 0
+    assert (report["alloc_peak"] >= 0).all()
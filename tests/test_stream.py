@@ -0,0 +1,44 @@
+import warnings
+
+import numpy as np
+import pytest
+
+from prettierplot.plotter import PrettierPlot
+from prettierplot.stream import HistogramAccumulator, stream_histogram
+
+
+def growing_chunks(n_chunks=20, rows=5000):
+    # each chunk reaches further than the last, so the sample only spans the first
+    rng = np.random.default_rng(0)
+    for i in range(n_chunks):
+        yield rng.uniform(-i, 10 * (i + 1), rows)
+
+
+def test_sampled_edges_widen_for_growing_stream():
+    accumulator = stream_histogram(growing_chunks(), bins=10, sample_size=5000)
+    values = np.concatenate(list(growing_chunks()))
+
+    assert accumulator.underflow == 0 and accumulator.overflow == 0
+    assert accumulator.counts.sum() == len(values)
+    assert accumulator.edges[0] <= values.min() and accumulator.edges[-1] >= values.max()
+    np.testing.assert_array_equal(accumulator.counts, np.histogram(values, bins=accumulator.edges)[0])
+
+
+def test_hist_draws_every_streamed_value():
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        with PrettierPlot(chart_scale=5, interactive=False) as p:
+            p.make_canvas()
+            p.hist(x=growing_chunks(), color="red", label="x", sample_size=5000)
+            heights = [patch.get_height() for patch in p.ax.patches]
+
+    assert sum(heights) == 20 * 5000
+
+
+def test_hist_warns_about_values_outside_range():
+    accumulator = HistogramAccumulator(np.linspace(0, 1, 11)).update(np.array([-1.0, 0.5, 2.0, 3.0]))
+
+    with PrettierPlot(chart_scale=5, interactive=False) as p:
+        p.make_canvas()
+        with pytest.warns(UserWarning, match="3 values"):
+            p.hist(x=accumulator, color="red", label="x")
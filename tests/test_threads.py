@@ -0,0 +1,98 @@
+import io
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import matplotlib
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+from matplotlib.colors import to_rgba
+
+import prettierplot.style as style
+from prettierplot.plotter import PrettierPlot
+
+# (method, theme, chart_scale) rendered side by side. the themes and scales are chosen so that a
+# chart styled by any of the others has different font sizes or tick sizes
+charts = [
+    ("bar_v", "grey", 8),
+    ("bar_v", "pair_plot", 40),
+    ("pair_plot_custom", "grey", 10),
+    ("pair_plot_custom", "grey", 20),
+]
+
+
+def render(method, theme, chart_scale, seed):
+    # render one chart and return the sizes and colors matplotlib resolved while drawing it
+    rng = np.random.RandomState(seed)
+    with PrettierPlot(chart_scale=chart_scale, theme=theme, interactive=False) as p:
+        if method == "bar_v":
+            p.make_canvas(title="chart {}".format(seed))
+            p.bar_v(x=np.array(["category_{}".format(i) for i in range(8)]), counts=rng.randint(1, 100, size=8))
+        else:
+            p.pair_plot_custom(df=pd.DataFrame(rng.randn(200, 4), columns=["a", "b", "c", "d"]))
+        p.savefig(io.BytesIO(), format="png")
+
+        axes = [ax for ax in p.figures[-1].axes if ax.axison]
+        ticks = [tick for ax in axes for tick in ax.xaxis.get_major_ticks() + ax.yaxis.get_major_ticks()]
+        return {
+            "label_sizes": {ax.xaxis.label.get_size() for ax in axes if ax.get_xlabel()},
+            "tick_sizes": {tick.tick1line.get_markersize() for tick in ticks},
+            "tick_colors": {to_rgba(tick.tick1line.get_color()) for tick in ticks},
+            "n_patches": sum(len(ax.patches) for ax in axes),
+        }
+
+
+def expected(method, theme, chart_scale):
+    rc = style.rc_compile("pair_plot_custom" if method == "pair_plot_custom" else theme, chart_scale)
+    return {
+        "label_sizes": {rc["axes.labelsize"]} if method == "pair_plot_custom" else set(),
+        "tick_sizes": {rc["xtick.major.size"]},
+        "tick_colors": {to_rgba(rc["xtick.color"])},
+        "n_patches": 8 if method == "bar_v" else 0,
+    }
+
+
+def test_render_serial_matches_theme():
+    for method, theme, chart_scale in charts:
+        assert render(method, theme, chart_scale, 0) == expected(method, theme, chart_scale)
+
+
+def test_render_concurrent_themes_and_scales():
+    jobs = [charts[seed % len(charts)] + (seed,) for seed in range(24)]
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(lambda job: render(*job), jobs))
+
+    for (method, theme, chart_scale, seed), result in zip(jobs, results):
+        assert result == expected(method, theme, chart_scale), (method, theme, chart_scale, seed)
+
+
+def test_style_scope_restores_rc_params():
+    before = dict(matplotlib.rcParams)
+    barrier = threading.Barrier(3)
+
+    def run(seed):
+        barrier.wait()
+        return render(*charts[seed % len(charts)], seed)
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        list(executor.map(run, range(3)))
+    assert dict(matplotlib.rcParams) == before
+
+
+def test_facet_grid_figures_are_detached_from_pyplot():
+    df = pd.DataFrame(
+        {
+            "x": np.random.RandomState(0).randn(200),
+            "row": np.repeat(["a", "b"], 100),
+            "col": np.tile(["c", "d"], 100),
+        }
+    )
+    before = plt.get_fignums()
+    with PrettierPlot(chart_scale=5, interactive=False) as p:
+        p.facet_cat_num_hist(df=df, cat_row="row", cat_col="col", num_col="x", split=None)
+        p.pair_plot(df=df[["x"]].assign(y=df["x"] ** 2), large_data=False)
+        assert plt.get_fignums() == before
+
+        buffer = io.BytesIO()
+        p.savefig(buffer, format="png")
+        assert buffer.getvalue().startswith(b"\x89PNG")